@@ -1,11 +1,12 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from app.core.auth import CurrentUser, get_current_user
 from app.core.db import get_session
 from app.core.ledger import get_user_ledger
+from app.core.users import get_user_by_email, get_user_by_username
 from app.core.security import create_access_token, get_password_hash, verify_password
 from app.models.user import User
 from app.schemas.auth import Token, UserLogin, UserRegister, UserResponse
@@ -19,16 +20,14 @@ def register(
     user_data: UserRegister,
     session: Annotated[Session, Depends(get_session)]
 ) -> User:
-    statement = select(User).where(User.username == user_data.username)
-    existing_user = session.exec(statement).first()
+    existing_user = get_user_by_username(session, user_data.username)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
     
-    statement = select(User).where(User.email == user_data.email)
-    existing_email = session.exec(statement).first()
+    existing_email = get_user_by_email(session, user_data.email)
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -59,8 +58,7 @@ def login(
     credentials: UserLogin,
     session: Annotated[Session, Depends(get_session)]
 ) -> dict[str, str]:
-    statement = select(User).where(User.username == credentials.username)
-    user = session.exec(statement).first()
+    user = get_user_by_username(session, credentials.username)
     
     if not user:
         raise HTTPException(
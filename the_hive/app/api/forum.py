@@ -16,11 +16,11 @@ from sqlmodel import Session, func, or_, select
 
 from app.core.auth import CurrentUser
 from app.core.db import get_session
+from app.core.users import get_user_by_id, get_username, prefetch_users
 from app.models.forum import ForumComment, ForumTopic, ForumTopicTag, TopicType
 from app.models.need import Need
 from app.models.offer import Offer
 from app.models.tag import Tag
-from app.models.user import User
 from app.schemas.forum import (
     ForumCommentCreate,
     ForumCommentListResponse,
@@ -83,24 +83,22 @@ def get_linked_item_info(session: Session, topic: ForumTopic) -> Optional[Linked
     if topic.linked_offer_id:
         offer = session.get(Offer, topic.linked_offer_id)
         if offer:
-            creator = session.get(User, offer.creator_id)
             return LinkedItemInfo(
                 id=offer.id,
                 type="offer",
                 title=offer.title,
                 creator_id=offer.creator_id,
-                creator_username=creator.username if creator else None
+                creator_username=get_username(session, offer.creator_id)
             )
     elif topic.linked_need_id:
         need = session.get(Need, topic.linked_need_id)
         if need:
-            creator = session.get(User, need.creator_id)
             return LinkedItemInfo(
                 id=need.id,
                 type="need",
                 title=need.title,
                 creator_id=need.creator_id,
-                creator_username=creator.username if creator else None
+                creator_username=get_username(session, need.creator_id)
             )
     return None
 
@@ -108,7 +106,7 @@ def get_linked_item_info(session: Session, topic: ForumTopic) -> Optional[Linked
 def build_topic_response(session: Session, topic: ForumTopic) -> ForumTopicResponse:
     """Build a ForumTopicResponse with tags and linked items."""
     tags = get_topic_tags(session, topic.id)
-    creator = session.get(User, topic.creator_id)
+    creator = get_user_by_id(session, topic.creator_id)
     linked_item = get_linked_item_info(session, topic)
     
     return ForumTopicResponse(
@@ -140,7 +138,7 @@ def build_topic_response(session: Session, topic: ForumTopic) -> ForumTopicRespo
 
 def build_comment_response(session: Session, comment: ForumComment) -> ForumCommentResponse:
     """Build a ForumCommentResponse with author info."""
-    author = session.get(User, comment.author_id)
+    author = get_user_by_id(session, comment.author_id)
     
     return ForumCommentResponse(
         id=comment.id,
@@ -278,6 +276,7 @@ def list_topics(
     topics = session.exec(query).all()
     
     # Build responses
+    prefetch_users(session, (topic.creator_id for topic in topics))
     items = [build_topic_response(session, topic) for topic in topics]
     
     return ForumTopicListResponse(
@@ -484,6 +483,7 @@ def list_comments(
     comments = session.exec(query).all()
     
     # Build responses
+    prefetch_users(session, (comment.author_id for comment in comments))
     items = [build_comment_response(session, comment) for comment in comments]
     
     return ForumCommentListResponse(
@@ -613,6 +613,7 @@ def get_topics_linking_to_item(
     topics = session.exec(query).all()
     
     # Build responses
+    prefetch_users(session, (topic.creator_id for topic in topics))
     items = [build_topic_response(session, topic) for topic in topics]
     
     return ForumTopicListResponse(
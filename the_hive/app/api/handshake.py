@@ -20,11 +20,11 @@ from sqlmodel import Session, select, and_
 
 from app.core.auth import CurrentUser
 from app.core.db import get_session
+from app.core.users import get_user_by_id
 from app.core.ledger import get_user_balance, RECIPROCITY_LIMIT
 from app.models.offer import Offer, OfferStatus
 from app.models.need import Need, NeedStatus
 from app.models.participant import Participant, ParticipantStatus, ParticipantRole
-from app.models.user import User
 from app.schemas.participant import (
     ParticipantCreate,
     ParticipantAccept,
@@ -38,7 +38,7 @@ router = APIRouter(prefix="/handshake", tags=["handshake"])
 
 def _build_participant_response(session: Session, participant: Participant) -> ParticipantResponse:
     """Helper to build ParticipantResponse with user data."""
-    user = session.get(User, participant.user_id)
+    user = get_user_by_id(session, participant.user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -455,7 +455,8 @@ def list_my_proposals(
     # Build response items with user data
     response_items = [_build_participant_response(session, p) for p in proposals]
     
-    return ParticipantListResponse(
+    # Items are already validated, don't check them again
+    return ParticipantListResponse.model_construct(
         items=response_items,
         total=total,
         skip=skip,
@@ -515,7 +516,8 @@ def list_pending_proposals_for_my_items(
     # Build response items with user data
     response_items = [_build_participant_response(session, p) for p in proposals]
     
-    return ParticipantListResponse(
+    # Items are already validated, don't check them again
+    return ParticipantListResponse.model_construct(
         items=response_items,
         total=total,
         skip=skip,
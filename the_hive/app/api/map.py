@@ -15,9 +15,11 @@ import math
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select, or_, func
 
 from app.core.db import get_session
+from app.core.users import get_user_by_id, prefetch_users
 from app.core.semantic_tags import expand_tags_for_search
 from app.models.offer import Offer, OfferStatus
 from app.models.need import Need, NeedStatus
@@ -26,7 +28,13 @@ from app.models.tag import Tag
 from app.models.user import User
 from app.models.participant import Participant, ParticipantStatus
 from app.models.rating import Rating
-from app.schemas.map import MapPinResponse, MapFeedResponse, CreatorResponse, ParticipantResponse
+from app.schemas.map import (
+    CreatorResponse,
+    MapFeedResponse,
+    MapPinResponse,
+    ParticipantResponse,
+    TagResponse,
+)
 
 router = APIRouter(prefix="/map", tags=["Map"])
 
@@ -122,7 +130,9 @@ def get_map_feed(
     Returns:
         MapFeedResponse with approximate coordinates and optional distances
     """
-    # Collect all map pins
+    # Collect all map pins. Pins are built with model_construct(): every
+    # value comes straight from typed DB columns, so validating each pin and
+    # its nested tags/creator/participants again would be pure overhead
     pins = []
     
     # Parse tags and expand semantically if provided
@@ -208,6 +218,9 @@ def get_map_feed(
     else:
         needs = []
     
+    # Resolve all creators up front instead of once per pin
+    prefetch_users(session, [item.creator_id for item in (*offers, *needs)])
+    
     # Process offers
     for offer in offers:
         # Get tags for this offer
@@ -216,10 +229,13 @@ def get_map_feed(
             .join(OfferTag, OfferTag.tag_id == Tag.id)
             .where(OfferTag.offer_id == offer.id)
         )
-        offer_tags = [{"id": tag_id, "name": tag_name} for tag_id, tag_name in session.exec(offer_tags_query).all()]
+        offer_tags = [
+            TagResponse.model_construct(id=tag_id, name=tag_name)
+            for tag_id, tag_name in session.exec(offer_tags_query).all()
+        ]
         
         # Get creator info with rating
-        creator = session.get(User, offer.creator_id)
+        creator = get_user_by_id(session, offer.creator_id)
         creator_info = None
         if creator:
             # Get creator's overall rating
@@ -228,7 +244,7 @@ def get_map_feed(
                 .where(Rating.to_user_id == creator.id)
             ).first()
             
-            creator_info = CreatorResponse(
+            creator_info = CreatorResponse.model_construct(
                 id=creator.id,
                 username=creator.username,
                 full_name=creator.full_name or creator.username,
@@ -240,6 +256,9 @@ def get_map_feed(
         # Get accepted participants
         accepted_participants_query = (
             select(User)
+            .options(
+                load_only(User.id, User.username, User.profile_image_ref, User.profile_image_type)
+            )
             .join(Participant, Participant.user_id == User.id)
             .where(
                 Participant.offer_id == offer.id,
@@ -248,7 +267,7 @@ def get_map_feed(
         )
         accepted_users = session.exec(accepted_participants_query).all()
         participants_info = [
-            ParticipantResponse(
+            ParticipantResponse.model_construct(
                 id=user.id,
                 username=user.username,
                 profile_image=user.profile_image,
@@ -271,7 +290,7 @@ def get_map_feed(
             )
         
         # Create pin with approximate coordinates
-        pin = MapPinResponse(
+        pin = MapPinResponse.model_construct(
             id=offer.id,
             type="offer",
             title=offer.title,
@@ -305,10 +324,13 @@ def get_map_feed(
             .join(NeedTag, NeedTag.tag_id == Tag.id)
             .where(NeedTag.need_id == need.id)
         )
-        need_tags = [{"id": tag_id, "name": tag_name} for tag_id, tag_name in session.exec(need_tags_query).all()]
+        need_tags = [
+            TagResponse.model_construct(id=tag_id, name=tag_name)
+            for tag_id, tag_name in session.exec(need_tags_query).all()
+        ]
         
         # Get creator info with rating
-        creator = session.get(User, need.creator_id)
+        creator = get_user_by_id(session, need.creator_id)
         creator_info = None
         if creator:
             # Get creator's overall rating
@@ -317,7 +339,7 @@ def get_map_feed(
                 .where(Rating.to_user_id == creator.id)
             ).first()
             
-            creator_info = CreatorResponse(
+            creator_info = CreatorResponse.model_construct(
                 id=creator.id,
                 username=creator.username,
                 full_name=creator.full_name or creator.username,
@@ -329,6 +351,9 @@ def get_map_feed(
         # Get accepted participants
         accepted_participants_query = (
             select(User)
+            .options(
+                load_only(User.id, User.username, User.profile_image_ref, User.profile_image_type)
+            )
             .join(Participant, Participant.user_id == User.id)
             .where(
                 Participant.need_id == need.id,
@@ -337,7 +362,7 @@ def get_map_feed(
         )
         accepted_users = session.exec(accepted_participants_query).all()
         participants_info = [
-            ParticipantResponse(
+            ParticipantResponse.model_construct(
                 id=user.id,
                 username=user.username,
                 profile_image=user.profile_image,
@@ -360,7 +385,7 @@ def get_map_feed(
             )
         
         # Create pin with approximate coordinates
-        pin = MapPinResponse(
+        pin = MapPinResponse.model_construct(
             id=need.id,
             type="need",
             title=need.title,
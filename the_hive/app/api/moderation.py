@@ -14,7 +14,7 @@ from sqlmodel import Session
 
 from app.core.auth import ModeratorUser
 from app.core.db import SessionDep
-from app.models.user import User
+from app.core.users import get_user_by_id
 from app.models.offer import Offer, OfferStatus
 from app.models.need import Need, NeedStatus
 from app.models.forum import ForumComment
@@ -125,7 +125,7 @@ def suspend_user(
     
     They can still view content and access their profile.
     """
-    user = session.get(User, user_id)
+    user = get_user_by_id(session, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -167,7 +167,7 @@ def unsuspend_user(
     
     SRS FR-11.5: Moderators can lift suspensions early
     """
-    user = session.get(User, user_id)
+    user = get_user_by_id(session, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -209,7 +209,7 @@ def ban_user(
     
     This is irreversible without admin intervention.
     """
-    user = session.get(User, user_id)
+    user = get_user_by_id(session, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -250,7 +250,7 @@ def unban_user(
     
     SRS FR-11.5: Moderators can unban users after review
     """
-    user = session.get(User, user_id)
+    user = get_user_by_id(session, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -6,22 +6,23 @@ SRS Requirements:
 - FR-12: Archiving and Transparency
 """
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, select, func
 
 from app.core.auth import CurrentUser
 from app.core.db import get_session
+from app.core.users import get_user_by_id, prefetch_users
 from app.core.offers_needs import (
     archive_expired_items,
     associate_tags_to_need,
     check_and_archive_item,
     get_need_tags,
+    get_needs_tags,
     update_need_tags,
 )
 from app.models.need import Need, NeedStatus
-from app.models.user import User
 from app.models.participant import Participant, ParticipantStatus
 from app.models.offer import Offer
 from app.models.rating import Rating
@@ -33,6 +34,7 @@ from app.schemas.need import (
     NeedUpdate,
 )
 from app.schemas.auth import UserPublic
+from app.schemas.time_slot import SLOT_LIST_ADAPTER, load_trusted_slots
 
 router = APIRouter(prefix="/needs", tags=["Needs"])
 
@@ -77,12 +79,18 @@ def _get_creator_stats(session: Session, user_id: int) -> tuple[int, float | Non
     return total_completed, avg_rating
 
 
-def _build_need_response(session: Session, need: Need) -> NeedResponse:
-    """Build a NeedResponse with tags and creator info."""
-    tags = get_need_tags(session, need.id)
+def _build_need_response(
+    session: Session, need: Need, tags: Optional[list[str]] = None
+) -> NeedResponse:
+    """Build a NeedResponse with tags and creator info.
+    
+    List endpoints pass tags preloaded with get_needs_tags().
+    """
+    if tags is None:
+        tags = get_need_tags(session, need.id)
     
     # Fetch creator information
-    creator = session.get(User, need.creator_id)
+    creator = get_user_by_id(session, need.creator_id)
     if not creator:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -104,13 +112,12 @@ def _build_need_response(session: Session, need: Need) -> NeedResponse:
     )
     
     # Parse available slots if present
-    available_slots = None
+    available_slots = []
     if need.available_slots:
-        import json
         try:
-            available_slots = json.loads(need.available_slots)
-        except:
-            available_slots = None
+            available_slots = load_trusted_slots(need.available_slots)
+        except (ValueError, KeyError, TypeError):
+            available_slots = []
     
     return NeedResponse(
         id=need.id,
@@ -181,8 +188,7 @@ def create_need(
     
     # Store available slots as JSON if provided
     if need_data.available_slots:
-        import json
-        new_need.available_slots = json.dumps([slot.model_dump() for slot in need_data.available_slots])
+        new_need.available_slots = SLOT_LIST_ADAPTER.dump_json(need_data.available_slots).decode()
     
     session.add(new_need)
     session.commit()
@@ -229,9 +235,12 @@ def list_needs(
     needs = session.exec(statement).all()
     
     # Build responses with tags
-    items = [_build_need_response(session, need) for need in needs]
+    prefetch_users(session, (need.creator_id for need in needs))
+    tags = get_needs_tags(session, [need.id for need in needs])
+    items = [_build_need_response(session, need, tags[need.id]) for need in needs]
     
-    return NeedListResponse(
+    # Items are already validated, don't check them again
+    return NeedListResponse.model_construct(
         items=items,
         total=total,
         skip=skip,
@@ -270,9 +279,11 @@ def list_my_needs(
     statement = statement.offset(skip).limit(limit)
     needs = session.exec(statement).all()
     
-    items = [_build_need_response(session, need) for need in needs]
+    tags = get_needs_tags(session, [need.id for need in needs])
+    items = [_build_need_response(session, need, tags[need.id]) for need in needs]
     
-    return NeedListResponse(
+    # Items are already validated, don't check them again
+    return NeedListResponse.model_construct(
         items=items,
         total=total,
         skip=skip,
@@ -345,13 +356,8 @@ def update_need(
         if key == "tags":
             update_need_tags(session, need_id, value)
         elif key == "available_slots" and value is not None:
-            import json
-            # value is already a list of dicts from model_dump()
-            if value and isinstance(value[0], dict):
-                need.available_slots = json.dumps(value)
-            else:
-                # If it's AvailableTimeSlot objects, convert them
-                need.available_slots = json.dumps([slot.model_dump() for slot in value])
+            # Serialize the validated slots rather than the model_dump() copy
+            need.available_slots = SLOT_LIST_ADAPTER.dump_json(need_data.available_slots).decode()
         elif key == "capacity":
             # SRS FR-3.7: Cannot decrease capacity below accepted count
             if value < need.accepted_count:
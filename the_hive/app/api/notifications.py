@@ -13,7 +13,7 @@ from app.core.auth import CurrentUser, get_current_user_ws
 from app.core.db import SessionDep
 from app.core.websocket import manager
 from app.models.notification import Notification
-from app.schemas.notification import NotificationResponse, NotificationListResponse
+from app.schemas.notification import NotificationListResponse, NotificationResponse
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -58,8 +58,9 @@ def list_notifications(
     query = query.offset(skip).limit(limit)
     notifications = session.exec(query).all()
     
-    return NotificationListResponse(
-        notifications=[NotificationResponse.model_validate(n.model_dump()) for n in notifications],
+    # Items are validated from the rows; the envelope wraps them without revalidating
+    return NotificationListResponse.model_construct(
+        notifications=[NotificationResponse.model_validate(n) for n in notifications],
         total=total,
         unread_count=unread_count,
     )
@@ -91,7 +92,7 @@ def mark_as_read(
         session.commit()
         session.refresh(notification)
     
-    return NotificationResponse.model_validate(notification.model_dump())
+    return NotificationResponse.model_validate(notification)
 
 
 @router.post("/read-all")
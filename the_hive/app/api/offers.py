@@ -6,22 +6,23 @@ SRS Requirements:
 - FR-12: Archiving and Transparency
 """
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, select, func
 
 from app.core.auth import CurrentUser
 from app.core.db import get_session
+from app.core.users import get_user_by_id, prefetch_users
 from app.core.offers_needs import (
     archive_expired_items,
     associate_tags_to_offer,
     check_and_archive_item,
     get_offer_tags,
+    get_offers_tags,
     update_offer_tags,
 )
 from app.models.offer import Offer, OfferStatus
-from app.models.user import User
 from app.models.participant import Participant, ParticipantStatus
 from app.models.need import Need
 from app.models.rating import Rating
@@ -33,6 +34,7 @@ from app.schemas.offer import (
     OfferUpdate,
 )
 from app.schemas.auth import UserPublic
+from app.schemas.time_slot import SLOT_LIST_ADAPTER, load_trusted_slots
 
 router = APIRouter(prefix="/offers", tags=["Offers"])
 
@@ -77,12 +79,18 @@ def _get_creator_stats(session: Session, user_id: int) -> tuple[int, float | Non
     return total_completed, avg_rating
 
 
-def _build_offer_response(session: Session, offer: Offer) -> OfferResponse:
-    """Build an OfferResponse with tags and creator info."""
-    tags = get_offer_tags(session, offer.id)
+def _build_offer_response(
+    session: Session, offer: Offer, tags: Optional[list[str]] = None
+) -> OfferResponse:
+    """Build an OfferResponse with tags and creator info.
+    
+    List endpoints pass tags preloaded with get_offers_tags().
+    """
+    if tags is None:
+        tags = get_offer_tags(session, offer.id)
     
     # Fetch creator information
-    creator = session.get(User, offer.creator_id)
+    creator = get_user_by_id(session, offer.creator_id)
     if not creator:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -104,13 +112,12 @@ def _build_offer_response(session: Session, offer: Offer) -> OfferResponse:
     )
     
     # Parse available slots if present
-    available_slots = None
+    available_slots = []
     if offer.available_slots:
-        import json
         try:
-            available_slots = json.loads(offer.available_slots)
-        except:
-            available_slots = None
+            available_slots = load_trusted_slots(offer.available_slots)
+        except (ValueError, KeyError, TypeError):
+            available_slots = []
     
     return OfferResponse(
         id=offer.id,
@@ -181,8 +188,7 @@ def create_offer(
     
     # Store available slots as JSON if provided
     if offer_data.available_slots:
-        import json
-        new_offer.available_slots = json.dumps([slot.model_dump() for slot in offer_data.available_slots])
+        new_offer.available_slots = SLOT_LIST_ADAPTER.dump_json(offer_data.available_slots).decode()
     
     session.add(new_offer)
     session.commit()
@@ -229,9 +235,12 @@ def list_offers(
     offers = session.exec(statement).all()
     
     # Build responses with tags
-    items = [_build_offer_response(session, offer) for offer in offers]
+    prefetch_users(session, (offer.creator_id for offer in offers))
+    tags = get_offers_tags(session, [offer.id for offer in offers])
+    items = [_build_offer_response(session, offer, tags[offer.id]) for offer in offers]
     
-    return OfferListResponse(
+    # Items are already validated, don't check them again
+    return OfferListResponse.model_construct(
         items=items,
         total=total,
         skip=skip,
@@ -270,9 +279,11 @@ def list_my_offers(
     statement = statement.offset(skip).limit(limit)
     offers = session.exec(statement).all()
     
-    items = [_build_offer_response(session, offer) for offer in offers]
+    tags = get_offers_tags(session, [offer.id for offer in offers])
+    items = [_build_offer_response(session, offer, tags[offer.id]) for offer in offers]
     
-    return OfferListResponse(
+    # Items are already validated, don't check them again
+    return OfferListResponse.model_construct(
         items=items,
         total=total,
         skip=skip,
@@ -345,13 +356,8 @@ def update_offer(
         if key == "tags":
             update_offer_tags(session, offer_id, value)
         elif key == "available_slots" and value is not None:
-            import json
-            # value is already a list of dicts from model_dump()
-            if value and isinstance(value[0], dict):
-                offer.available_slots = json.dumps(value)
-            else:
-                # If it's AvailableTimeSlot objects, convert them
-                offer.available_slots = json.dumps([slot.model_dump() for slot in value])
+            # Serialize the validated slots rather than the model_dump() copy
+            offer.available_slots = SLOT_LIST_ADAPTER.dump_json(offer_data.available_slots).decode()
         elif key == "capacity":
             # SRS FR-3.7: Cannot decrease capacity below accepted count
             if value < offer.accepted_count:
@@ -15,10 +15,10 @@ from sqlmodel import Session, select
 
 from app.core.auth import CurrentUser
 from app.core.db import get_session
+from app.core.users import get_user_by_id, prefetch_users
 from app.models.offer import Offer
 from app.models.need import Need
 from app.models.participant import Participant, ParticipantStatus
-from app.models.user import User
 from app.schemas.participant import (
     ParticipantResponse,
     ParticipantListResponse,
@@ -31,7 +31,7 @@ router = APIRouter(prefix="/participants", tags=["participants"])
 def _build_participant_response(session: Session, participant: Participant) -> ParticipantResponse:
     """Build a ParticipantResponse with user info."""
     # Fetch user information
-    user = session.get(User, participant.user_id)
+    user = get_user_by_id(session, participant.user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -99,9 +99,11 @@ def list_offer_participants(
     statement = statement.offset(skip).limit(limit)
     participants = session.exec(statement).all()
     
+    prefetch_users(session, (p.user_id for p in participants))
     items = [_build_participant_response(session, p) for p in participants]
     
-    return ParticipantListResponse(
+    # Items are already validated, don't check them again
+    return ParticipantListResponse.model_construct(
         items=items,
         total=total,
         skip=skip,
@@ -144,9 +146,11 @@ def list_need_participants(
     statement = statement.offset(skip).limit(limit)
     participants = session.exec(statement).all()
     
+    prefetch_users(session, (p.user_id for p in participants))
     items = [_build_participant_response(session, p) for p in participants]
     
-    return ParticipantListResponse(
+    # Items are already validated, don't check them again
+    return ParticipantListResponse.model_construct(
         items=items,
         total=total,
         skip=skip,
@@ -190,7 +194,6 @@ def complete_exchange_endpoint(
     """
     from app.core.ledger import complete_exchange, check_reciprocity_limit
     from app.schemas.ledger import ExchangeCompleteResponse
-    from app.models.user import User
     
     # Complete the exchange (creates ledger entries or returns None if waiting)
     result = complete_exchange(
@@ -225,7 +228,7 @@ def complete_exchange_endpoint(
         # Notify the party who hasn't confirmed yet
         if participant.provider_confirmed and not participant.requester_confirmed:
             # Provider confirmed, notify requester
-            provider = session.get(User, provider_id)
+            provider = get_user_by_id(session, provider_id)
             notify_exchange_awaiting_confirmation(
                 session=session,
                 user_id=requester_id,
@@ -236,7 +239,7 @@ def complete_exchange_endpoint(
             )
         elif participant.requester_confirmed and not participant.provider_confirmed:
             # Requester confirmed, notify provider
-            requester = session.get(User, requester_id)
+            requester = get_user_by_id(session, requester_id)
             notify_exchange_awaiting_confirmation(
                 session=session,
                 user_id=provider_id,
@@ -259,8 +262,8 @@ def complete_exchange_endpoint(
     
     # Both confirmed - exchange completed
     # Get updated balances
-    provider = session.get(User, provider_entry.user_id)
-    requester = session.get(User, requester_entry.user_id)
+    provider = get_user_by_id(session, provider_entry.user_id)
+    requester = get_user_by_id(session, requester_entry.user_id)
     
     # Check if there was a warning about reciprocity limit
     _, warning_message = check_reciprocity_limit(
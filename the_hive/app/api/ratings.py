@@ -14,19 +14,20 @@ Endpoints:
 - POST /ratings/check-visibility - Manually trigger visibility check (admin)
 """
 from datetime import datetime
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlmodel import Session, select, func
 
 from app.core.auth import CurrentUser
 from app.core.db import get_session
+from app.core.users import get_user_by_id, get_username
 from app.core.moderation import moderate_content
 from app.models.rating import Rating, RatingVisibility, RATING_VISIBILITY_DEADLINE_DAYS
 from app.models.participant import Participant, ParticipantStatus
 from app.models.offer import Offer
 from app.models.need import Need
-from app.models.user import User
 from app.schemas.rating import (
     RatingCreate,
     RatingResponse,
@@ -35,8 +36,7 @@ from app.schemas.rating import (
     RatingCategoryLabelsResponse,
     UserRatingSummary,
     BlindRatingExplanation,
-    RATING_LABELS,
-    CATEGORY_INFO,
+    construct_rating_response,
 )
 
 router = APIRouter(prefix="/ratings", tags=["ratings"])
@@ -99,49 +99,66 @@ def _check_rating_visibility(session: Session, rating: Rating) -> bool:
     return False
 
 
+def _is_rating_visible(session: Session, rating: Rating) -> bool:
+    """Whether a rating is visible, updating it if it just became so."""
+    return rating.visibility == RatingVisibility.VISIBLE or _check_rating_visibility(session, rating)
+
+
 def _build_rating_response(
     session: Session,
     rating: Rating,
     check_visibility: bool = True
 ) -> RatingResponse:
     """Build a RatingResponse with user info and visibility check."""
-    from_user = session.get(User, rating.from_user_id)
-    to_user = session.get(User, rating.to_user_id)
-    
     is_visible = rating.visibility == RatingVisibility.VISIBLE
     if check_visibility and not is_visible:
         is_visible = _check_rating_visibility(session, rating)
     
     return RatingResponse.from_rating(
         rating,
-        from_username=from_user.username if from_user else None,
-        to_username=to_user.username if to_user else None,
+        from_username=get_username(session, rating.from_user_id),
+        to_username=get_username(session, rating.to_user_id),
         is_visible=is_visible
     )
 
 
+def _build_rating_responses(
+    session: Session,
+    ratings: Sequence[Rating],
+    visibility: Sequence[bool],
+) -> list[RatingResponse]:
+    """Build responses for a list of ratings with known visibility."""
+    from_usernames = [get_username(session, r.from_user_id) for r in ratings]
+    to_usernames = [get_username(session, r.to_user_id) for r in ratings]
+    return list(map(construct_rating_response, ratings, from_usernames, to_usernames, visibility))
+
+
+# Both payloads below are static: serialize them once instead of per request
+_RATING_LABELS_JSON = orjson.dumps(
+    RatingCategoryLabelsResponse().model_dump(mode="json")
+)
+_RATING_EXPLANATION_JSON = orjson.dumps(BlindRatingExplanation().model_dump(mode="json"))
+
+
 @router.get("/labels", response_model=RatingCategoryLabelsResponse)
-def get_rating_labels() -> RatingCategoryLabelsResponse:
+def get_rating_labels() -> Response:
     """
     Get rating labels and category information.
     
     Returns human-friendly labels for rating values and category descriptions
     for building the rating UI.
     """
-    return RatingCategoryLabelsResponse(
-        rating_labels=RATING_LABELS,
-        categories=CATEGORY_INFO
-    )
+    return Response(content=_RATING_LABELS_JSON, media_type="application/json")
 
 
 @router.get("/explanation", response_model=BlindRatingExplanation)
-def get_rating_explanation() -> BlindRatingExplanation:
+def get_rating_explanation() -> Response:
     """
     Get explanation of the blind rating system.
     
     Returns user-friendly explanation for display in UI.
     """
-    return BlindRatingExplanation()
+    return Response(content=_RATING_EXPLANATION_JSON, media_type="application/json")
 
 
 @router.post("/", response_model=RatingResponse, status_code=status.HTTP_201_CREATED)
@@ -252,19 +269,11 @@ def submit_rating(
             comment_approved = False
             moderation_reason = reason
     
-    # Calculate general rating as average of the three category ratings
-    general_rating = Rating.compute_general_rating(
-        rating_data.reliability_rating,
-        rating_data.kindness_rating,
-        rating_data.helpfulness_rating
-    )
-    
-    # Create rating
+    # Create rating (general_rating is generated by the database)
     rating = Rating(
         from_user_id=current_user.id,
         to_user_id=rating_data.recipient_id,
         participant_id=rating_data.participant_id,
-        general_rating=general_rating,
         reliability_rating=rating_data.reliability_rating,
         kindness_rating=rating_data.kindness_rating,
         helpfulness_rating=rating_data.helpfulness_rating,
@@ -415,7 +424,7 @@ def get_user_ratings(
     (both parties rated or deadline passed).
     """
     # Verify user exists
-    user = session.get(User, user_id)
+    user = get_user_by_id(session, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -442,9 +451,12 @@ def get_user_ratings(
     # Apply pagination
     paginated_ratings = visible_ratings[skip:skip + limit]
     
-    items = [_build_rating_response(session, r, check_visibility=False) for r in paginated_ratings]
+    items = _build_rating_responses(
+        session, paginated_ratings, [True] * len(paginated_ratings)
+    )
     
-    return RatingListResponse(
+    # Items are already validated, don't check them again
+    return RatingListResponse.model_construct(
         items=items,
         total=total,
         skip=skip,
@@ -463,54 +475,56 @@ def get_user_rating_summary(
     Returns average scores across all visible ratings for each category.
     """
     # Verify user exists
-    user = session.get(User, user_id)
+    user = get_user_by_id(session, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Get visible ratings
-    statement = select(Rating).where(
+    # Aggregate visible ratings in the database rather than loading every row
+    visible = (
         Rating.to_user_id == user_id,
-        Rating.visibility == RatingVisibility.VISIBLE
+        Rating.visibility == RatingVisibility.VISIBLE,
     )
-    ratings = session.exec(statement).all()
-    
-    if not ratings:
+    total, general_sum, reliability_sum, kindness_sum, helpfulness_sum = session.exec(
+        select(
+            func.count(),
+            func.sum(Rating.general_rating),
+            func.sum(Rating.reliability_rating),
+            func.sum(Rating.kindness_rating),
+            func.sum(Rating.helpfulness_rating),
+        ).where(*visible)
+    ).one()
+    
+    if not total:
         return UserRatingSummary(
             user_id=user_id,
             total_ratings=0
         )
     
-    # Calculate averages
-    general_ratings = [r.general_rating for r in ratings]
-    reliability_ratings = [r.reliability_rating for r in ratings if r.reliability_rating]
-    kindness_ratings = [r.kindness_rating for r in ratings if r.kindness_rating]
-    helpfulness_ratings = [r.helpfulness_rating for r in ratings if r.helpfulness_rating]
-    
-    # Calculate distribution
-    distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for r in general_ratings:
-        # Round to nearest integer for distribution
-        rounded = round(r)
-        if rounded in distribution:
-            distribution[rounded] += 1
-    
-    # Calculate overall average (across all provided ratings)
-    all_ratings_values = general_ratings.copy()
-    all_ratings_values.extend(reliability_ratings)
-    all_ratings_values.extend(kindness_ratings)
-    all_ratings_values.extend(helpfulness_ratings)
+    # Distribution of general ratings (always whole numbers 1-5)
+    distribution = [0, 0, 0, 0, 0]
+    counts = session.exec(
+        select(Rating.general_rating, func.count())
+        .where(*visible)
+        .group_by(Rating.general_rating)
+    ).all()
+    for value, count in counts:
+        if 1 <= value <= 5:
+            distribution[value - 1] = count
+    
+    # All three categories are required, so every rating contributes four values
+    overall_sum = general_sum + reliability_sum + kindness_sum + helpfulness_sum
     
     return UserRatingSummary(
         user_id=user_id,
-        total_ratings=len(ratings),
-        average_general=sum(general_ratings) / len(general_ratings) if general_ratings else None,
-        average_reliability=sum(reliability_ratings) / len(reliability_ratings) if reliability_ratings else None,
-        average_kindness=sum(kindness_ratings) / len(kindness_ratings) if kindness_ratings else None,
-        average_helpfulness=sum(helpfulness_ratings) / len(helpfulness_ratings) if helpfulness_ratings else None,
-        overall_average=sum(all_ratings_values) / len(all_ratings_values) if all_ratings_values else None,
+        total_ratings=total,
+        average_general=general_sum / total,
+        average_reliability=reliability_sum / total,
+        average_kindness=kindness_sum / total,
+        average_helpfulness=helpfulness_sum / total,
+        overall_average=overall_sum / (4 * total),
         rating_distribution=distribution
     )
 
@@ -532,9 +546,12 @@ def get_my_pending_ratings(
     
     ratings = session.exec(statement).all()
     
-    items = [_build_rating_response(session, r, check_visibility=True) for r in ratings]
+    items = _build_rating_responses(
+        session, ratings, [_is_rating_visible(session, r) for r in ratings]
+    )
     
-    return RatingListResponse(
+    # Items are already validated, don't check them again
+    return RatingListResponse.model_construct(
         items=items,
         total=len(items),
         skip=0,
@@ -567,16 +584,19 @@ def get_exchange_ratings(
     
     ratings = session.exec(statement).all()
     
-    items = []
+    # Show own rating always, others only if visible
+    shown = []
+    visibility = []
     for rating in ratings:
-        is_own_rating = rating.from_user_id == current_user.id
-        response = _build_rating_response(session, rating)
-        
-        # Show own rating always, others only if visible
-        if is_own_rating or response.is_visible:
-            items.append(response)
+        is_visible = _is_rating_visible(session, rating)
+        if rating.from_user_id == current_user.id or is_visible:
+            shown.append(rating)
+            visibility.append(is_visible)
+    
+    items = _build_rating_responses(session, shown, visibility)
     
-    return RatingListResponse(
+    # Items are already validated, don't check them again
+    return RatingListResponse.model_construct(
         items=items,
         total=len(items),
         skip=0,
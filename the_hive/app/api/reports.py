@@ -14,8 +14,8 @@ from sqlmodel import Session, select, func
 
 from app.core.auth import CurrentUser, ModeratorUser
 from app.core.db import SessionDep
+from app.core.users import get_user_by_id
 from app.models.report import Report, ReportStatus, ReportReason, ReportAction
-from app.models.user import User
 from app.models.offer import Offer
 from app.models.need import Need
 from app.models.forum import ForumComment, ForumTopic
@@ -38,7 +38,7 @@ def _build_report_response(session: Session, report: Report) -> ReportResponse:
     """Build a full report response with related data."""
     
     # Get reporter info
-    reporter = session.get(User, report.reporter_id)
+    reporter = get_user_by_id(session, report.reporter_id)
     if not reporter:
         raise HTTPException(status_code=404, detail="Reporter not found")
     
@@ -52,7 +52,7 @@ def _build_report_response(session: Session, report: Report) -> ReportResponse:
     reported_item = None
     
     if report.reported_user_id:
-        user = session.get(User, report.reported_user_id)
+        user = get_user_by_id(session, report.reported_user_id)
         if user:
             reported_item = ReportedItemDetails(
                 type="user",
@@ -65,7 +65,7 @@ def _build_report_response(session: Session, report: Report) -> ReportResponse:
     elif report.reported_offer_id:
         offer = session.get(Offer, report.reported_offer_id)
         if offer:
-            creator = session.get(User, offer.creator_id)
+            creator = get_user_by_id(session, offer.creator_id)
             reported_item = ReportedItemDetails(
                 type="offer",
                 id=offer.id,
@@ -77,7 +77,7 @@ def _build_report_response(session: Session, report: Report) -> ReportResponse:
     elif report.reported_need_id:
         need = session.get(Need, report.reported_need_id)
         if need:
-            creator = session.get(User, need.creator_id)
+            creator = get_user_by_id(session, need.creator_id)
             reported_item = ReportedItemDetails(
                 type="need",
                 id=need.id,
@@ -89,7 +89,7 @@ def _build_report_response(session: Session, report: Report) -> ReportResponse:
     elif report.reported_comment_id:
         comment = session.get(ForumComment, report.reported_comment_id)
         if comment:
-            creator = session.get(User, comment.author_id)
+            creator = get_user_by_id(session, comment.author_id)
             reported_item = ReportedItemDetails(
                 type="comment",
                 id=comment.id,
@@ -101,7 +101,7 @@ def _build_report_response(session: Session, report: Report) -> ReportResponse:
     elif report.reported_forum_topic_id:
         topic = session.get(ForumTopic, report.reported_forum_topic_id)
         if topic:
-            creator = session.get(User, topic.creator_id)
+            creator = get_user_by_id(session, topic.creator_id)
             reported_item = ReportedItemDetails(
                 type="forum_topic",
                 id=topic.id,
@@ -122,7 +122,7 @@ def _build_report_response(session: Session, report: Report) -> ReportResponse:
     # Get moderator info if reviewed
     moderator_info = None
     if report.moderator_id:
-        moderator = session.get(User, report.moderator_id)
+        moderator = get_user_by_id(session, report.moderator_id)
         if moderator:
             moderator_info = ModeratorInfo(
                 id=moderator.id,
@@ -187,7 +187,7 @@ def create_report(
     
     # Verify reported item exists
     if report_data.reported_user_id:
-        user = session.get(User, report_data.reported_user_id)
+        user = get_user_by_id(session, report_data.reported_user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
     
@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlmodel import Session, select, or_, and_, func
 
 from app.core.db import get_session
-from app.core.offers_needs import get_offer_tags, get_need_tags
+from app.core.offers_needs import get_need_tags, get_needs_tags, get_offer_tags, get_offers_tags
 from app.core.semantic_tags import expand_tags_for_search
 from app.models.offer import Offer, OfferStatus
 from app.models.need import Need, NeedStatus
@@ -35,13 +35,15 @@ def _build_search_result(
     session: Session,
     item_id: int,
     item_type: str,
-    item: Offer | Need
+    item: Offer | Need,
+    tags: list[str] | None = None,
 ) -> SearchResult:
     """Build a search result from an offer or need."""
-    if item_type == "offer":
-        tags = get_offer_tags(session, item_id)
-    else:
-        tags = get_need_tags(session, item_id)
+    if tags is None:
+        if item_type == "offer":
+            tags = get_offer_tags(session, item_id)
+        else:
+            tags = get_need_tags(session, item_id)
     
     return SearchResult(
         id=item.id,
@@ -62,15 +64,7 @@ def _build_search_result(
 @router.get("/", response_model=SearchResponse)
 def search(
     session: Annotated[Session, Depends(get_session)],
-    query: str | None = Query(None, description="Text search in title/description"),
-    type: SearchType = Query(SearchType.ALL, description="Filter by type: offer, need, or all"),
-    tags: list[str] | None = Query(None, description="Tags to filter by"),
-    tag_match: TagMatchMode = Query(TagMatchMode.ANY, description="Match ANY or ALL tags"),
-    semantic: bool = Query(True, description="Enable semantic tag expansion (parents/children/synonyms)"),
-    is_remote: bool | None = Query(None, description="Filter by remote flag"),
-    sort_by: SortOrder = Query(SortOrder.RECENCY, description="Sort order"),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100),
+    filters: Annotated[SearchFilters, Query()],
 ) -> SearchResponse:
     """
     Search for offers and needs with filters.
@@ -91,7 +85,20 @@ def search(
     - /search?tags=coding&tags=education&tag_match=all
     - /search?tags=gardening&semantic=true  (also finds lawn-mowing, landscaping, etc.)
     - /search?is_remote=true&sort_by=recency
+    
+    All filters are validated together by SearchFilters, whose validator is
+    built once when the route is registered; unknown parameters are rejected.
     """
+    query = filters.query
+    type = filters.type
+    tags = filters.tags
+    tag_match = filters.tag_match
+    semantic = filters.semantic
+    is_remote = filters.is_remote
+    sort_by = filters.sort_by
+    skip = filters.skip
+    limit = filters.limit
+    
     results = []
     
     # Resolve tag names to IDs and expand semantically if enabled
@@ -191,8 +198,11 @@ def search(
         all_offers = session.exec(offer_query).all()
         
         # Build results
+        offer_tags = get_offers_tags(session, [offer.id for offer in all_offers])
         for offer in all_offers:
-            results.append(_build_search_result(session, offer.id, "offer", offer))
+            results.append(
+                _build_search_result(session, offer.id, "offer", offer, offer_tags[offer.id])
+            )
     
     # Search needs
     if search_needs:
@@ -245,8 +255,11 @@ def search(
         all_needs = session.exec(need_query).all()
         
         # Build results
+        need_tags = get_needs_tags(session, [need.id for need in all_needs])
         for need in all_needs:
-            results.append(_build_search_result(session, need.id, "need", need))
+            results.append(
+                _build_search_result(session, need.id, "need", need, need_tags[need.id])
+            )
     
     # Sort combined results if searching both types
     if search_offers and search_needs and sort_by == SortOrder.RECENCY:
@@ -7,56 +7,32 @@ SRS Requirements:
 - FR-10.3: Ratings visible on profiles
 """
 from typing import Annotated, Optional
-from datetime import datetime
-import base64
 import re
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from sqlalchemy.orm import selectinload, undefer
 from sqlmodel import Session, select, func, or_
 
 from app.core.auth import CurrentUser
 from app.core.db import get_session
-from app.models.user import User, UserTag, PRESET_AVATARS
+from app.core.users import get_user_by_username, get_username
+from app.models.types import utcnow
+from app.models.user import User, PRESET_AVATARS, PRESET_AVATARS_SET
 from app.models.ledger import LedgerEntry
 from app.models.rating import Rating
-from app.schemas.auth import UserPublic, UserProfileUpdate
+from app.schemas.auth import (
+    ALLOWED_IMAGE_TYPES,
+    UserPublic,
+    UserProfileUpdate,
+    UserProfileResponse,
+    UserStats,
+)
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 # Maximum image size: 2MB
 MAX_IMAGE_SIZE = 2 * 1024 * 1024
-ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/gif", "image/webp"]
-
-
-class UserStats(BaseModel):
-    """User statistics for profile display."""
-    balance: float
-    hours_given: float
-    hours_received: float
-    completed_exchanges: int
-    ratings_received: int
-
-
-class UserProfileResponse(BaseModel):
-    """Complete user profile with stats."""
-    id: int
-    username: str
-    display_name: Optional[str]
-    description: Optional[str]
-    profile_image: Optional[str]
-    profile_image_type: str
-    location_name: Optional[str]
-    balance: float
-    social_blog: Optional[str] = None
-    social_instagram: Optional[str] = None
-    social_facebook: Optional[str] = None
-    social_twitter: Optional[str] = None
-    stats: UserStats
-    tags: list[str]
-    created_at: str
-    
-    model_config = {"from_attributes": True}
 
 
 class PresetAvatarsResponse(BaseModel):
@@ -72,14 +48,7 @@ def get_preset_avatars() -> PresetAvatarsResponse:
     Returns:
         List of preset avatar names
     """
-    return PresetAvatarsResponse(avatars=PRESET_AVATARS)
-
-
-def _get_user_tags(session: Session, user_id: int) -> list[str]:
-    """Get tag names for a user."""
-    statement = select(UserTag).where(UserTag.user_id == user_id)
-    user_tags = session.exec(statement).all()
-    return [ut.tag_name for ut in user_tags]
+    return PresetAvatarsResponse(avatars=list(PRESET_AVATARS))
 
 
 def _get_user_stats(session: Session, user_id: int, balance: float) -> UserStats:
@@ -150,7 +119,7 @@ def _get_user_stats(session: Session, user_id: int, balance: float) -> UserStats
 def _build_profile_response(session: Session, user: User) -> UserProfileResponse:
     """Build a complete user profile response."""
     stats = _get_user_stats(session, user.id, user.balance)
-    tags = _get_user_tags(session, user.id)
+    tags = list(user.tag_names)
     
     return UserProfileResponse(
         id=user.id,
@@ -215,17 +184,22 @@ def update_my_profile(
     if profile_update.description is not None:
         current_user.description = profile_update.description
     
-    if profile_update.profile_image is not None:
-        current_user.profile_image = profile_update.profile_image
-    
     if profile_update.profile_image_type is not None:
         # Validate preset avatar name if type is preset
         if profile_update.profile_image_type == "preset" and profile_update.profile_image:
-            if profile_update.profile_image not in PRESET_AVATARS:
+            if profile_update.profile_image not in PRESET_AVATARS_SET:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid preset avatar. Must be one of: {', '.join(PRESET_AVATARS)}"
                 )
+    
+    if profile_update.custom_image is not None:
+        # Bytes were already decoded while validating the request
+        current_user.set_custom_image(*profile_update.custom_image)
+    elif profile_update.profile_image is not None:
+        # The setter derives profile_image_type from the value itself
+        current_user.profile_image = profile_update.profile_image
+    elif profile_update.profile_image_type is not None:
         current_user.profile_image_type = profile_update.profile_image_type
     
     if profile_update.location_lat is not None:
@@ -252,20 +226,12 @@ def update_my_profile(
     
     # Update tags if provided
     if profile_update.tags is not None:
-        # Delete existing tags
-        existing_tags = session.exec(
-            select(UserTag).where(UserTag.user_id == current_user.id)
-        ).all()
-        for tag in existing_tags:
-            session.delete(tag)
-        
-        # Add new tags (limit to 10 tags)
+        # Replace existing tags; dropped rows are deleted as orphans (limit to 10 tags)
         unique_tags = list(set(tag.strip().lower() for tag in profile_update.tags if tag.strip()))[:10]
-        for tag_name in unique_tags:
-            user_tag = UserTag(user_id=current_user.id, tag_name=tag_name)
-            session.add(user_tag)
+        current_user.tag_names[:] = unique_tags
     
-    current_user.updated_at = datetime.utcnow()
+    # Stamped by the database; set explicitly so tag-only edits still bump it
+    current_user.updated_at = utcnow()
     session.add(current_user)
     session.commit()
     session.refresh(current_user)
@@ -290,7 +256,7 @@ async def upload_profile_image(
     Upload a custom profile image.
     
     Accepts JPEG, PNG, GIF, or WebP images up to 500KB.
-    The image is stored as a base64 data URL.
+    The raw image bytes are stored and served back as a base64 data URL.
     
     Returns:
         Updated profile image info
@@ -310,21 +276,17 @@ async def upload_profile_image(
             detail=f"Image too large. Maximum size is {MAX_IMAGE_SIZE // 1024}KB"
         )
     
-    # Convert to base64 data URL
-    base64_content = base64.b64encode(content).decode('utf-8')
-    data_url = f"data:{file.content_type};base64,{base64_content}"
-    
     # Update user profile
-    current_user.profile_image = data_url
-    current_user.profile_image_type = "custom"
-    current_user.updated_at = datetime.utcnow()
+    current_user.set_custom_image(content, file.content_type)
+    # The image bytes live in user_profile_images; stamp the users row too
+    current_user.updated_at = utcnow()
     
     session.add(current_user)
     session.commit()
     session.refresh(current_user)
     
     return ImageUploadResponse(
-        profile_image=data_url,
+        profile_image=current_user.image.data_url,
         profile_image_type="custom",
         message="Profile image uploaded successfully"
     )
@@ -342,8 +304,6 @@ def remove_profile_image(
         Success message
     """
     current_user.profile_image = None
-    current_user.profile_image_type = "preset"
-    current_user.updated_at = datetime.utcnow()
     
     session.add(current_user)
     session.commit()
@@ -365,7 +325,9 @@ def get_user_profile(
     Returns:
         User profile with TimeBank stats and badges
     """
-    user = session.get(User, user_id)
+    user = session.get(
+        User, user_id, options=[selectinload(User.tags), undefer(User.description)]
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -388,7 +350,11 @@ def get_user_profile_by_username(
     Returns:
         User profile with TimeBank stats and badges
     """
-    statement = select(User).where(User.username == username)
+    statement = (
+        select(User)
+        .where(func.lower(User.username) == username.lower())
+        .options(selectinload(User.tags), undefer(User.description))
+    )
     user = session.exec(statement).first()
     if not user:
         raise HTTPException(
@@ -454,8 +420,7 @@ def get_user_completed_exchanges(
     from app.models.need import Need
     
     # Get user by username
-    statement = select(User).where(User.username == username)
-    user = session.exec(statement).first()
+    user = get_user_by_username(session, username)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -520,11 +485,11 @@ def get_user_completed_exchanges(
                     # For completed or if user is participant, show normally
                     # Determine the "other party" from user's perspective
                     if is_participant:
-                        other_user = session.get(User, offer.creator_id)
+                        other_username = get_username(session, offer.creator_id)
                         other_user_id = offer.creator_id
                         role = participant.role.value
                     else:  # is_creator
-                        other_user = session.get(User, participant.user_id)
+                        other_username = get_username(session, participant.user_id)
                         other_user_id = participant.user_id
                         # If participant was provider, creator was requester and vice versa
                         role = "requester" if participant.role.value == "provider" else "provider"
@@ -537,7 +502,7 @@ def get_user_completed_exchanges(
                         item_description=offer.description,
                         item_type="offer",
                         other_user_id=other_user_id,
-                        other_username=other_user.username if other_user else "Unknown",
+                        other_username=other_username or "Unknown",
                         role=role,
                         hours=participant.hours_contributed,
                         completed_at=participant.updated_at.isoformat(),
@@ -588,11 +553,11 @@ def get_user_completed_exchanges(
                     # For completed or if user is participant, show normally
                     # Determine the "other party" from user's perspective
                     if is_participant:
-                        other_user = session.get(User, need.creator_id)
+                        other_username = get_username(session, need.creator_id)
                         other_user_id = need.creator_id
                         role = participant.role.value
                     else:  # is_creator
-                        other_user = session.get(User, participant.user_id)
+                        other_username = get_username(session, participant.user_id)
                         other_user_id = participant.user_id
                         # If participant was provider, creator was requester and vice versa
                         role = "requester" if participant.role.value == "provider" else "provider"
@@ -605,7 +570,7 @@ def get_user_completed_exchanges(
                         item_description=need.description,
                         item_type="need",
                         other_user_id=other_user_id,
-                        other_username=other_user.username if other_user else "Unknown",
+                        other_username=other_username or "Unknown",
                         role=role,
                         hours=participant.hours_contributed,
                         completed_at=participant.updated_at.isoformat(),
@@ -6,6 +6,7 @@ from sqlmodel import Session, select
 
 from app.core.db import get_session
 from app.core.security import decode_access_token
+from app.core.users import get_user_by_id
 from app.models.user import User
 
 security = HTTPBearer(auto_error=True)
@@ -42,7 +43,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = session.get(User, user_id)
+    user = get_user_by_id(session, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
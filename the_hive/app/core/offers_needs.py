@@ -91,6 +91,32 @@ def get_need_tags(session: Session, need_id: int) -> list[str]:
     return list(tags)
 
 
+def get_offers_tags(session: Session, offer_ids: list[int]) -> dict[int, list[str]]:
+    """Get tag names for many offers with a single query."""
+    statement = (
+        select(OfferTag.offer_id, Tag.name)
+        .join(Tag, OfferTag.tag_id == Tag.id)
+        .where(OfferTag.offer_id.in_(offer_ids))
+    )
+    tags: dict[int, list[str]] = {offer_id: [] for offer_id in offer_ids}
+    for offer_id, name in session.exec(statement).all():
+        tags[offer_id].append(name)
+    return tags
+
+
+def get_needs_tags(session: Session, need_ids: list[int]) -> dict[int, list[str]]:
+    """Get tag names for many needs with a single query."""
+    statement = (
+        select(NeedTag.need_id, Tag.name)
+        .join(Tag, NeedTag.tag_id == Tag.id)
+        .where(NeedTag.need_id.in_(need_ids))
+    )
+    tags: dict[int, list[str]] = {need_id: [] for need_id in need_ids}
+    for need_id, name in session.exec(statement).all():
+        tags[need_id].append(name)
+    return tags
+
+
 def update_offer_tags(session: Session, offer_id: int, new_tag_names: list[str]):
     """Update tags for an offer by replacing all associations."""
     # Remove old associations
@@ -0,0 +1,143 @@
+"""
+Request-scoped user lookups.
+
+The same user is resolved several times per request (authentication,
+permission checks, response building). Every request gets its own
+Session, so resolved users are cached in ``session.info``: the strong
+references keep them in the identity map until the request ends, instead
+of letting them be garbage collected and fetched again.
+
+Usernames shown next to comments, topics and ratings are also kept in a
+small process-wide LRU so list endpoints don't hit the users table once
+per row. Entries are dropped whenever the user row is written.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterable, Optional
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import load_only
+from sqlmodel import Session, select
+
+from app.models.user import User
+
+_CACHE_KEY = "user_cache"
+
+USERNAME_CACHE_SIZE = 10_000
+
+_usernames: "OrderedDict[int, str]" = OrderedDict()
+_usernames_lock = Lock()
+
+
+def _user_cache(session: Session) -> dict[tuple[str, object], User]:
+    return session.info.setdefault(_CACHE_KEY, {})
+
+
+def _cached(session: Session, key: tuple[str, object]) -> Optional[User]:
+    """Return a cached user that is still attached to this session."""
+    cache = _user_cache(session)
+    user = cache.get(key)
+    if user is not None and user not in session:
+        # Dropped from the session (e.g. after a rollback) - forget it
+        cache.clear()
+        return None
+    return user
+
+
+def _remember(session: Session, user: Optional[User]) -> Optional[User]:
+    if user is not None:
+        cache = _user_cache(session)
+        cache[("id", user.id)] = user
+        # Usernames and emails are unique case-insensitively
+        cache[("username", user.username.lower())] = user
+        cache[("email", user.email.lower())] = user
+    return user
+
+
+def get_user_by_id(session: Session, user_id: int) -> Optional[User]:
+    """Get a user by primary key, reusing users already resolved in this request."""
+    user = _cached(session, ("id", user_id))
+    if user is None:
+        user = _remember(session, session.get(User, user_id))
+    return user
+
+
+def get_user_by_username(session: Session, username: str) -> Optional[User]:
+    """Get a user by username (case-insensitive), reusing users already resolved in this request."""
+    user = _cached(session, ("username", username.lower()))
+    if user is None:
+        statement = select(User).where(func.lower(User.username) == username.lower())
+        user = _remember(session, session.exec(statement).first())
+    return user
+
+
+def get_user_by_email(session: Session, email: str) -> Optional[User]:
+    """Get a user by email (case-insensitive), reusing users already resolved in this request."""
+    user = _cached(session, ("email", email.lower()))
+    if user is None:
+        statement = select(User).where(func.lower(User.email) == email.lower())
+        user = _remember(session, session.exec(statement).first())
+    return user
+
+
+def prefetch_users(session: Session, user_ids: Iterable[Optional[int]]) -> None:
+    """Resolve many users with a single ``IN (...)`` query.
+
+    Meant for list endpoints: call it with every user id the page refers to,
+    then build each row with get_user_by_id() as usual. Only the columns
+    shown next to content are loaded; anything else is fetched lazily if a
+    caller happens to need it.
+    """
+    missing = {
+        user_id for user_id in user_ids
+        if user_id is not None and _cached(session, ("id", user_id)) is None
+    }
+    if not missing:
+        return
+
+    statement = select(User).where(User.id.in_(missing)).options(
+        load_only(
+            User.id,
+            User.username,
+            User.email,
+            User.full_name,
+            User.profile_image_ref,
+            User.profile_image_type,
+        )
+    )
+    for user in session.exec(statement).all():
+        _remember(session, user)
+
+
+def get_username(session: Session, user_id: int) -> Optional[str]:
+    """Get a user's username, served from the process-wide LRU when possible."""
+    with _usernames_lock:
+        username = _usernames.get(user_id)
+        if username is not None:
+            _usernames.move_to_end(user_id)
+            return username
+
+    user = get_user_by_id(session, user_id)
+    if user is None:
+        return None
+
+    with _usernames_lock:
+        _usernames[user_id] = user.username
+        if len(_usernames) > USERNAME_CACHE_SIZE:
+            _usernames.popitem(last=False)
+    return user.username
+
+
+def clear_username_cache() -> None:
+    """Forget every cached username."""
+    with _usernames_lock:
+        _usernames.clear()
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _forget_username(mapper, connection, target: User) -> None:
+    # Any write may change the username (or reuse an id after a reset)
+    with _usernames_lock:
+        _usernames.pop(target.id, None)
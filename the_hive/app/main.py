@@ -17,6 +17,9 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting application", extra={"extra_fields": {"app_name": settings.APP_NAME}})
     init_db()  # Create database tables on startup
+    # Pydantic validators are already compiled at import; the OpenAPI schema
+    # is not, so build it now rather than on the first /docs request
+    app.openapi()
     yield
     logger.info("Shutting down application")
 
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional
 from enum import Enum
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 
@@ -37,12 +38,30 @@ class Participant(SQLModel, table=True):
     """
 
     __tablename__ = "participants"
+    __table_args__ = (
+        # Capacity checks and exchange lookups filter on (item, status) together
+        Index("ix_participants_need_status", "need_id", "status"),
+        Index("ix_participants_offer_status", "offer_id", "status"),
+        # Accepted exchanges that both sides have confirmed (ready to complete)
+        Index(
+            "ix_participants_ready",
+            "need_id",
+            "offer_id",
+            postgresql_where=text(
+                "status = 'ACCEPTED' AND provider_confirmed AND requester_confirmed"
+            ),
+            sqlite_where=text(
+                "status = 'ACCEPTED' AND provider_confirmed AND requester_confirmed"
+            ),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # References to either Offer or Need (one will be set)
-    offer_id: Optional[int] = Field(default=None, foreign_key="offers.id", index=True)
-    need_id: Optional[int] = Field(default=None, foreign_key="needs.id", index=True)
+    # Lookups are served by the composite (item, status) indexes above
+    offer_id: Optional[int] = Field(default=None, foreign_key="offers.id")
+    need_id: Optional[int] = Field(default=None, foreign_key="needs.id")
     
     # Participant user
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -15,6 +15,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 from enum import Enum
 
+from sqlalchemy import Column, Computed, SmallInteger
 from sqlmodel import Field, SQLModel
 
 
@@ -41,7 +42,8 @@ class Rating(SQLModel, table=True):
     - Kindness & Respect: Politeness, comfort, mutual respect
     - Helpfulness & Quality: Meaningfulness and supportiveness
     
-    General Rating is calculated as the average of the three category ratings.
+    General Rating is the rounded average of the three category ratings,
+    computed by the database as a stored generated column.
     
     Human-friendly labels for each score:
     1 = "Needs Improvement" (gentle framing)
@@ -76,9 +78,19 @@ class Rating(SQLModel, table=True):
     # Did the exchange feel meaningful and supportive?
     helpfulness_rating: int = Field(ge=1, le=5)
     
-    # General Rating - Calculated as average of the three categories
-    # Stored for query performance and historical consistency
-    general_rating: float = Field(ge=1, le=5)
+    # General Rating - Rounded average of the three categories
+    # Generated by the database on insert so it stays consistent on every write path
+    general_rating: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            SmallInteger,
+            Computed(
+                "(reliability_rating + kindness_rating + helpfulness_rating + 1) / 3",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
     
     # ===== Public Comment (Optional) =====
     # Shown on profile - should be constructive and peace-oriented
@@ -105,12 +117,6 @@ class Rating(SQLModel, table=True):
         """Calculate average rating from the three category ratings."""
         return (self.reliability_rating + self.kindness_rating + self.helpfulness_rating) / 3
     
-    @staticmethod
-    def compute_general_rating(reliability: int, kindness: int, helpfulness: int) -> int:
-        """Compute the general rating as rounded average of the three categories."""
-        avg = (reliability + kindness + helpfulness) / 3
-        return round(avg)
-
     def is_past_deadline(self) -> bool:
         """Check if the visibility deadline has passed."""
         return datetime.utcnow() >= self.visibility_deadline
@@ -0,0 +1,111 @@
+"""
+Custom column types and SQL expressions shared by the models.
+"""
+import zlib
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import DateTime, LargeBinary, SmallInteger
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+# Values shorter than this (in bytes) are stored as-is; compressing them
+# costs more CPU than it saves in row size
+COMPRESS_MIN_LENGTH = 128
+
+# First byte of every stored value tells how the rest is encoded
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class CompressedText(TypeDecorator):
+    """Text column that is transparently zlib-compressed in the database.
+
+    Values above COMPRESS_MIN_LENGTH are compressed on INSERT/UPDATE and
+    decompressed on SELECT, so models keep working with plain ``str``.
+    Columns using this type cannot be filtered with LIKE in SQL.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        raw = value.encode("utf-8")
+        if len(raw) < COMPRESS_MIN_LENGTH:
+            return _RAW + raw
+        compressed = zlib.compress(raw)
+        if len(compressed) >= len(raw):
+            return _RAW + raw
+        return _ZLIB + compressed
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Legacy VARCHAR value not yet converted by
+            # scripts/migrate_compressed_text.py
+            return value
+        value = bytes(value)
+        if value[:1] == _ZLIB:
+            return zlib.decompress(value[1:]).decode("utf-8")
+        return value[1:].decode("utf-8")
+
+
+class SmallIntEnum(TypeDecorator):
+    """Enum column stored as a SMALLINT code instead of its name.
+
+    Keeps index keys and comparisons small while the application (and the
+    API) keep working with the regular string enum members. ``codes`` maps
+    each member to its stored integer; codes must never be reused.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum], codes: dict[Enum, int]):
+        super().__init__()
+        self.enum_class = enum_class
+        # Stored as a tuple so the type stays hashable for statement caching
+        self.codes = tuple(codes.items())
+        self._to_code = dict(self.codes)
+        self._from_code = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[int], dialect):
+        if value is None:
+            return None
+        return self._from_code[value]
+
+
+class utcnow(FunctionElement):
+    """Current UTC time evaluated by the database.
+
+    Renders to a naive UTC timestamp on every backend, matching the
+    ``datetime.utcnow()`` values the application writes elsewhere.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw) -> str:
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
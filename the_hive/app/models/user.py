@@ -1,12 +1,18 @@
 """
 User model for the application.
 """
+import base64
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 from enum import Enum
 
 from sqlmodel import Field, SQLModel, Relationship, Column
-from sqlalchemy import Text
+from sqlalchemy import DateTime, Index, LargeBinary, func, literal_column, text
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred
+
+from app.models.types import CompressedText, SmallIntEnum, utcnow
 
 
 class UserRole(str, Enum):
@@ -17,7 +23,8 @@ class UserRole(str, Enum):
 
 
 # Preset avatar options - insect/nature themed for "The Hive"
-PRESET_AVATARS = [
+# Ordered for UI listings; use PRESET_AVATARS_SET for membership checks
+PRESET_AVATARS: tuple[str, ...] = (
     # Insects
     "bee",
     "butterfly", 
@@ -46,7 +53,18 @@ PRESET_AVATARS = [
     "leaf",
     "mushroom",
     "cactus",
-]
+)
+PRESET_AVATARS_SET: frozenset[str] = frozenset(PRESET_AVATARS)
+
+# Profile text is only rendered on profile pages; it is deferred so the
+# user loaded for every authenticated request doesn't carry it
+_description_column = Column("description", CompressedText)
+
+# Stored SMALLINT code of each role; never renumber existing roles
+ROLE_CODES = {UserRole.USER: 1, UserRole.MODERATOR: 2, UserRole.ADMIN: 3}
+
+# Roles with moderation permissions
+_MOD_ROLES = frozenset({UserRole.MODERATOR, UserRole.ADMIN})
 
 
 class User(SQLModel, table=True):
@@ -59,21 +77,49 @@ class User(SQLModel, table=True):
     """
 
     __tablename__ = "users"
+    # Let pydantic skip the hybrid role checks instead of treating them as fields
+    model_config = {"ignored_types": (hybrid_property,)}
+    __mapper_args__ = {"properties": {"description": deferred(_description_column)}}
+    __table_args__ = (
+        # Case-insensitive uniqueness; also serves the lower() lookups used
+        # by login and registration
+        Index("ix_users_email_ci", func.lower(literal_column("email")), unique=True),
+        Index("ix_users_username_ci", func.lower(literal_column("username")), unique=True),
+        # Moderation dashboards and listings filter on these predicates
+        Index(
+            "ix_users_active_not_banned",
+            "is_active",
+            postgresql_where=text("is_banned = false AND is_suspended = false"),
+            sqlite_where=text("is_banned = false AND is_suspended = false"),
+        ),
+        Index("ix_users_role_active", "role", "is_active"),
+        Index(
+            "ix_users_suspended_until",
+            "suspended_until",
+            postgresql_where=text("is_suspended = true"),
+            sqlite_where=text("is_suspended = true"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    email: str = Field(unique=True, index=True, max_length=255)
-    username: str = Field(unique=True, index=True, max_length=50)
+    email: str = Field(unique=True, max_length=255)
+    username: str = Field(unique=True, max_length=50)
     password_hash: str = Field(max_length=255)  # NFR-5: salted hash
     full_name: Optional[str] = Field(default=None, max_length=255)
-    description: Optional[str] = Field(default=None, max_length=1000)  # FR-2.4
+    description: Optional[str] = Field(
+        default=None, max_length=1000, sa_column=_description_column
+    )  # FR-2.4, deferred
     
-    # Profile image: either preset name or custom base64 data URL
-    # Using sa_column for TEXT type to store large base64 images (up to ~700KB encoded)
-    profile_image: Optional[str] = Field(default=None, sa_column=Column(Text))
+    # Profile image: preset avatar name stored inline; custom images live in
+    # the user_profile_images table so the blob stays out of hot user queries
+    profile_image_ref: Optional[str] = Field(default=None, max_length=255)
     profile_image_type: str = Field(default="preset")  # "preset" or "custom"
     
     # SRS: User role for permissions
-    role: UserRole = Field(default=UserRole.USER, index=True)
+    role: UserRole = Field(
+        default=UserRole.USER,
+        sa_column=Column(SmallIntEnum(UserRole, ROLE_CODES), nullable=False),
+    )  # Indexed via ix_users_role_active
     
     # SRS FR-7.1: TimeBank balance (starts at 5 hours)
     balance: float = Field(default=5.0)
@@ -93,26 +139,58 @@ class User(SQLModel, table=True):
     is_suspended: bool = Field(default=False)
     suspended_at: Optional[datetime] = Field(default=None)
     suspended_until: Optional[datetime] = Field(default=None)
-    suspension_reason: Optional[str] = Field(default=None, max_length=500)
+    suspension_reason: Optional[str] = Field(
+        default=None, max_length=500, sa_column=Column(CompressedText)
+    )
     
     is_banned: bool = Field(default=False)
     banned_at: Optional[datetime] = Field(default=None)
-    ban_reason: Optional[str] = Field(default=None, max_length=500)
+    ban_reason: Optional[str] = Field(
+        default=None, max_length=500, sa_column=Column(CompressedText)
+    )
     
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Stamped by the database (UTC) on insert and on every UPDATE of the row
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=utcnow(), nullable=False),
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False),
+    )
     
     # Relationships
-    tags: list["UserTag"] = Relationship(back_populates="user")
+    # Kept lazy since User is loaded on every authenticated request;
+    # profile endpoints opt in with selectinload(User.tags)
+    tags: list["UserTag"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+    )
+    image: Optional["UserProfileImage"] = Relationship(
+        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"}
+    )
     
-    # Convenience properties
-    @property
+    # Tag names as plain strings. A ClassVar so pydantic leaves it alone,
+    # which also means it can't be assigned on instances: to replace tags,
+    # mutate the proxied list (or assign ``tags``)
+    tag_names: ClassVar[AssociationProxy[list[str]]] = association_proxy(
+        "tags", "tag_name", creator=lambda tag_name: UserTag(tag_name=tag_name)
+    )
+    
+    # Convenience properties; the role checks also work in queries,
+    # e.g. select(User).where(User.is_moderator)
+    @hybrid_property
     def is_moderator(self) -> bool:
         """Check if user is a moderator or admin."""
-        return self.role in [UserRole.MODERATOR, UserRole.ADMIN]
+        return self.role in _MOD_ROLES
     
-    @property
+    @is_moderator.inplace.expression
+    @classmethod
+    def _is_moderator_expression(cls):
+        return cls.role.in_(_MOD_ROLES)
+    
+    @hybrid_property
     def is_admin(self) -> bool:
         """Check if user is an admin."""
         return self.role == UserRole.ADMIN
@@ -121,6 +199,56 @@ class User(SQLModel, table=True):
     def bio(self) -> Optional[str]:
         """Alias for description field (used in report schemas)."""
         return self.description
+    
+    @property
+    def profile_image(self) -> Optional[str]:
+        """Preset avatar name or custom image data URL.
+        
+        The custom image row is only loaded when the user actually has one.
+        """
+        if self.profile_image_type == "custom":
+            return self.image.data_url if self.image else None
+        return self.profile_image_ref
+    
+    @profile_image.setter
+    def profile_image(self, value: Optional[str]) -> None:
+        if value is not None and value.startswith("data:"):
+            header, _, encoded = value.partition(",")
+            mime_type = header[len("data:"):].split(";", 1)[0]
+            self.set_custom_image(base64.b64decode(encoded), mime_type)
+        else:
+            self.profile_image_ref = value
+            self.profile_image_type = "preset"
+            self.image = None
+    
+    def set_custom_image(self, content: bytes, mime_type: str) -> None:
+        """Store raw custom image bytes for this user."""
+        if self.image is None:
+            self.image = UserProfileImage(data=content, mime_type=mime_type)
+        else:
+            self.image.data = content
+            self.image.mime_type = mime_type
+        self.profile_image_ref = None
+        self.profile_image_type = "custom"
+
+
+class UserProfileImage(SQLModel, table=True):
+    """Custom profile image kept apart from the users row.
+    
+    Stores the raw image bytes so that listing and join queries on users
+    never pull the blob; the data URL is only built when it is rendered.
+    """
+    
+    __tablename__ = "user_profile_images"
+    
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    data: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    mime_type: str = Field(max_length=50)
+    
+    @property
+    def data_url(self) -> str:
+        """Image encoded as a base64 data URL for API responses."""
+        return f"data:{self.mime_type};base64,{base64.b64encode(self.data).decode('ascii')}"
 
 
 class UserTag(SQLModel, table=True):
@@ -1,6 +1,14 @@
+import base64
+import binascii
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, PrivateAttr, field_validator, model_validator
+
+# Largest accepted profile_image: a 2MB upload encoded as a base64 data URL
+MAX_PROFILE_IMAGE_LENGTH = 3_000_000
+
+# Image types accepted both as uploads and as profile_image data URLs
+ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/gif", "image/webp"]
 
 
 class UserRegister(BaseModel):
@@ -47,7 +55,7 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class UserPublic(BaseModel):
@@ -63,14 +71,14 @@ class UserPublic(BaseModel):
     completed_exchanges: int | None = None  # Number of completed exchanges
     average_rating: float | None = None  # Average rating (0-5)
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class UserProfileUpdate(BaseModel):
     """Request schema for updating user profile."""
     full_name: str | None = Field(None, max_length=255)
     description: str | None = Field(None, max_length=1000)
-    profile_image: str | None = Field(None, max_length=500)
+    profile_image: str | None = Field(None, max_length=MAX_PROFILE_IMAGE_LENGTH)
     profile_image_type: str | None = Field(None, pattern="^(preset|custom)$")
     location_lat: float | None = None
     location_lon: float | None = None
@@ -80,36 +88,75 @@ class UserProfileUpdate(BaseModel):
     social_facebook: str | None = Field(None, max_length=100)
     social_twitter: str | None = Field(None, max_length=100)
     tags: list[str] | None = None  # List of tag names
+    
+    # (bytes, mime type) decoded from a custom image data URL
+    _custom_image: tuple[bytes, str] | None = PrivateAttr(default=None)
+    
+    @field_validator('profile_image')
+    @classmethod
+    def validate_profile_image(cls, v):
+        """Check for a base64 image data URL or a short preset name.
+        
+        Preset names are checked against the avatar list by the endpoint.
+        """
+        if v is None:
+            return v
+        if v.startswith("data:"):
+            header, _, encoded = v.partition(",")
+            mime_type, _, encoding = header[len("data:"):].partition(";")
+            if mime_type not in ALLOWED_IMAGE_TYPES or encoding != "base64":
+                raise ValueError(
+                    f"profile_image data URL must be base64 encoded and one of: "
+                    f"{', '.join(ALLOWED_IMAGE_TYPES)}"
+                )
+            return v
+        if len(v) > 255:
+            raise ValueError("profile_image must be a preset avatar name or an image data URL")
+        return v
+    
+    @model_validator(mode='after')
+    def decode_custom_image(self):
+        """Decode a custom image data URL once and keep the bytes for the endpoint."""
+        if self.profile_image is not None and self.profile_image.startswith("data:"):
+            header, _, encoded = self.profile_image.partition(",")
+            try:
+                content = base64.b64decode(encoded, validate=True)
+            except binascii.Error:
+                raise ValueError("profile_image data URL contains invalid base64 data")
+            self._custom_image = (content, header[len("data:"):].partition(";")[0])
+        return self
+    
+    @property
+    def custom_image(self) -> tuple[bytes, str] | None:
+        """Decoded (bytes, mime type) of a custom image data URL, if one was sent."""
+        return self._custom_image
 
 
-class UserTagResponse(BaseModel):
-    """Response schema for user tags."""
-    tag_name: str
-    
-    model_config = {"from_attributes": True}
+class UserStats(BaseModel):
+    """User statistics for profile display."""
+    balance: float
+    hours_given: float
+    hours_received: float
+    completed_exchanges: int
+    ratings_received: int
 
 
 class UserProfileResponse(BaseModel):
-    """Response schema for user profile with tags."""
+    """Complete user profile with stats and tags."""
     id: int
-    email: str
     username: str
-    full_name: str | None
+    display_name: str | None
     description: str | None
     profile_image: str | None
     profile_image_type: str
-    role: str
-    balance: float
-    location_lat: float | None
-    location_lon: float | None
     location_name: str | None
-    social_blog: str | None
-    social_instagram: str | None
-    social_facebook: str | None
-    social_twitter: str | None
-    is_active: bool
-    created_at: datetime
-    updated_at: datetime
+    balance: float
+    social_blog: str | None = None
+    social_instagram: str | None = None
+    social_facebook: str | None = None
+    social_twitter: str | None = None
+    stats: UserStats
     tags: list[str]
+    created_at: str
     
     model_config = {"from_attributes": True}
@@ -10,9 +10,9 @@ SRS Requirements:
 - FR-15.5: Links visible both ways (bidirectional)
 """
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 
 
 class ForumTopicCreate(BaseModel):
@@ -125,7 +125,7 @@ class ForumTopicResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ForumTopicListResponse(BaseModel):
@@ -136,30 +136,20 @@ class ForumTopicListResponse(BaseModel):
     limit: int
 
 
+# Comment text is stripped first, so whitespace-only content fails min_length
+CommentContent = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=2000)
+]
+
+
 class ForumCommentCreate(BaseModel):
     """Schema for creating a forum comment."""
-    content: str = Field(..., min_length=1, max_length=2000)
-    
-    @field_validator('content')
-    @classmethod
-    def validate_content(cls, v):
-        """Basic content validation."""
-        if not v or not v.strip():
-            raise ValueError("Content cannot be empty")
-        return v.strip()
+    content: CommentContent
 
 
 class ForumCommentUpdate(BaseModel):
     """Schema for updating a forum comment."""
-    content: str = Field(..., min_length=1, max_length=2000)
-    
-    @field_validator('content')
-    @classmethod
-    def validate_content(cls, v):
-        """Basic content validation."""
-        if not v or not v.strip():
-            raise ValueError("Content cannot be empty")
-        return v.strip()
+    content: CommentContent
 
 
 class ForumCommentResponse(BaseModel):
@@ -177,7 +167,7 @@ class ForumCommentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ForumCommentListResponse(BaseModel):
@@ -0,0 +1,17 @@
+"""
+Schemas shared by Offers and Needs.
+"""
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ListingBase(BaseModel):
+    """Fields common to every listing (Offer or Need)."""
+    title: str = Field(..., min_length=3, max_length=200)
+    description: str = Field(..., min_length=10, max_length=2000)
+    is_remote: bool = False
+    location_lat: Optional[float] = Field(None, ge=-90, le=90)
+    location_lon: Optional[float] = Field(None, ge=-180, le=180)
+    location_name: Optional[str] = Field(None, max_length=255)
+    capacity: int = Field(default=1, ge=1)
@@ -17,7 +17,7 @@ class TagResponse(BaseModel):
     id: int
     name: str
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class CreatorResponse(BaseModel):
@@ -29,7 +29,7 @@ class CreatorResponse(BaseModel):
     profile_image_type: Optional[str] = None
     overall_rating: Optional[float] = None
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ParticipantResponse(BaseModel):
@@ -39,7 +39,7 @@ class ParticipantResponse(BaseModel):
     profile_image: Optional[str] = None
     profile_image_type: Optional[str] = None
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class MapPinResponse(BaseModel):
@@ -76,7 +76,7 @@ class MapPinResponse(BaseModel):
         description="Distance from user location in kilometers (if user location provided)"
     )
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class MapFeedResponse(BaseModel):
@@ -3,7 +3,6 @@ Notification schemas for API requests and responses.
 # SRS FR-N.1: Define notification data transfer objects
 """
 from datetime import datetime
-from typing import Optional
 
 from pydantic import BaseModel
 
@@ -19,16 +18,23 @@ class NotificationResponse(BaseModel):
     message: str
     
     # Related entities
-    related_offer_id: Optional[int] = None
-    related_need_id: Optional[int] = None
-    related_user_id: Optional[int] = None
-    related_participant_id: Optional[int] = None
-    related_rating_id: Optional[int] = None
+    related_offer_id: int | None = None
+    related_need_id: int | None = None
+    related_user_id: int | None = None
+    related_participant_id: int | None = None
+    related_rating_id: int | None = None
     
     # Read status
     is_read: bool
     created_at: datetime
-    read_at: Optional[datetime] = None
+    read_at: datetime | None = None
+    
+    model_config = {
+        "from_attributes": True,
+        "use_enum_values": True,
+        "frozen": True,
+        "extra": "ignore",
+    }
 
 
 class NotificationListResponse(BaseModel):
@@ -8,34 +8,27 @@ from pydantic import BaseModel, Field, field_validator
 
 from app.schemas.time_slot import AvailableTimeSlot
 from app.schemas.auth import UserPublic
+from app.schemas.listing import ListingBase
 
 
-class OfferBase(BaseModel):
+class OfferBase(ListingBase):
     """Base schema for Offer with common fields."""
-    title: str = Field(..., min_length=3, max_length=200)
-    description: str = Field(..., min_length=10, max_length=2000)
-    is_remote: bool = False
-    location_lat: Optional[float] = Field(None, ge=-90, le=90)
-    location_lon: Optional[float] = Field(None, ge=-180, le=180)
-    location_name: Optional[str] = Field(None, max_length=255)
-    capacity: int = Field(default=1, ge=1)
     hours: float = Field(default=1.0, gt=0, description="TimeBank hours for this offer")
-    
-    @field_validator('location_lat', 'location_lon', 'location_name')
-    @classmethod
-    def validate_location(cls, v, info):
-        """Validate that non-remote offers have location."""
-        # This will be checked at the model level
-        return v
 
 
 class OfferCreate(OfferBase):
     """Schema for creating a new Offer."""
     tags: list[str] = Field(..., min_length=1, max_length=10)
-    available_slots: Optional[list[AvailableTimeSlot]] = Field(
-        None, 
+    available_slots: list[AvailableTimeSlot] = Field(
+        default_factory=list,
         description="Available time slots grouped by date"
     )
+    
+    @field_validator('available_slots', mode='before')
+    @classmethod
+    def null_slots_to_empty(cls, v):
+        """Accept an explicit null (sent by older clients) as no slots."""
+        return [] if v is None else v
 
 
 class OfferUpdate(BaseModel):
@@ -68,21 +61,21 @@ class OfferResponse(BaseModel):
     title: str
     description: str
     is_remote: bool
-    location_lat: Optional[float]
-    location_lon: Optional[float]
-    location_name: Optional[str]
+    location_lat: float | None
+    location_lon: float | None
+    location_name: str | None
     start_date: datetime
     end_date: datetime
     capacity: int
     accepted_count: int
     hours: float
     status: str
-    available_slots: Optional[list[AvailableTimeSlot]] = None
+    available_slots: list[AvailableTimeSlot] = []
     tags: list[str] = []
     created_at: datetime
     updated_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
 
 
 class OfferListResponse(BaseModel):
@@ -29,21 +29,21 @@ class ParticipantAccept(BaseModel):
 class ParticipantResponse(BaseModel):
     """Schema for Participant response."""
     id: int
-    offer_id: Optional[int]
-    need_id: Optional[int]
+    offer_id: int | None
+    need_id: int | None
     user_id: int
     user: UserPublic
     role: str
     status: str
     hours_contributed: float
-    message: Optional[str]
-    selected_slot: Optional[str]
+    message: str | None
+    selected_slot: str | None
     provider_confirmed: bool = False
     requester_confirmed: bool = False
     created_at: datetime
     updated_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "ignore"}
 
 
 class ParticipantListResponse(BaseModel):
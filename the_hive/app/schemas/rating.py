@@ -11,48 +11,54 @@ Design Philosophy:
 - Encourages constructive feedback
 """
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
 
 # ===== Human-Friendly Rating Labels =====
-# These labels encourage positive framing even for lower ratings
+# These labels encourage positive framing even for lower ratings.
+# Both tables below are read-only; copy them with dict() where a plain dict is needed.
 
-RATING_LABELS = {
+RATING_LABELS = MappingProxyType({
     1: "Needs Improvement",
     2: "Below Expectations",
     3: "Met Expectations",
     4: "Above Expectations",
     5: "Exceptional",
-}
+})
+
+# Same labels indexed by rating value (index 0 is the fallback) for the
+# per-row lookups in rating responses
+_RATING_LABELS_ARR: tuple[str, ...] = ("Unknown",) + tuple(RATING_LABELS[v] for v in range(1, 6))
 
 # Category descriptions for UI display
-CATEGORY_INFO = {
-    "reliability": {
+CATEGORY_INFO = MappingProxyType({
+    "reliability": MappingProxyType({
         "name": "Reliability & Commitment",
         "description": "Did they show up as agreed, communicate clearly, and follow through on commitments?",
         "icon": "schedule",
         "required": True,
-    },
-    "kindness": {
+    }),
+    "kindness": MappingProxyType({
         "name": "Kindness & Respect",
         "description": "Was the interaction warm, respectful, and comfortable?",
         "icon": "favorite",
         "required": True,
-    },
-    "helpfulness": {
+    }),
+    "helpfulness": MappingProxyType({
         "name": "Helpfulness & Support",
         "description": "Did the exchange feel meaningful and genuinely supportive?",
         "icon": "support",
         "required": True,
-    },
-}
+    }),
+})
 
 
 def get_rating_label(value: int) -> str:
     """Get human-friendly label for a rating value."""
-    return RATING_LABELS.get(value, "Unknown")
+    return _RATING_LABELS_ARR[value] if 1 <= value <= 5 else "Unknown"
 
 
 class RatingCreate(BaseModel):
@@ -151,7 +157,7 @@ class RatingResponse(BaseModel):
     comment_is_approved: bool = True
     
     # Visibility status
-    visibility: str
+    visibility: Literal["hidden", "visible"]
     is_visible: bool
     visibility_deadline: datetime
     
@@ -161,34 +167,65 @@ class RatingResponse(BaseModel):
     model_config = {"from_attributes": True}
     
     @classmethod
-    def from_rating(cls, rating, from_username: str = None, to_username: str = None, is_visible: bool = False):
-        """Create response from Rating model with labels."""
-        # Handle visibility - it might be an enum or a string
-        visibility_value = rating.visibility.value if hasattr(rating.visibility, 'value') else str(rating.visibility)
+    def from_rating(
+        cls,
+        rating,
+        from_username: str = None,
+        to_username: str = None,
+        is_visible: bool = False,
+        trusted: bool = True,
+    ):
+        """Create response from Rating model with labels.
         
-        return cls(
-            id=rating.id,
-            from_user_id=rating.from_user_id,
-            from_username=from_username,
-            to_user_id=rating.to_user_id,
-            to_username=to_username,
-            participant_id=rating.participant_id,
-            general_rating=int(rating.general_rating) if isinstance(rating.general_rating, float) else rating.general_rating,
-            general_rating_label=get_rating_label(int(rating.general_rating) if isinstance(rating.general_rating, float) else rating.general_rating),
-            reliability_rating=rating.reliability_rating,
-            reliability_rating_label=get_rating_label(rating.reliability_rating),
-            kindness_rating=rating.kindness_rating,
-            kindness_rating_label=get_rating_label(rating.kindness_rating),
-            helpfulness_rating=rating.helpfulness_rating,
-            helpfulness_rating_label=get_rating_label(rating.helpfulness_rating),
-            average_rating=rating.calculate_average(),
-            public_comment=rating.public_comment if is_visible and rating.comment_is_approved else None,
-            comment_is_approved=rating.comment_is_approved,
-            visibility=visibility_value,
-            is_visible=is_visible,
-            visibility_deadline=rating.visibility_deadline,
-            created_at=rating.created_at,
-        )
+        Ratings loaded from the database are already valid, so by default the
+        response is built with model_construct() and skips validation. Pass
+        trusted=False to validate values that did not come from the ORM.
+        """
+        response = construct_rating_response(rating, from_username, to_username, is_visible)
+        if trusted:
+            return response
+        return cls.model_validate(response.model_dump())
+
+
+def construct_rating_response(
+    rating,
+    from_username: Optional[str],
+    to_username: Optional[str],
+    is_visible: bool,
+) -> RatingResponse:
+    """Build a RatingResponse from a trusted Rating row without validation.
+    
+    Module-level so list endpoints can map it over many rows directly.
+    """
+    # Stored ratings are always 1..5 (validated by RatingCreate), so index directly
+    label = _RATING_LABELS_ARR.__getitem__
+    general_rating = int(rating.general_rating)
+    visibility = rating.visibility
+    
+    return RatingResponse.model_construct(
+        id=rating.id,
+        from_user_id=rating.from_user_id,
+        from_username=from_username,
+        to_user_id=rating.to_user_id,
+        to_username=to_username,
+        participant_id=rating.participant_id,
+        general_rating=general_rating,
+        general_rating_label=label(general_rating),
+        reliability_rating=rating.reliability_rating,
+        reliability_rating_label=label(rating.reliability_rating),
+        kindness_rating=rating.kindness_rating,
+        kindness_rating_label=label(rating.kindness_rating),
+        helpfulness_rating=rating.helpfulness_rating,
+        helpfulness_rating_label=label(rating.helpfulness_rating),
+        average_rating=float(rating.calculate_average()),
+        public_comment=rating.public_comment if is_visible and rating.comment_is_approved else None,
+        comment_is_approved=rating.comment_is_approved,
+        # Visibility might be an enum or a string
+        visibility=visibility.value if hasattr(visibility, 'value') else str(visibility),
+        is_visible=is_visible,
+        visibility_deadline=rating.visibility_deadline,
+        created_at=rating.created_at,
+    )
 
 
 class RatingListResponse(BaseModel):
@@ -204,8 +241,10 @@ class RatingCategoryLabelsResponse(BaseModel):
     Schema returning all category information and rating labels.
     Used by frontend to display rating UI with proper labels.
     """
-    rating_labels: dict[int, str] = RATING_LABELS
-    categories: dict = CATEGORY_INFO
+    rating_labels: dict[int, str] = Field(default_factory=lambda: dict(RATING_LABELS))
+    categories: dict = Field(
+        default_factory=lambda: {key: dict(info) for key, info in CATEGORY_INFO.items()}
+    )
 
 
 class RatingStatusResponse(BaseModel):
@@ -242,7 +281,12 @@ class UserRatingSummary(BaseModel):
     overall_average: Optional[float] = None
     
     # Distribution of general ratings (for display)
-    rating_distribution: dict[int, int] = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+    rating_distribution: list[int] = Field(
+        default_factory=lambda: [0, 0, 0, 0, 0],
+        min_length=5,
+        max_length=5,
+        description="Number of ratings per general score, ordered from 1 to 5 (index 0 is score 1)",
+    )
 
 
 class BlindRatingExplanation(BaseModel):
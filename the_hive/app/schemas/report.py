@@ -89,6 +89,8 @@ class ReportResponse(BaseModel):
     created_at: datetime
     reviewed_at: Optional[datetime] = None
     resolved_at: Optional[datetime] = None
+    
+    model_config = {"use_enum_values": True, "frozen": True, "extra": "ignore"}
 
 
 class ReportListResponse(BaseModel):
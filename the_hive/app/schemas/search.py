@@ -4,7 +4,7 @@ Search schemas for filtering offers and needs.
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, conlist
 
 
 class SearchType(str, Enum):
@@ -33,8 +33,12 @@ class SearchFilters(BaseModel):
     SRS Requirements:
     - FR-8: Search and discovery with semantic tags
     - FR-8.5: Order by distance (placeholder), recency
+    
+    Unknown keys are rejected.
     """
     
+    model_config = {"extra": "forbid"}
+    
     # What to search
     query: Optional[str] = Field(
         None,
@@ -48,15 +52,18 @@ class SearchFilters(BaseModel):
     )
     
     # Tag filters
-    tags: Optional[list[str]] = Field(
+    tags: Optional[conlist(str, min_length=1)] = Field(
         None,
-        min_length=1,
         description="List of tags to filter by"
     )
     tag_match: TagMatchMode = Field(
         default=TagMatchMode.ANY,
         description="Match ANY or ALL tags"
     )
+    semantic: bool = Field(
+        default=True,
+        description="Enable semantic tag expansion (parents/children/synonyms)"
+    )
     
     # Location filters
     is_remote: Optional[bool] = Field(
@@ -92,6 +99,8 @@ class SearchResult(BaseModel):
     
     # Optional relevance score (for future use)
     relevance_score: Optional[float] = None
+    
+    model_config = {"frozen": True, "extra": "ignore"}
 
 
 class SearchResponse(BaseModel):
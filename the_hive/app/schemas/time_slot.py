@@ -1,6 +1,43 @@
-from datetime import datetime, date, time
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import date
+from itertools import pairwise
+
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, field_validator, model_validator
+
+
+def _parse_hhmm(v: str) -> int:
+    """Parse an H:MM/HH:MM (24-hour) time into minutes since midnight.
+    
+    Works on the ASCII bytes directly: the format has fixed positions, so no
+    split() or int() is needed. Raises ValueError for anything else.
+    """
+    b = v.encode("ascii", "replace")
+    if len(b) == 5 and b[2] == 0x3A:  # "HH:MM"
+        digits = (b[0], b[1], b[3], b[4])
+    elif len(b) == 4 and b[1] == 0x3A:  # "H:MM"
+        digits = (0x30, b[0], b[2], b[3])
+    else:
+        raise ValueError("Time must be in HH:MM format (24-hour)")
+    if not all(0x30 <= d <= 0x39 for d in digits):
+        raise ValueError("Time must be in HH:MM format (24-hour)")
+    h1, h2, m1, m2 = (d - 0x30 for d in digits)
+    hour, minute = h1 * 10 + h2, m1 * 10 + m2
+    if hour > 23 or minute > 59:
+        raise ValueError("Time must be in HH:MM format (24-hour)")
+    return hour * 60 + minute
+
+
+def _is_iso_date(v: str) -> bool:
+    """Check for the YYYY-MM-DD shape (not that the date exists)."""
+    return (
+        len(v) == 10
+        and v[4] == "-"
+        and v[7] == "-"
+        and v.isascii()
+        and v[:4].isdigit()
+        and v[5:7].isdigit()
+        and v[8:].isdigit()
+    )
 
 
 class TimeRange(BaseModel):
@@ -10,34 +47,55 @@ class TimeRange(BaseModel):
     """
     start_time: str = Field(
         ..., 
-        pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$",
         description="Start time in HH:MM format (24-hour)"
     )
     end_time: str = Field(
         ..., 
-        pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$",
         description="End time in HH:MM format (24-hour)"
     )
     
+    # Both times as minutes since midnight, set once after validation
+    _start_min: int = PrivateAttr()
+    _end_min: int = PrivateAttr()
+    
+    # Immutable so the cached minute offsets can never go stale
+    model_config = {"frozen": True}
+    
+    @field_validator('start_time', 'end_time')
+    @classmethod
+    def validate_time_format(cls, v):
+        """Ensure the time is in HH:MM format (24-hour)."""
+        _parse_hhmm(v)
+        return v
+    
     @field_validator('end_time')
     @classmethod
     def validate_end_after_start(cls, v, info):
         """Ensure end_time is after start_time"""
         if 'start_time' in info.data:
-            start = info.data['start_time']
-            if v <= start:
+            # Compare as minutes: as strings, "10:00" sorts before "9:00"
+            if _parse_hhmm(v) <= _parse_hhmm(info.data['start_time']):
                 raise ValueError("end_time must be after start_time")
         return v
     
+    @model_validator(mode='after')
+    def parse_minutes(self):
+        """Parse both times into minute offsets once."""
+        self._start_min = _parse_hhmm(self.start_time)
+        self._end_min = _parse_hhmm(self.end_time)
+        return self
+    
+    @classmethod
+    def trusted(cls, start_time: str, end_time: str) -> "TimeRange":
+        """Build a TimeRange from already validated values, skipping validators."""
+        time_range = cls.model_construct(start_time=start_time, end_time=end_time)
+        time_range._start_min = _parse_hhmm(start_time)
+        time_range._end_min = _parse_hhmm(end_time)
+        return time_range
+    
     def duration_minutes(self) -> int:
         """Calculate duration in minutes."""
-        start_hour, start_min = map(int, self.start_time.split(':'))
-        end_hour, end_min = map(int, self.end_time.split(':'))
-        
-        start_total = start_hour * 60 + start_min
-        end_total = end_hour * 60 + end_min
-        
-        return end_total - start_total
+        return self._end_min - self._start_min
 
 
 class AvailableTimeSlot(BaseModel):
@@ -49,7 +107,6 @@ class AvailableTimeSlot(BaseModel):
     """
     date: str = Field(
         ..., 
-        pattern=r"^\d{4}-\d{2}-\d{2}$", 
         description="Date in YYYY-MM-DD format"
     )
     time_ranges: list[TimeRange] = Field(
@@ -58,38 +115,68 @@ class AvailableTimeSlot(BaseModel):
         description="Available time ranges for this date"
     )
     
+    # Parsed date, filled on the first get_date_object() call. Not annotated:
+    # inside the class body "date" names the field, not datetime.date
+    _date_obj = PrivateAttr(default=None)
+    
     @field_validator('date')
     @classmethod
     def validate_date_format(cls, v):
-        """Validate date format and ensure it's not in the past."""
-        try:
-            year, month, day = map(int, v.split('-'))
-            slot_date = date(year, month, day)
-            
-            # Optional: Warn if date is in the past (commented out for flexibility)
-            # if slot_date < date.today():
-            #     raise ValueError(f"Date {v} is in the past")
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid date format: {v}") from e
+        """Validate the date is in YYYY-MM-DD format and a real calendar date."""
+        # fromisoformat also accepts other ISO forms (e.g. "20251201"), so the
+        # shape is checked first; its ValueError (e.g. "day is out of range
+        # for month") is reported by pydantic as-is
+        if not _is_iso_date(v):
+            raise ValueError("Date must be in YYYY-MM-DD format")
+        date.fromisoformat(v)
+        
+        # Optional: Warn if date is in the past (commented out for flexibility)
+        # if date.fromisoformat(v) < date.today():
+        #     raise ValueError(f"Date {v} is in the past")
+        
         return v
     
     @model_validator(mode='after')
     def check_no_overlapping_ranges(self):
         """Ensure time ranges don't overlap."""
-        ranges = self.time_ranges
-        for i in range(len(ranges)):
-            for j in range(i + 1, len(ranges)):
-                # Simple overlap check using string comparison (works for HH:MM format)
-                r1, r2 = ranges[i], ranges[j]
-                # Overlap if: r1.start < r2.end AND r2.start < r1.end
-                if r1.start_time < r2.end_time and r2.start_time < r1.end_time:
-                    raise ValueError(
-                        f"Overlapping time ranges: {r1.start_time}-{r1.end_time} and {r2.start_time}-{r2.end_time}"
-                    )
+        if len(self.time_ranges) < 2:
+            return self
+        # Once sorted by start, only neighbours can overlap
+        ranges = sorted(self.time_ranges, key=lambda r: r._start_min)
+        for r1, r2 in pairwise(ranges):
+            if r2._start_min < r1._end_min:
+                raise ValueError(
+                    f"Overlapping time ranges: {r1.start_time}-{r1.end_time} and {r2.start_time}-{r2.end_time}"
+                )
         return self
     
+    @classmethod
+    def trusted(cls, slot_date: str, time_ranges: list[TimeRange]) -> "AvailableTimeSlot":
+        """Build a slot from already validated values, skipping validators."""
+        return cls.model_construct(date=slot_date, time_ranges=time_ranges)
+    
     def get_date_object(self) -> date:
-        """Convert date string to date object."""
-        year, month, day = map(int, self.date.split('-'))
-        return date(year, month, day)
+        """Convert date string to date object (parsed once per slot)."""
+        if self._date_obj is None:
+            self._date_obj = date.fromisoformat(self.date)
+        return self._date_obj
+
+
+# Built once and reused to parse and serialize whole available_slots lists
+SLOT_LIST_ADAPTER = TypeAdapter(list[AvailableTimeSlot])
+
+
+def load_trusted_slots(raw: str | bytes) -> list[AvailableTimeSlot]:
+    """Rebuild slots stored with SLOT_LIST_ADAPTER.dump_json.
+    
+    Stored slots were validated when they were written, so the overlap and
+    format validators are not run again. Raises ValueError, KeyError or
+    TypeError if the stored JSON is malformed.
+    """
+    return [
+        AvailableTimeSlot.trusted(
+            slot["date"],
+            [TimeRange.trusted(r["start_time"], r["end_time"]) for r in slot["time_ranges"]],
+        )
+        for slot in orjson.loads(raw)
+    ]
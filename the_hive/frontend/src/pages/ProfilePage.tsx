@@ -153,7 +153,7 @@ interface RatingSummary {
   average_kindness: number | null
   average_helpfulness: number | null
   overall_average: number | null
-  rating_distribution: Record<number, number>
+  rating_distribution: number[]  // counts for scores 1-5
 }
 
 // Completed exchange structure
@@ -20,14 +20,22 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-import json
+import importlib
+import pkgutil
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
-from sqlmodel import SQLModel, Session, select, func
-from sqlalchemy import text
+from functools import cache
+from itertools import islice
+from typing import TypedDict
+import orjson
+from sqlmodel import SQLModel, Session, func, select
+from sqlalchemy import Connection, bindparam, case, cast, event, insert, literal, text, update
 
 from app.core.db import engine, check_db_connection
+from app.core.security import get_password_hash
 
-# Import all models to ensure they're registered with SQLModel
+# Models used by the seed; import_all_models() registers the rest for create_tables()
 from app.models import (
     User,
     UserRole,
@@ -47,21 +55,63 @@ from app.models import (
 from app.models.user import UserTag
 from app.models.rating import Rating, RatingVisibility
 from app.models.forum import ForumTopic, ForumComment, ForumTopicTag, TopicType
-from app.models.semantic_tag import SemanticTagSynonym, SemanticTagProperty
 
 
-def create_tables():
-    """Create all database tables."""
+def import_all_models():
+    """Import every module in app.models so all tables are registered.
+    
+    New model files are picked up without editing this script.
+    """
+    import app.models
+    
+    for module in pkgutil.iter_modules(app.models.__path__, "app.models."):
+        importlib.import_module(module.name)
+
+
+# Login passwords for the seeded accounts
+SEED_MODERATOR_PASSWORD = "ModeratorPass123!"
+SEED_USER_PASSWORD = "UserPass123!"
+
+
+@cache
+def _seed_password_hash(password: str) -> str:
+    """Hash a seed password once per process; bcrypt is deliberately slow."""
+    return get_password_hash(password)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL with relaxed syncing so the seed's single commit is cheap on SQLite."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+
+def create_tables(fresh: bool = False):
+    """Create all database tables.
+    
+    Args:
+        fresh: The database is known to be empty (e.g. right after
+               drop_tables()), so skip the per-table existence checks
+    """
     print("Creating database tables...")
-    SQLModel.metadata.create_all(engine)
+    import_all_models()
+    SQLModel.metadata.create_all(engine, checkfirst=not fresh)
     print("✅ All tables created successfully")
 
 
-def drop_tables():
+def drop_tables() -> bool:
     """Drop all database tables.
     
     Uses DROP SCHEMA CASCADE to handle all foreign key dependencies,
     including semantic tag relationships that have complex dependencies.
+    
+    Returns:
+        True if every table was dropped, False if some could not be
     """
     print("Dropping all database tables...")
     # Use CASCADE to drop dependent objects (foreign keys, etc.)
@@ -75,6 +125,7 @@ def drop_tables():
             conn.execute(text("GRANT ALL ON SCHEMA public TO postgres"))
             conn.execute(text("GRANT ALL ON SCHEMA public TO public"))
         print("✅ All tables dropped successfully")
+        return True
     except Exception as e:
         # Fallback: try using drop_all with explicit CASCADE handling
         print(f"⚠️  Schema drop encountered issue: {e}")
@@ -86,15 +137,38 @@ def drop_tables():
                 WHERE schemaname = 'public'
             """))
             tables = [row[0] for row in result]
+            all_dropped = True
             for table in tables:
                 try:
                     conn.execute(text(f'DROP TABLE IF EXISTS "{table}" CASCADE'))
                 except Exception as table_error:
+                    all_dropped = False
                     print(f"   Warning: Could not drop table {table}: {table_error}")
         print("✅ Tables dropped (with some warnings)")
+        return all_dropped
+
+
+class TimeRangeData(TypedDict):
+    """One time range of a seeded slot, shaped like schemas.time_slot.TimeRange."""
+    start_time: str
+    end_time: str
+
+
+class TimeSlotData(TypedDict):
+    """One seeded slot, shaped like schemas.time_slot.AvailableTimeSlot."""
+    date: str
+    time_ranges: list[TimeRangeData]
+
 
+def _time_slot(date: str, *ranges: tuple[str, str]) -> TimeSlotData:
+    """Build one available slot from a date and (start, end) time pairs."""
+    return {
+        "date": date,
+        "time_ranges": [{"start_time": start, "end_time": end} for start, end in ranges],
+    }
 
-def create_time_slots_json(slots_data):
+
+def create_time_slots_json(slots_data: list[TimeSlotData]) -> str:
     """Create time slots JSON string from structured data.
     
     Args:
@@ -102,14 +176,994 @@ def create_time_slots_json(slots_data):
                    Each time_range has 'start_time' and 'end_time'
     
     Returns:
-        JSON string representation of time slots
+        JSON string representation of time slots (compact, as the API stores it)
+    """
+    return orjson.dumps(slots_data).decode()
+
+
+def _bulk_insert(conn: Connection, model, rows: list[dict]) -> list[int]:
+    """Insert rows with one executemany INSERT ... RETURNING id.
+    
+    Each new id is also stored on its row dict under ``"id"``, so foreign keys
+    can be wired without refreshing anything.
+    
+    Returns:
+        The new ids, in the same order as ``rows``
+    """
+    table = model.__table__
+    result = conn.execute(
+        insert(table).returning(table.c.id, sort_by_parameter_order=True), rows
+    )
+    ids = list(result.scalars())
+    for row, row_id in zip(rows, ids):
+        row["id"] = row_id
+    return ids
+
+
+def _copy_rows(table, rows: list[dict], dialect) -> tuple[list[str], list[tuple]]:
+    """Prepare rows for COPY: fill Python-side column defaults and apply bind processing.
+    
+    COPY bypasses SQLAlchemy, so values must already be in the form an INSERT
+    would have sent (e.g. enum names rather than enum members).
+    """
+    columns = [
+        column for column in table.columns
+        if column.name in rows[0]
+        or (column.default is not None and (column.default.is_scalar or column.default.is_callable))
+    ]
+    processors = [column.type.bind_processor(dialect) for column in columns]
+    values = []
+    for row in rows:
+        row_values = []
+        for column, process in zip(columns, processors):
+            if column.name in row:
+                value = row[column.name]
+            elif column.default.is_callable:
+                value = column.default.arg(None)
+            else:
+                value = column.default.arg
+            row_values.append(process(value) if process else value)
+        values.append(tuple(row_values))
+    return [column.name for column in columns], values
+
+
+def _bulk_copy(conn: Connection, model, rows: list[dict]) -> None:
+    """Load rows whose ids are not needed back, with COPY FROM STDIN on PostgreSQL.
+    
+    Other dialects (e.g. SQLite) fall back to one executemany INSERT.
+    """
+    table = model.__table__
+    if conn.dialect.name != "postgresql" or not rows:
+        conn.execute(insert(table), rows)
+        return
+    
+    names, values = _copy_rows(table, rows, conn.dialect)
+    preparer = conn.dialect.identifier_preparer
+    statement = (
+        f"COPY {preparer.format_table(table)} "
+        f"({', '.join(preparer.quote(name) for name in names)}) FROM STDIN"
+    )
+    # Same DBAPI connection as ``conn``, so the COPY runs inside the seed transaction
+    raw = conn.connection.driver_connection
+    with raw.cursor() as cursor, cursor.copy(statement) as copy:
+        for row_values in values:
+            copy.write_row(row_values)
+
+
+def _bulk_update(conn: Connection, model, rows: list[dict], columns: tuple[str, ...]) -> None:
+    """Write ``columns`` of each row dict back by id in a single UPDATE ... CASE statement.
+    
+    Only the given rows are touched (``WHERE id IN (...)``). Values are bound with
+    their column's type, so enums are stored the same way an INSERT stores them,
+    and the CASE is cast back to that type (PostgreSQL will not assign text to
+    a native enum column).
+    """
+    if not rows:
+        return
+    table = model.__table__
+    conn.execute(
+        update(table)
+        .where(table.c.id.in_([row["id"] for row in rows]))
+        .values({
+            column: cast(
+                case(
+                    {row["id"]: literal(row[column], table.c[column].type) for row in rows},
+                    value=table.c.id,
+                ),
+                table.c[column].type,
+            )
+            for column in columns
+        })
+    )
+
+
+def _report(verbose: bool, summary: str, details: Iterable[str]) -> None:
+    """Print one summary line, or all per-row ``details`` in a single write when verbose."""
+    print("\n".join(details) if verbose else summary)
+
+
+def _listing_line(kind: str, row: dict, slots_count: int) -> str:
+    """Describe a seeded offer or need row for verbose output."""
+    slots_info = f", Time Slots: {slots_count}" if row["available_slots"] else ""
+    return f"✅ Created {kind}: {row['title']} (ID: {row['id']}, Capacity: {row['capacity']}{slots_info})"
+
+
+def _tag_link_rows(
+    listings: list[tuple[dict, list[str], int]],
+    id_column: str,
+    tag_by_name: dict[str, int],
+    tag_usage: Counter,
+) -> list[dict]:
+    """Association rows linking each (row, tag names, _) listing to its known tags.
+    
+    Each link is also counted in ``tag_usage`` so usage_count can be bumped in one UPDATE.
+    """
+    link_rows = []
+    for listing, tag_names, _ in listings:
+        for tag_name in tag_names:
+            tag_id = tag_by_name.get(tag_name)
+            if tag_id:
+                link_rows.append({id_column: listing["id"], "tag_id": tag_id})
+                tag_usage[tag_id] += 1
+    return link_rows
+
+
+def _tag_id_for(conn: Connection, tag_by_name: dict[str, int], tag_name: str) -> int:
+    """Return the id of tag ``tag_name``, creating the tag if the seed has not yet."""
+    tag_id = tag_by_name.get(tag_name)
+    if tag_id is None:
+        [tag_id] = _bulk_insert(conn, Tag, [{"name": tag_name}])
+        tag_by_name[tag_name] = tag_id
+    return tag_id
+
+
+def _initial_ledger_row(user_id: int) -> dict:
+    """Ledger row crediting a new user's starting balance (FR-7.1)."""
+    return {
+        "user_id": user_id,
+        "debit": 0.0,
+        "credit": 5.0,
+        "balance": 5.0,
+        "transaction_type": TransactionType.INITIAL,
+        "description": "Initial TimeBank balance",
+    }
+
+
+# Test users (FR-7.1: each starts with 5 hours)
+# All users are located in various neighborhoods of Istanbul, Turkey
+# Each user has a preset avatar and profile tags
+SEED_USERS = (
+    {
+        "email": "alice@example.com",
+        "username": "alice",
+        "full_name": "Ayşe Yılmaz",
+        "description": "Software developer passionate about teaching Python and web development",
+        "location_lat": 41.0082,
+        "location_lon": 28.9784,
+        "location_name": "Beyoğlu, İstanbul",
+        "profile_image": "butterfly",
+        "profile_image_type": "preset",
+        "tags": ["programming", "web development", "python", "teaching"],
+        "social_blog": "https://aysecodes.dev",
+        "social_instagram": "ayse.codes",
+        "social_twitter": "aysecodes",
+    },
+    {
+        "email": "bob@example.com",
+        "username": "bob",
+        "full_name": "Burak Demir",
+        "description": "Carpenter with 15 years of experience. Love helping with home repairs!",
+        "location_lat": 41.0136,
+        "location_lon": 28.9550,
+        "location_name": "Fatih, İstanbul",
+        "profile_image": "bear",
+        "profile_image_type": "preset",
+        "tags": ["carpentry", "home repair", "woodworking", "furniture"],
+        "social_instagram": "burak.woodworks",
+        "social_facebook": "burak.carpenter",
+    },
+    {
+        "email": "carol@example.com",
+        "username": "carol",
+        "full_name": "Ceren Kaya",
+        "description": "Music teacher and performer. Vocal coach for all levels.",
+        "location_lat": 41.0422,
+        "location_lon": 29.0083,
+        "location_name": "Beşiktaş, İstanbul",
+        "profile_image": "bird",
+        "profile_image_type": "preset",
+        "tags": ["music", "singing", "vocal coaching", "performance"],
+        "social_blog": "https://cerensings.com",
+        "social_instagram": "ceren.vocal",
+        "social_twitter": "cerensings",
+        "social_facebook": "cerenmusic",
+    },
+    {
+        "email": "david@example.com",
+        "username": "david",
+        "full_name": "Deniz Çelik",
+        "description": "Professional chef specializing in Turkish cuisine. Cooking classes available!",
+        "location_lat": 40.9923,
+        "location_lon": 29.0230,
+        "location_name": "Kadıköy, İstanbul",
+        "profile_image": "mushroom",
+        "profile_image_type": "preset",
+        "tags": ["cooking", "turkish cuisine", "chef", "meal prep"],
+        "social_instagram": "chef.deniz",
+        "social_facebook": "denizchef",
+    },
+    {
+        "email": "emma@example.com",
+        "username": "emma",
+        "full_name": "Elif Arslan",
+        "description": "Urban gardener and sustainability advocate. Let's grow together!",
+        "location_lat": 41.0766,
+        "location_lon": 29.0310,
+        "location_name": "Sarıyer, İstanbul",
+        "profile_image": "sunflower",
+        "profile_image_type": "preset",
+        "tags": ["gardening", "sustainability", "composting", "plants"],
+        "social_blog": "https://greencityistanbul.blog",
+        "social_instagram": "elif.gardens",
+    },
+    {
+        "email": "frank@example.com",
+        "username": "frank",
+        "full_name": "Fatih Öztürk",
+        "description": "Personal trainer and yoga instructor. Health is wealth!",
+        "location_lat": 40.9632,
+        "location_lon": 29.1009,
+        "location_name": "Maltepe, İstanbul",
+        "profile_image": "fox",
+        "profile_image_type": "preset",
+        "tags": ["fitness", "yoga", "personal training", "wellness"],
+        "social_instagram": "fatih.fitness",
+        "social_twitter": "fitfatih",
+    },
+    {
+        "email": "grace@example.com",
+        "username": "grace",
+        "full_name": "Gül Şahin",
+        "description": "Polyglot offering language tutoring in English, German, and French",
+        "location_lat": 41.0553,
+        "location_lon": 29.0094,
+        "location_name": "Şişli, İstanbul",
+        "profile_image": "owl",
+        "profile_image_type": "preset",
+        "tags": ["languages", "english", "german", "french", "tutoring"],
+        "social_blog": "https://polyglotgul.com",
+        "social_twitter": "gul_polyglot",
+    },
+    {
+        "email": "henry@example.com",
+        "username": "henry",
+        "full_name": "Hakan Yıldız",
+        "description": "IT specialist helping seniors with technology. Patient and friendly!",
+        "location_lat": 41.1087,
+        "location_lon": 29.0259,
+        "location_name": "Beykoz, İstanbul",
+        "profile_image": "turtle",
+        "profile_image_type": "preset",
+        "tags": ["tech support", "computers", "seniors", "patience"],
+    },
+    {
+        "email": "iris@example.com",
+        "username": "iris",
+        "full_name": "İrem Aydın",
+        "description": "Visual artist and art therapist. Let's create something beautiful!",
+        "location_lat": 40.9828,
+        "location_lon": 29.0553,
+        "location_name": "Üsküdar, İstanbul",
+        "profile_image": "flower",
+        "profile_image_type": "preset",
+        "tags": ["art", "painting", "art therapy", "creativity"],
+        "social_instagram": "irem.artistry",
+        "social_facebook": "iremartist",
+    },
+    {
+        "email": "jack@example.com",
+        "username": "jack",
+        "full_name": "Cem Koç",
+        "description": "Bike mechanic and cycling enthusiast. Free bike repairs for the community!",
+        "location_lat": 41.0297,
+        "location_lon": 28.8890,
+        "location_name": "Bakırköy, İstanbul",
+        "profile_image": "bee",
+        "profile_image_type": "preset",
+        "tags": ["bike repair", "cycling", "mechanics", "community"],
+        "social_instagram": "cem.cycles",
+    },
+)
+
+# Tags across various categories
+SEED_TAGS = (
+    {"name": "tutoring", "description": "Educational tutoring services"},
+    {"name": "programming", "description": "Software development and coding help"},
+    {"name": "carpentry", "description": "Woodworking and furniture repair"},
+    {"name": "music", "description": "Music lessons and performances"},
+    {"name": "cooking", "description": "Culinary skills and meal preparation"},
+    {"name": "gardening", "description": "Plant care and landscaping"},
+    {"name": "fitness", "description": "Exercise training and wellness"},
+    {"name": "language", "description": "Foreign language instruction"},
+    {"name": "tech-support", "description": "Computer and technology assistance"},
+    {"name": "art", "description": "Visual arts and creative projects"},
+    {"name": "bike-repair", "description": "Bicycle maintenance and repair"},
+    {"name": "home-repair", "description": "General home maintenance"},
+    {"name": "childcare", "description": "Babysitting and child supervision"},
+    {"name": "pet-care", "description": "Pet sitting and animal care"},
+    {"name": "transportation", "description": "Rides and delivery services"},
+)
+
+# Offers with various configurations. "creator_index" points into SEED_USERS and
+# each time slot is (days from now, (start, end), ...), resolved at seed time.
+SEED_OFFERS = (
+    {
+        "creator_index": 0,  # alice
+        "title": "Python Programming Tutoring",
+        "description": "Offering help with Python basics, web development with Django/Flask, and data science libraries. Perfect for beginners!",
+        "is_remote": True,
+        "capacity": 3,
+        "hours": 2.0,
+        "tags": ["tutoring", "programming"],
+        "time_slots": [
+            (2, ("10:00", "12:00"), ("14:00", "16:00")),
+            (5, ("09:00", "11:00"))
+        ]
+    },
+    {
+        "creator_index": 0,  # alice
+        "title": "Web Development Workshop",
+        "description": "Learn HTML, CSS, and JavaScript in a hands-on workshop format. Bring your laptop!",
+        "is_remote": False,
+        "capacity": 5,
+        "hours": 4.0,
+        "tags": ["tutoring", "programming"],
+        "time_slots": [
+            (7, ("13:00", "17:00"))
+        ]
+    },
+    {
+        "creator_index": 1,  # bob
+        "title": "Furniture Assembly & Repair",
+        "description": "Expert help with IKEA furniture, broken chairs, wobbly tables. I bring my own tools!",
+        "is_remote": False,
+        "capacity": 2,
+        "hours": 2.0,
+        "tags": ["carpentry", "home-repair"],
+    },
+    {
+        "creator_index": 1,  # bob
+        "title": "Basic Carpentry Skills Workshop",
+        "description": "Learn to use basic tools safely and build a simple wooden project to take home.",
+        "is_remote": False,
+        "capacity": 4,
+        "hours": 3.0,
+        "tags": ["carpentry", "tutoring"],
+        "time_slots": [
+            (3, ("10:00", "13:00")),
+            (10, ("10:00", "13:00"))
+        ]
+    },
+    {
+        "creator_index": 2,  # carol
+        "title": "Vocal Coaching Sessions",
+        "description": "One-on-one or small group vocal coaching. All styles welcome: pop, classical, jazz.",
+        "is_remote": True,
+        "capacity": 2,
+        "hours": 1.0,
+        "tags": ["music", "tutoring"],
+        "time_slots": [
+            (1, ("15:00", "16:00"), ("16:30", "17:30")),
+            (4, ("15:00", "16:00"), ("17:00", "18:00"))
+        ]
+    },
+    {
+        "creator_index": 2,  # carol
+        "title": "Community Choir - Join Us!",
+        "description": "Weekly choir practice open to all. No experience necessary, just bring enthusiasm!",
+        "is_remote": False,
+        "capacity": 5,
+        "hours": 2.0,
+        "tags": ["music"],
+    },
+    {
+        "creator_index": 3,  # david
+        "title": "Turkish Cooking Class",
+        "description": "Learn to make authentic Turkish dishes like mantı and börek from scratch. Ingredients provided, bring containers for leftovers!",
+        "is_remote": False,
+        "capacity": 4,
+        "hours": 3.0,
+        "tags": ["cooking", "tutoring"],
+    },
+    {
+        "creator_index": 3,  # david
+        "title": "Meal Prep for Busy People",
+        "description": "I'll help you plan and prepare healthy meals for the week. Your kitchen or mine!",
+        "is_remote": False,
+        "capacity": 2,
+        "hours": 3.0,
+        "tags": ["cooking"],
+    },
+    {
+        "creator_index": 4,  # emma
+        "title": "Urban Garden Setup Help",
+        "description": "I'll help you start a balcony or backyard garden. Advice on containers, soil, and plant selection.",
+        "is_remote": False,
+        "capacity": 3,
+        "hours": 2.0,
+        "tags": ["gardening"],
+    },
+    {
+        "creator_index": 4,  # emma
+        "title": "Composting Workshop",
+        "description": "Learn how to compost at home and reduce kitchen waste. Small-space solutions included!",
+        "is_remote": True,
+        "capacity": 5,
+        "hours": 2.0,
+        "tags": ["gardening"],
+    },
+    {
+        "creator_index": 5,  # frank
+        "title": "Personal Training Sessions",
+        "description": "Customized workout plans and motivation. Meet at the park or your home gym.",
+        "is_remote": False,
+        "capacity": 3,
+        "hours": 1.0,
+        "tags": ["fitness"],
+    },
+    {
+        "creator_index": 5,  # frank
+        "title": "Beginner Yoga Classes",
+        "description": "Gentle yoga for flexibility and stress relief. Virtual or in-person options available.",
+        "is_remote": True,
+        "capacity": 5,
+        "hours": 1.0,
+        "tags": ["fitness"],
+    },
+    {
+        "creator_index": 6,  # grace
+        "title": "Spanish Conversation Practice",
+        "description": "Practice conversational Spanish with a native speaker. All levels welcome!",
+        "is_remote": True,
+        "capacity": 4,
+        "hours": 1.0,
+        "tags": ["language", "tutoring"],
+    },
+    {
+        "creator_index": 7,  # henry
+        "title": "Tech Help for Seniors",
+        "description": "Patient help with smartphones, tablets, email, video calls. I come to you!",
+        "is_remote": False,
+        "capacity": 2,
+        "hours": 2.0,
+        "tags": ["tech-support"],
+    },
+    {
+        "creator_index": 9,  # jack
+        "title": "Free Bike Tune-Ups",
+        "description": "Basic maintenance: brakes, gears, tire pressure, chain lubrication. Bring your bike!",
+        "is_remote": False,
+        "capacity": 5,
+        "hours": 1.0,
+        "tags": ["bike-repair"],
+    },
+)
+
+# Needs, in the same shape as SEED_OFFERS
+SEED_NEEDS = (
+    {
+        "creator_index": 7,  # henry
+        "title": "Help Moving Furniture",
+        "description": "Need help moving a couch and bookshelf to my new apartment. Second floor, no elevator.",
+        "is_remote": False,
+        "capacity": 2,
+        "hours": 3.0,
+        "tags": ["home-repair", "transportation"],
+        "time_slots": [
+            (6, ("09:00", "12:00"), ("13:00", "16:00"))
+        ]
+    },
+    {
+        "creator_index": 8,  # iris
+        "title": "Website Design Help",
+        "description": "Need someone to help design a portfolio website for my art. I have content ready!",
+        "is_remote": True,
+        "capacity": 1,
+        "hours": 4.0,
+        "tags": ["programming"],
+        "time_slots": [
+            (2, ("18:00", "20:00")),
+            (9, ("18:00", "20:00"))
+        ]
+    },
+    {
+        "creator_index": 9,  # jack
+        "title": "Dog Walking Partner",
+        "description": "Looking for someone to walk my energetic golden retriever 2-3 times per week.",
+        "is_remote": False,
+        "capacity": 1,
+        "hours": 1.0,
+        "tags": ["pet-care"],
+        "time_slots": [
+            (1, ("07:00", "08:00"), ("17:00", "18:00")),
+            (3, ("07:00", "08:00"), ("17:00", "18:00"))
+        ]
+    },
+    {
+        "creator_index": 0,  # alice
+        "title": "Guitar Lessons Needed",
+        "description": "Beginner looking to learn acoustic guitar. Prefer in-person lessons.",
+        "is_remote": False,
+        "capacity": 1,
+        "hours": 2.0,
+        "tags": ["music", "tutoring"],
+    },
+    {
+        "creator_index": 1,  # bob
+        "title": "Garden Design Consultation",
+        "description": "Need advice on redesigning my backyard garden. What should I plant in shady areas?",
+        "is_remote": False,
+        "capacity": 1,
+        "hours": 2.0,
+        "tags": ["gardening"],
+    },
+    {
+        "creator_index": 3,  # david
+        "title": "Spanish Language Partner",
+        "description": "Looking for conversation practice in Spanish. I'm at intermediate level.",
+        "is_remote": True,
+        "capacity": 1,
+        "hours": 1.0,
+        "tags": ["language"],
+    },
+    {
+        "creator_index": 4,  # emma
+        "title": "Yoga Partner Wanted",
+        "description": "Looking for someone to practice yoga with in the park on weekends.",
+        "is_remote": False,
+        "capacity": 2,
+        "hours": 1.0,
+        "tags": ["fitness"],
+        "time_slots": [
+            (5, ("08:00", "09:00")),
+            (12, ("08:00", "09:00"))
+        ]
+    },
+    {
+        "creator_index": 5,  # frank
+        "title": "Help with Resume Writing",
+        "description": "Career change ahead! Need help updating my resume and cover letter.",
+        "is_remote": True,
+        "capacity": 1,
+        "hours": 2.0,
+        "tags": ["tutoring"],
+    },
+    {
+        "creator_index": 6,  # grace
+        "title": "Photography Session",
+        "description": "Need professional photos for my language tutoring website. Outdoor session preferred.",
+        "is_remote": False,
+        "capacity": 1,
+        "hours": 2.0,
+        "tags": ["art"],
+    },
+    {
+        "creator_index": 2,  # carol
+        "title": "Piano Tuning Service",
+        "description": "My upright piano hasn't been tuned in years. Looking for an expert!",
+        "is_remote": False,
+        "capacity": 1,
+        "hours": 2.0,
+        "tags": ["music"],
+    },
+    {
+        "creator_index": 8,  # iris
+        "title": "Childcare for Art Classes",
+        "description": "Need someone to watch my 5-year-old while I teach evening art classes, 2 hours/session.",
+        "is_remote": False,
+        "capacity": 1,
+        "hours": 2.0,
+        "tags": ["childcare"],
+    },
+    {
+        "creator_index": 7,  # henry
+        "title": "Car Ride to Airport",
+        "description": "Need a ride to the airport next week, early morning departure.",
+        "is_remote": False,
+        "capacity": 1,
+        "hours": 1.0,
+        "tags": ["transportation"],
+    },
+)
+
+# Applications for the seeded listings; user/offer/need indexes point into the
+# seeded rows. The first five are the completed exchanges the ledger and rating
+# sections below refer to, in this order.
+SEED_PARTICIPANTS = (
+    # ===== COMPLETED EXCHANGES (with ratings and ledger entries) =====
+    # 1. Alice completed Bob's carpentry workshop (Alice REQUESTER, Bob PROVIDER)
+    # Bob offered to teach carpentry, Alice learned from him
+    {
+        "user_index": 0,  # Alice
+        "offer_index": 3,  # Basic Carpentry Skills Workshop (Bob's offer)
+        "role": ParticipantRole.REQUESTER,  # Alice is requesting to learn
+        "status": ParticipantStatus.COMPLETED,
+        "message": "I'd love to learn basic carpentry! I'm free on weekends.",
+        "hours_contributed": 2.0,
+        "confirmed": True,
+    },
+    # 2. Frank completed Emma's composting workshop (Frank REQUESTER, Emma PROVIDER)
+    {
+        "user_index": 5,  # Frank
+        "offer_index": 9,  # Composting Workshop (Emma's offer)
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.COMPLETED,
+        "message": "Perfect timing! I've been wanting to start composting.",
+        "hours_contributed": 1.5,
+        "confirmed": True,
+    },
+    # 3. Bob helped Henry move furniture (Bob PROVIDER, Henry REQUESTER)
+    {
+        "user_index": 1,  # Bob
+        "need_index": 0,  # Help Moving Furniture (Henry's need)
+        "role": ParticipantRole.PROVIDER,
+        "status": ParticipantStatus.COMPLETED,
+        "message": "I can help with the move! I have experience and a dolly for heavy items.",
+        "hours_contributed": 3.0,
+        "confirmed": True,
+    },
+    # 4. Carol learned Spanish from Grace (Carol REQUESTER, Grace PROVIDER)
+    # Carol completed Grace's Spanish Conversation Practice offer
+    {
+        "user_index": 2,  # Carol
+        "offer_index": 12,  # Spanish Conversation Practice (Grace's offer)
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.COMPLETED,
+        "message": "I'd love to improve my Spanish conversation skills!",
+        "hours_contributed": 1.0,
+        "confirmed": True,
+    },
+    # 5. Alice helped Iris with website design (Alice PROVIDER, Iris REQUESTER)
+    {
+        "user_index": 0,  # Alice
+        "need_index": 1,  # Website Design Help (Iris's need)
+        "role": ParticipantRole.PROVIDER,
+        "status": ParticipantStatus.COMPLETED,
+        "message": "I'd be happy to help with your portfolio site! I have web dev experience.",
+        "hours_contributed": 4.0,
+        "confirmed": True,
+    },
+    # ===== PENDING/ACCEPTED EXCHANGES (not yet completed) =====
+    # PYTHON TUTORING (Alice's offer) - Capacity 3 - FULL with 3 ACCEPTED
+    {
+        "user_index": 6,  # Grace
+        "offer_index": 0,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "I'm interested in learning Python for data analysis!",
+        "hours_contributed": 2.0,
+    },
+    {
+        "user_index": 3,  # David
+        "offer_index": 0,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Would love to learn Python web development!",
+        "hours_contributed": 2.0,
+    },
+    {
+        "user_index": 5,  # Frank
+        "offer_index": 0,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Interested in data science with Python!",
+        "hours_contributed": 2.0,
+    },
+    # WEB DEVELOPMENT WORKSHOP (Alice's offer) - Capacity 5 - 2 ACCEPTED
+    {
+        "user_index": 7,  # Henry
+        "offer_index": 1,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Excited to learn web development!",
+        "hours_contributed": 4.0,
+    },
+    {
+        "user_index": 9,  # Jack
+        "offer_index": 1,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "I want to build my own website!",
+        "hours_contributed": 4.0,
+    },
+    # TURKISH COOKING CLASS (David's offer) - Capacity 4 - 1 PENDING, 2 ACCEPTED
+    {
+        "user_index": 2,  # Carol
+        "offer_index": 6,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.PENDING,
+        "message": "This sounds amazing! I love Turkish food!",
+    },
+    {
+        "user_index": 8,  # Iris
+        "offer_index": 6,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Can't wait to learn authentic Turkish recipes!",
+        "hours_contributed": 3.0,
+    },
+    {
+        "user_index": 0,  # Alice
+        "offer_index": 6,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Turkish cuisine looks delicious!",
+        "hours_contributed": 3.0,
+    },
+    # SPANISH CONVERSATION (Grace's offer) - Capacity 4 - Already has 1 COMPLETED (Carol)
+    # Adding 3 more ACCEPTED to make it FULL (4/4 total)
+    {
+        "user_index": 3,  # David
+        "offer_index": 12,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Looking to practice Spanish conversation!",
+        "hours_contributed": 1.0,
+    },
+    {
+        "user_index": 1,  # Bob
+        "offer_index": 12,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "I need to improve my Spanish skills!",
+        "hours_contributed": 1.0,
+    },
+    {
+        "user_index": 4,  # Emma
+        "offer_index": 12,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Would love to practice with a native speaker!",
+        "hours_contributed": 1.0,
+    },
+    # BIKE TUNE-UPS (Jack's offer) - Capacity 5 - 3 ACCEPTED
+    {
+        "user_index": 2,  # Carol
+        "offer_index": 14,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "My bike needs some maintenance!",
+        "hours_contributed": 1.0,
+    },
+    {
+        "user_index": 6,  # Grace
+        "offer_index": 14,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Great! My chain has been squeaking.",
+        "hours_contributed": 1.0,
+    },
+    {
+        "user_index": 4,  # Emma
+        "offer_index": 14,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Perfect timing, my brakes need adjustment!",
+        "hours_contributed": 1.0,
+    },
+    # VOCAL COACHING (Carol's offer) - Capacity 2 - 1 ACCEPTED
+    {
+        "user_index": 7,  # Henry
+        "offer_index": 4,
+        "role": ParticipantRole.REQUESTER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Would love to improve my singing!",
+        "hours_contributed": 1.0,
+    },
+    # GUITAR LESSONS NEEDED (Alice's need) - Capacity 1 - 1 PENDING
+    {
+        "user_index": 2,  # Carol
+        "need_index": 3,
+        "role": ParticipantRole.PROVIDER,
+        "status": ParticipantStatus.PENDING,
+        "message": "I can teach you guitar! I've been playing for 10 years.",
+    },
+    # DOG WALKING (Jack's need) - Capacity 1 - 1 ACCEPTED
+    {
+        "user_index": 3,  # David
+        "need_index": 2,
+        "role": ParticipantRole.PROVIDER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "I'd be happy to help walk your dog!",
+        "hours_contributed": 1.0,
+    },
+    # CHILDCARE (Iris's need) - Capacity 1 - 1 ACCEPTED
+    {
+        "user_index": 3,  # David
+        "need_index": 10,
+        "role": ParticipantRole.PROVIDER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "I have experience with kids and would love to help!",
+        "hours_contributed": 2.0,
+    },
+    # YOGA PARTNER (Emma's need) - Capacity 2 - 2 ACCEPTED (FULL)
+    {
+        "user_index": 5,  # Frank
+        "need_index": 6,
+        "role": ParticipantRole.PROVIDER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "I'd love to practice yoga together in the park!",
+        "hours_contributed": 1.0,
+    },
+    {
+        "user_index": 6,  # Grace
+        "need_index": 6,
+        "role": ParticipantRole.PROVIDER,
+        "status": ParticipantStatus.ACCEPTED,
+        "message": "Count me in! Yoga in nature sounds perfect!",
+        "hours_contributed": 1.0,
+    },
+)
+
+# Forum comments; topic_index follows the order the topics are created in
+# seed_basic_data (topic1, topic2, topic3, event1, topic5, topic6)
+SEED_FORUM_COMMENTS = (
+    {
+        "topic_index": 0,
+        "author_index": 1,  # Bob
+        "content": "Welcome everyone! Excited to be part of this community. Looking forward to learning and sharing skills!",
+    },
+    {
+        "topic_index": 0,
+        "author_index": 2,  # Carol
+        "content": "This is such a great initiative! The time-banking concept really resonates with me.",
+    },
+    {
+        "topic_index": 0,
+        "author_index": 3,  # David
+        "content": "Happy to be here! 👋 If anyone needs help with home repairs or carpentry, check out my offers!",
+    },
+    {
+        "topic_index": 1,
+        "author_index": 4,  # Emma
+        "content": "Great tips! I'd add: take photos during the exchange (with permission) - they help with ratings and make nice memories!",
+    },
+    {
+        "topic_index": 3,
+        "author_index": 6,  # Grace
+        "content": "I'll be there! Should I bring any specific tools?",
+    },
+    {
+        "topic_index": 3,
+        "author_index": 4,  # Emma (reply)
+        "content": "@Grace No need! We have all the tools. Just bring yourself and some enthusiasm! 🌱",
+    },
+)
+
+
+def _iter_user_rows(password_hash: str) -> Iterator[dict]:
+    """Yield a users-table row for each SEED_USERS entry.
+    
+    Every row carries the same keys, as an executemany INSERT requires.
+    """
+    for user_data in SEED_USERS:
+        yield {
+            "email": user_data["email"],
+            "username": user_data["username"],
+            "password_hash": password_hash,
+            "full_name": user_data["full_name"],
+            "description": user_data["description"],
+            "role": UserRole.USER,
+            "balance": 5.0,  # SRS: starting balance
+            "location_lat": user_data["location_lat"],
+            "location_lon": user_data["location_lon"],
+            "location_name": user_data["location_name"],
+            "profile_image_ref": user_data.get("profile_image"),
+            "profile_image_type": user_data.get("profile_image_type", "preset"),
+            "social_blog": user_data.get("social_blog"),
+            "social_instagram": user_data.get("social_instagram"),
+            "social_facebook": user_data.get("social_facebook"),
+            "social_twitter": user_data.get("social_twitter"),
+            "is_active": True,
+        }
+
+
+def _iter_listing_rows(
+    specs: tuple[dict, ...],
+    users: list[dict],
+    status: OfferStatus | NeedStatus,
+    start_date: datetime,
+    end_date: datetime,
+    slot_dates: dict[int, str],
+) -> Iterator[tuple[dict, list[str], int]]:
+    """Yield (row, tag names, slot count) for each SEED_OFFERS or SEED_NEEDS spec.
+    
+    In-person listings copy their creator's location; remote ones have none.
+    The slot count is kept so log lines do not have to parse the JSON back.
+    """
+    user_locations = [
+        (user["location_lat"], user["location_lon"], user["location_name"]) for user in users
+    ]
+    no_location = (None, None, None)
+    
+    for spec in specs:
+        creator_index = spec["creator_index"]
+        location_lat, location_lon, location_name = (
+            no_location if spec["is_remote"] else user_locations[creator_index]
+        )
+        
+        # Convert time slots to JSON if present
+        available_slots_json = None
+        slots_count = 0
+        if "time_slots" in spec:
+            available_slots_json = create_time_slots_json([
+                _time_slot(slot_dates[days], *time_ranges)
+                for days, *time_ranges in spec["time_slots"]
+            ])
+            slots_count = len(spec["time_slots"])
+        
+        row = {
+            "creator_id": users[creator_index]["id"],
+            "title": spec["title"],
+            "description": spec["description"],
+            "is_remote": spec["is_remote"],
+            "location_lat": location_lat,
+            "location_lon": location_lon,
+            "location_name": location_name,
+            "start_date": start_date,
+            "end_date": end_date,
+            "capacity": spec["capacity"],
+            "hours": spec.get("hours", 1.0),
+            "accepted_count": 0,
+            "status": status,
+            "available_slots": available_slots_json,
+        }
+        yield row, spec["tags"], slots_count
+
+
+def _iter_participant_rows(
+    users: list[dict],
+    offers: list[tuple[dict, list[str], int]],
+    needs: list[tuple[dict, list[str], int]],
+) -> Iterator[dict]:
+    """Yield a participants-table row for each SEED_PARTICIPANTS entry.
+    
+    Every row carries the same keys, as an executemany INSERT requires.
     """
-    return json.dumps(slots_data)
+    for spec in SEED_PARTICIPANTS:
+        confirmed = spec.get("confirmed", False)
+        yield {
+            "user_id": users[spec["user_index"]]["id"],
+            "offer_id": offers[spec["offer_index"]][0]["id"] if "offer_index" in spec else None,
+            "need_id": needs[spec["need_index"]][0]["id"] if "need_index" in spec else None,
+            "role": spec["role"],
+            "status": spec["status"],
+            "message": spec["message"],
+            "hours_contributed": spec.get("hours_contributed", 0.0),
+            "provider_confirmed": confirmed,
+            "requester_confirmed": confirmed,
+        }
+
 
+def _iter_forum_comment_rows(topics: list[ForumTopic], users: list[dict]) -> Iterator[dict]:
+    """Yield a forum_comments-table row for each SEED_FORUM_COMMENTS entry."""
+    for spec in SEED_FORUM_COMMENTS:
+        yield {
+            "topic_id": topics[spec["topic_index"]].id,
+            "author_id": users[spec["author_index"]]["id"],
+            "content": spec["content"],
+            "is_approved": True,
+            "is_visible": True,
+        }
 
-def seed_basic_data():
+
+def seed_basic_data(verbose: bool = False):
     """Seed database with comprehensive test data.
     
+    Args:
+        verbose: Print one line per created user, tag, offer and need instead
+                 of a single summary line per entity type
+    
     Creates:
     - 10 test users with 5 hour starting balance each
     - 15 tags across various categories
@@ -117,1200 +1171,324 @@ def seed_basic_data():
     - 12 needs with various configurations
     - Participants/applications for handshake workflow
     - Ratings for completed exchanges
+    
+    Safe to re-run: a database that already holds the seed is left untouched,
+    and a run that fails part-way is rolled back as a whole.
     """
     print("\nSeeding comprehensive test data...")
     
-    with Session(engine) as session:
+    # A single "now" keeps every seeded timestamp and slot date consistent
+    now = datetime.utcnow()
+    end_default = now + timedelta(days=14)  # offers/needs run for 2 weeks
+    slot_dates = {
+        days: (now + timedelta(days=days)).strftime("%Y-%m-%d") for days in range(1, 15)
+    }
+    
+    # One transaction for the whole seed: a single commit (and fsync) at the
+    # end, and a failed run rolls back instead of leaving a partial seed.
+    # Bulk rows go straight through Core on ``conn``; the ORM session joins the
+    # same transaction only for the hand-written participant/rating/forum objects.
+    with engine.begin() as conn, Session(bind=conn) as session:
         # Check if data already exists
-        existing_user = session.exec(select(User).where(User.username == "alice")).first()
-        if existing_user:
+        already_seeded = conn.scalar(
+            select(literal(1)).select_from(User).where(User.username == "alice").limit(1)
+        )
+        if already_seeded:
             print("\n⚠️  Database already contains seed data. Skipping seed process.")
-            print("   To reseed, drop and recreate the database first.")
+            print("   To reseed, run: python scripts/init_db.py --reset")
             return
         
         # Create moderator user first (with role=MODERATOR)
-        from app.core.security import get_password_hash
-        moderator = User(
-            email="moderator@thehive.com",
-            username="moderator",
-            password_hash=get_password_hash("ModeratorPass123!"),
-            full_name="System Moderator",
-            description="Platform moderator responsible for content review and user safety",
-            role=UserRole.MODERATOR,
-            balance=5.0,
-            location_lat=41.0082,
-            location_lon=28.9784,
-            location_name="İstanbul, Turkey",
-            profile_image="owl",
-            profile_image_type="preset",
-            is_active=True,
-        )
-        session.add(moderator)
-        session.commit()
-        session.refresh(moderator)
-        
-        # Create initial ledger entry for moderator
-        moderator_ledger = LedgerEntry(
-            user_id=moderator.id,
-            debit=0.0,
-            credit=5.0,
-            balance=5.0,
-            transaction_type=TransactionType.INITIAL,
-            description="Initial TimeBank balance",
-        )
-        session.add(moderator_ledger)
-        session.commit()
-        
-        print(f"✅ Created MODERATOR: {moderator.username} (ID: {moderator.id}, Role: {moderator.role})")
+        moderator = {
+            "email": "moderator@thehive.com",
+            "username": "moderator",
+            "password_hash": _seed_password_hash(SEED_MODERATOR_PASSWORD),
+            "full_name": "System Moderator",
+            "description": "Platform moderator responsible for content review and user safety",
+            "role": UserRole.MODERATOR,
+            "balance": 5.0,
+            "location_lat": 41.0082,
+            "location_lon": 28.9784,
+            "location_name": "İstanbul, Turkey",
+            "profile_image_ref": "owl",
+            "profile_image_type": "preset",
+            "is_active": True,
+        }
+        _bulk_insert(conn, User, [moderator])
+        
+        # Initial ledger entry for moderator; inserted together with the users' entries below
+        ledger_rows = [_initial_ledger_row(moderator["id"])]
+        
+        print(f"✅ Created MODERATOR: {moderator['username']} (ID: {moderator['id']}, Role: {moderator['role']})")
         print(f"   📧 Email: moderator@thehive.com")
-        print(f"   🔑 Password: ModeratorPass123!")
+        print(f"   🔑 Password: {SEED_MODERATOR_PASSWORD}")
         print()
         
         # Create test users (FR-7.1: each starts with 5 hours)
-        # All users are located in various neighborhoods of Istanbul, Turkey
-        # Each user has a preset avatar and profile tags
-        users_data = [
-            {
-                "email": "alice@example.com",
-                "username": "alice",
-                "full_name": "Ayşe Yılmaz",
-                "description": "Software developer passionate about teaching Python and web development",
-                "location_lat": 41.0082,
-                "location_lon": 28.9784,
-                "location_name": "Beyoğlu, İstanbul",
-                "profile_image": "butterfly",
-                "profile_image_type": "preset",
-                "tags": ["programming", "web development", "python", "teaching"],
-                "social_blog": "https://aysecodes.dev",
-                "social_instagram": "ayse.codes",
-                "social_twitter": "aysecodes",
-            },
-            {
-                "email": "bob@example.com",
-                "username": "bob",
-                "full_name": "Burak Demir",
-                "description": "Carpenter with 15 years of experience. Love helping with home repairs!",
-                "location_lat": 41.0136,
-                "location_lon": 28.9550,
-                "location_name": "Fatih, İstanbul",
-                "profile_image": "bear",
-                "profile_image_type": "preset",
-                "tags": ["carpentry", "home repair", "woodworking", "furniture"],
-                "social_instagram": "burak.woodworks",
-                "social_facebook": "burak.carpenter",
-            },
-            {
-                "email": "carol@example.com",
-                "username": "carol",
-                "full_name": "Ceren Kaya",
-                "description": "Music teacher and performer. Vocal coach for all levels.",
-                "location_lat": 41.0422,
-                "location_lon": 29.0083,
-                "location_name": "Beşiktaş, İstanbul",
-                "profile_image": "bird",
-                "profile_image_type": "preset",
-                "tags": ["music", "singing", "vocal coaching", "performance"],
-                "social_blog": "https://cerensings.com",
-                "social_instagram": "ceren.vocal",
-                "social_twitter": "cerensings",
-                "social_facebook": "cerenmusic",
-            },
-            {
-                "email": "david@example.com",
-                "username": "david",
-                "full_name": "Deniz Çelik",
-                "description": "Professional chef specializing in Turkish cuisine. Cooking classes available!",
-                "location_lat": 40.9923,
-                "location_lon": 29.0230,
-                "location_name": "Kadıköy, İstanbul",
-                "profile_image": "mushroom",
-                "profile_image_type": "preset",
-                "tags": ["cooking", "turkish cuisine", "chef", "meal prep"],
-                "social_instagram": "chef.deniz",
-                "social_facebook": "denizchef",
-            },
-            {
-                "email": "emma@example.com",
-                "username": "emma",
-                "full_name": "Elif Arslan",
-                "description": "Urban gardener and sustainability advocate. Let's grow together!",
-                "location_lat": 41.0766,
-                "location_lon": 29.0310,
-                "location_name": "Sarıyer, İstanbul",
-                "profile_image": "sunflower",
-                "profile_image_type": "preset",
-                "tags": ["gardening", "sustainability", "composting", "plants"],
-                "social_blog": "https://greencityistanbul.blog",
-                "social_instagram": "elif.gardens",
-            },
-            {
-                "email": "frank@example.com",
-                "username": "frank",
-                "full_name": "Fatih Öztürk",
-                "description": "Personal trainer and yoga instructor. Health is wealth!",
-                "location_lat": 40.9632,
-                "location_lon": 29.1009,
-                "location_name": "Maltepe, İstanbul",
-                "profile_image": "fox",
-                "profile_image_type": "preset",
-                "tags": ["fitness", "yoga", "personal training", "wellness"],
-                "social_instagram": "fatih.fitness",
-                "social_twitter": "fitfatih",
-            },
-            {
-                "email": "grace@example.com",
-                "username": "grace",
-                "full_name": "Gül Şahin",
-                "description": "Polyglot offering language tutoring in English, German, and French",
-                "location_lat": 41.0553,
-                "location_lon": 29.0094,
-                "location_name": "Şişli, İstanbul",
-                "profile_image": "owl",
-                "profile_image_type": "preset",
-                "tags": ["languages", "english", "german", "french", "tutoring"],
-                "social_blog": "https://polyglotgul.com",
-                "social_twitter": "gul_polyglot",
-            },
-            {
-                "email": "henry@example.com",
-                "username": "henry",
-                "full_name": "Hakan Yıldız",
-                "description": "IT specialist helping seniors with technology. Patient and friendly!",
-                "location_lat": 41.1087,
-                "location_lon": 29.0259,
-                "location_name": "Beykoz, İstanbul",
-                "profile_image": "turtle",
-                "profile_image_type": "preset",
-                "tags": ["tech support", "computers", "seniors", "patience"],
-            },
-            {
-                "email": "iris@example.com",
-                "username": "iris",
-                "full_name": "İrem Aydın",
-                "description": "Visual artist and art therapist. Let's create something beautiful!",
-                "location_lat": 40.9828,
-                "location_lon": 29.0553,
-                "location_name": "Üsküdar, İstanbul",
-                "profile_image": "flower",
-                "profile_image_type": "preset",
-                "tags": ["art", "painting", "art therapy", "creativity"],
-                "social_instagram": "irem.artistry",
-                "social_facebook": "iremartist",
-            },
-            {
-                "email": "jack@example.com",
-                "username": "jack",
-                "full_name": "Cem Koç",
-                "description": "Bike mechanic and cycling enthusiast. Free bike repairs for the community!",
-                "location_lat": 41.0297,
-                "location_lon": 28.8890,
-                "location_name": "Bakırköy, İstanbul",
-                "profile_image": "bee",
-                "profile_image_type": "preset",
-                "tags": ["bike repair", "cycling", "mechanics", "community"],
-                "social_instagram": "cem.cycles",
-            },
-        ]
-        
-        users = []
-        users_with_tags = []
         # Hash password once for all regular users
-        regular_user_password_hash = get_password_hash("UserPass123!")
-        for user_data in users_data:
-            user = User(
-                email=user_data["email"],
-                username=user_data["username"],
-                password_hash=regular_user_password_hash,  # password: "UserPass123!"
-                full_name=user_data["full_name"],
-                description=user_data["description"],
-                role=UserRole.USER,
-                balance=5.0,  # SRS: starting balance
-                location_lat=user_data["location_lat"],
-                location_lon=user_data["location_lon"],
-                location_name=user_data["location_name"],
-                profile_image=user_data.get("profile_image"),
-                profile_image_type=user_data.get("profile_image_type", "preset"),
-                social_blog=user_data.get("social_blog"),
-                social_instagram=user_data.get("social_instagram"),
-                social_facebook=user_data.get("social_facebook"),
-                social_twitter=user_data.get("social_twitter"),
-                is_active=True,
-            )
-            session.add(user)
-            users.append(user)
-            users_with_tags.append((user, user_data.get("tags", [])))
-        
-        session.commit()
+        regular_user_password_hash = _seed_password_hash(SEED_USER_PASSWORD)
+        users_rows = list(_iter_user_rows(regular_user_password_hash))
+        _bulk_insert(conn, User, users_rows)
+        
+        # The row dicts (now carrying ids) stand in for ORM instances below;
+        # balance changes are written back with one UPDATE after the ledger.
+        users = users_rows
+        users_with_tags = [
+            (user, user_data.get("tags", [])) for user, user_data in zip(users, SEED_USERS)
+        ]
         
         # Create initial ledger entries and user tags for all users
+        user_tag_rows = []
         for user, user_tags in users_with_tags:
-            session.refresh(user)
-            
-            # Create initial ledger entry
-            ledger_entry = LedgerEntry(
-                user_id=user.id,
-                debit=0.0,
-                credit=5.0,
-                balance=5.0,
-                transaction_type=TransactionType.INITIAL,
-                description="Initial TimeBank balance",
-            )
-            session.add(ledger_entry)
-            
-            # Create user profile tags
-            for tag_name in user_tags:
-                user_tag = UserTag(user_id=user.id, tag_name=tag_name.lower())
-                session.add(user_tag)
-            
-            print(f"✅ Created user: {user.username} (ID: {user.id}, Balance: {user.balance}h, Avatar: {user.profile_image}, Tags: {len(user_tags)})")
-        
-        session.commit()
-        
-        # Create tags across various categories
-        tags_data = [
-            {"name": "tutoring", "description": "Educational tutoring services"},
-            {"name": "programming", "description": "Software development and coding help"},
-            {"name": "carpentry", "description": "Woodworking and furniture repair"},
-            {"name": "music", "description": "Music lessons and performances"},
-            {"name": "cooking", "description": "Culinary skills and meal preparation"},
-            {"name": "gardening", "description": "Plant care and landscaping"},
-            {"name": "fitness", "description": "Exercise training and wellness"},
-            {"name": "language", "description": "Foreign language instruction"},
-            {"name": "tech-support", "description": "Computer and technology assistance"},
-            {"name": "art", "description": "Visual arts and creative projects"},
-            {"name": "bike-repair", "description": "Bicycle maintenance and repair"},
-            {"name": "home-repair", "description": "General home maintenance"},
-            {"name": "childcare", "description": "Babysitting and child supervision"},
-            {"name": "pet-care", "description": "Pet sitting and animal care"},
-            {"name": "transportation", "description": "Rides and delivery services"},
-        ]
-        
-        tags = []
-        for tag_data in tags_data:
-            tag = Tag(
-                name=tag_data["name"],
-                description=tag_data["description"],
-                usage_count=0,
+            ledger_rows.append(_initial_ledger_row(user["id"]))
+            user_tag_rows.extend(
+                {"user_id": user["id"], "tag_name": tag_name.lower()} for tag_name in user_tags
             )
-            session.add(tag)
-            tags.append(tag)
-        
-        session.commit()
-        for tag in tags:
-            session.refresh(tag)
-            print(f"✅ Created tag: {tag.name} (ID: {tag.id})")
-        
-        # Create offers with various configurations
-        offers_data = [
-            {
-                "creator": users[0],  # alice
-                "title": "Python Programming Tutoring",
-                "description": "Offering help with Python basics, web development with Django/Flask, and data science libraries. Perfect for beginners!",
-                "is_remote": True,
-                "capacity": 3,
-                "hours": 2.0,
-                "tags": ["tutoring", "programming"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=2)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "10:00", "end_time": "12:00"},
-                            {"start_time": "14:00", "end_time": "16:00"}
-                        ],
-                    },
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=5)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "09:00", "end_time": "11:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[0],  # alice
-                "title": "Web Development Workshop",
-                "description": "Learn HTML, CSS, and JavaScript in a hands-on workshop format. Bring your laptop!",
-                "is_remote": False,
-                "capacity": 5,
-                "hours": 4.0,
-                "tags": ["tutoring", "programming"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=7)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "13:00", "end_time": "17:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[1],  # bob
-                "title": "Furniture Assembly & Repair",
-                "description": "Expert help with IKEA furniture, broken chairs, wobbly tables. I bring my own tools!",
-                "is_remote": False,
-                "capacity": 2,
-                "hours": 2.0,
-                "tags": ["carpentry", "home-repair"],
-            },
-            {
-                "creator": users[1],  # bob
-                "title": "Basic Carpentry Skills Workshop",
-                "description": "Learn to use basic tools safely and build a simple wooden project to take home.",
-                "is_remote": False,
-                "capacity": 4,
-                "hours": 3.0,
-                "tags": ["carpentry", "tutoring"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=3)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "10:00", "end_time": "13:00"}
-                        ],
-                    },
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=10)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "10:00", "end_time": "13:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[2],  # carol
-                "title": "Vocal Coaching Sessions",
-                "description": "One-on-one or small group vocal coaching. All styles welcome: pop, classical, jazz.",
-                "is_remote": True,
-                "capacity": 2,
-                "hours": 1.0,
-                "tags": ["music", "tutoring"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=1)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "15:00", "end_time": "16:00"},
-                            {"start_time": "16:30", "end_time": "17:30"}
-                        ],
-                    },
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=4)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "15:00", "end_time": "16:00"},
-                            {"start_time": "17:00", "end_time": "18:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[2],  # carol
-                "title": "Community Choir - Join Us!",
-                "description": "Weekly choir practice open to all. No experience necessary, just bring enthusiasm!",
-                "is_remote": False,
-                "capacity": 5,
-                "hours": 2.0,
-                "tags": ["music"],
-            },
-            {
-                "creator": users[3],  # david
-                "title": "Turkish Cooking Class",
-                "description": "Learn to make authentic Turkish dishes like mantı and börek from scratch. Ingredients provided, bring containers for leftovers!",
-                "is_remote": False,
-                "capacity": 4,
-                "hours": 3.0,
-                "tags": ["cooking", "tutoring"],
-            },
-            {
-                "creator": users[3],  # david
-                "title": "Meal Prep for Busy People",
-                "description": "I'll help you plan and prepare healthy meals for the week. Your kitchen or mine!",
-                "is_remote": False,
-                "capacity": 2,
-                "hours": 3.0,
-                "tags": ["cooking"],
-            },
-            {
-                "creator": users[4],  # emma
-                "title": "Urban Garden Setup Help",
-                "description": "I'll help you start a balcony or backyard garden. Advice on containers, soil, and plant selection.",
-                "is_remote": False,
-                "capacity": 3,
-                "hours": 2.0,
-                "tags": ["gardening"],
-            },
-            {
-                "creator": users[4],  # emma
-                "title": "Composting Workshop",
-                "description": "Learn how to compost at home and reduce kitchen waste. Small-space solutions included!",
-                "is_remote": True,
-                "capacity": 5,
-                "hours": 2.0,
-                "tags": ["gardening"],
-            },
-            {
-                "creator": users[5],  # frank
-                "title": "Personal Training Sessions",
-                "description": "Customized workout plans and motivation. Meet at the park or your home gym.",
-                "is_remote": False,
-                "capacity": 3,
-                "hours": 1.0,
-                "tags": ["fitness"],
-            },
-            {
-                "creator": users[5],  # frank
-                "title": "Beginner Yoga Classes",
-                "description": "Gentle yoga for flexibility and stress relief. Virtual or in-person options available.",
-                "is_remote": True,
-                "capacity": 5,
-                "hours": 1.0,
-                "tags": ["fitness"],
-            },
-            {
-                "creator": users[6],  # grace
-                "title": "Spanish Conversation Practice",
-                "description": "Practice conversational Spanish with a native speaker. All levels welcome!",
-                "is_remote": True,
-                "capacity": 4,
-                "hours": 1.0,
-                "tags": ["language", "tutoring"],
-            },
-            {
-                "creator": users[7],  # henry
-                "title": "Tech Help for Seniors",
-                "description": "Patient help with smartphones, tablets, email, video calls. I come to you!",
-                "is_remote": False,
-                "capacity": 2,
-                "hours": 2.0,
-                "tags": ["tech-support"],
-            },
-            {
-                "creator": users[9],  # jack
-                "title": "Free Bike Tune-Ups",
-                "description": "Basic maintenance: brakes, gears, tire pressure, chain lubrication. Bring your bike!",
-                "is_remote": False,
-                "capacity": 5,
-                "hours": 1.0,
-                "tags": ["bike-repair"],
-            },
+        _bulk_copy(conn, LedgerEntry, ledger_rows)
+        _bulk_copy(conn, UserTag, user_tag_rows)
+        _report(verbose, f"✅ Created {len(users)} users", (
+            f"✅ Created user: {user['username']} (ID: {user['id']}, Balance: {user['balance']}h, Avatar: {user['profile_image_ref']}, Tags: {len(user_tags)})"
+            for user, user_tags in users_with_tags
+        ))
+        
+        # Create tags
+        tags_rows = [
+            {"name": tag_data["name"], "description": tag_data["description"], "usage_count": 0}
+            for tag_data in SEED_TAGS
         ]
-        
-        offers = []
-        for offer_data in offers_data:
-            creator = offer_data["creator"]
-            
-            # Convert time slots to JSON if present
-            available_slots_json = None
-            if "time_slots" in offer_data:
-                available_slots_json = create_time_slots_json(offer_data["time_slots"])
-            
-            offer = Offer(
-                creator_id=creator.id,
-                title=offer_data["title"],
-                description=offer_data["description"],
-                is_remote=offer_data["is_remote"],
-                location_lat=creator.location_lat if not offer_data["is_remote"] else None,
-                location_lon=creator.location_lon if not offer_data["is_remote"] else None,
-                location_name=creator.location_name if not offer_data["is_remote"] else None,
-                start_date=datetime.utcnow(),
-                end_date=datetime.utcnow() + timedelta(days=14),  # 2 weeks
-                capacity=offer_data["capacity"],
-                hours=offer_data.get("hours", 1.0),
-                accepted_count=0,
-                status=OfferStatus.ACTIVE,
-                available_slots=available_slots_json,
-            )
-            session.add(offer)
-            offers.append((offer, offer_data["tags"]))
-        
-        session.commit()
+        _bulk_insert(conn, Tag, tags_rows)
+        _report(verbose, f"✅ Created {len(tags_rows)} tags", (
+            f"✅ Created tag: {tag['name']} (ID: {tag['id']})" for tag in tags_rows
+        ))
+        tag_by_name = {tag["name"]: tag["id"] for tag in tags_rows}
+        # Link counts per tag id, applied with one UPDATE once offers and needs are linked
+        tag_usage = Counter()
+        
+        # Create offers
+        offers = list(_iter_listing_rows(
+            SEED_OFFERS, users, OfferStatus.ACTIVE, now, end_default, slot_dates
+        ))
+        offers_rows = [offer for offer, _, _ in offers]
+        _bulk_insert(conn, Offer, offers_rows)
         
         # Link offers to tags
-        for offer, tag_names in offers:
-            session.refresh(offer)
-            slots_info = f", Time Slots: {len(json.loads(offer.available_slots))}" if offer.available_slots else ""
-            print(f"✅ Created offer: {offer.title} (ID: {offer.id}, Capacity: {offer.capacity}{slots_info})")
-            for tag_name in tag_names:
-                tag = next((t for t in tags if t.name == tag_name), None)
-                if tag:
-                    offer_tag = OfferTag(offer_id=offer.id, tag_id=tag.id)
-                    session.add(offer_tag)
-                    tag.usage_count += 1
-        
-        session.commit()
+        _bulk_copy(conn, OfferTag, _tag_link_rows(offers, "offer_id", tag_by_name, tag_usage))
+        _report(verbose, f"✅ Created {len(offers)} offers", (
+            _listing_line("offer", offer, slots_count) for offer, _, slots_count in offers
+        ))
         
         # Create needs
-        needs_data = [
-            {
-                "creator": users[7],  # henry
-                "title": "Help Moving Furniture",
-                "description": "Need help moving a couch and bookshelf to my new apartment. Second floor, no elevator.",
-                "is_remote": False,
-                "capacity": 2,
-                "hours": 3.0,
-                "tags": ["home-repair", "transportation"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=6)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "09:00", "end_time": "12:00"},
-                            {"start_time": "13:00", "end_time": "16:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[8],  # iris
-                "title": "Website Design Help",
-                "description": "Need someone to help design a portfolio website for my art. I have content ready!",
-                "is_remote": True,
-                "capacity": 1,
-                "hours": 4.0,
-                "tags": ["programming"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=2)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "18:00", "end_time": "20:00"}
-                        ],
-                    },
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=9)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "18:00", "end_time": "20:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[9],  # jack
-                "title": "Dog Walking Partner",
-                "description": "Looking for someone to walk my energetic golden retriever 2-3 times per week.",
-                "is_remote": False,
-                "capacity": 1,
-                "hours": 1.0,
-                "tags": ["pet-care"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=1)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "07:00", "end_time": "08:00"},
-                            {"start_time": "17:00", "end_time": "18:00"}
-                        ],
-                    },
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=3)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "07:00", "end_time": "08:00"},
-                            {"start_time": "17:00", "end_time": "18:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[0],  # alice
-                "title": "Guitar Lessons Needed",
-                "description": "Beginner looking to learn acoustic guitar. Prefer in-person lessons.",
-                "is_remote": False,
-                "capacity": 1,
-                "hours": 2.0,
-                "tags": ["music", "tutoring"],
-            },
-            {
-                "creator": users[1],  # bob
-                "title": "Garden Design Consultation",
-                "description": "Need advice on redesigning my backyard garden. What should I plant in shady areas?",
-                "is_remote": False,
-                "capacity": 1,
-                "hours": 2.0,
-                "tags": ["gardening"],
-            },
-            {
-                "creator": users[3],  # david
-                "title": "Spanish Language Partner",
-                "description": "Looking for conversation practice in Spanish. I'm at intermediate level.",
-                "is_remote": True,
-                "capacity": 1,
-                "hours": 1.0,
-                "tags": ["language"],
-            },
-            {
-                "creator": users[4],  # emma
-                "title": "Yoga Partner Wanted",
-                "description": "Looking for someone to practice yoga with in the park on weekends.",
-                "is_remote": False,
-                "capacity": 2,
-                "hours": 1.0,
-                "tags": ["fitness"],
-                "time_slots": [
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=5)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "08:00", "end_time": "09:00"}
-                        ],
-                    },
-                    {
-                        "date": (datetime.utcnow() + timedelta(days=12)).strftime("%Y-%m-%d"),
-                        "time_ranges": [
-                            {"start_time": "08:00", "end_time": "09:00"}
-                        ],
-                    }
-                ]
-            },
-            {
-                "creator": users[5],  # frank
-                "title": "Help with Resume Writing",
-                "description": "Career change ahead! Need help updating my resume and cover letter.",
-                "is_remote": True,
-                "capacity": 1,
-                "hours": 2.0,
-                "tags": ["tutoring"],
-            },
-            {
-                "creator": users[6],  # grace
-                "title": "Photography Session",
-                "description": "Need professional photos for my language tutoring website. Outdoor session preferred.",
-                "is_remote": False,
-                "capacity": 1,
-                "hours": 2.0,
-                "tags": ["art"],
-            },
-            {
-                "creator": users[2],  # carol
-                "title": "Piano Tuning Service",
-                "description": "My upright piano hasn't been tuned in years. Looking for an expert!",
-                "is_remote": False,
-                "capacity": 1,
-                "hours": 2.0,
-                "tags": ["music"],
-            },
-            {
-                "creator": users[8],  # iris
-                "title": "Childcare for Art Classes",
-                "description": "Need someone to watch my 5-year-old while I teach evening art classes, 2 hours/session.",
-                "is_remote": False,
-                "capacity": 1,
-                "hours": 2.0,
-                "tags": ["childcare"],
-            },
-            {
-                "creator": users[7],  # henry
-                "title": "Car Ride to Airport",
-                "description": "Need a ride to the airport next week, early morning departure.",
-                "is_remote": False,
-                "capacity": 1,
-                "hours": 1.0,
-                "tags": ["transportation"],
-            },
-        ]
-        
-        needs = []
-        for need_data in needs_data:
-            creator = need_data["creator"]
-            
-            # Convert time slots to JSON if present
-            available_slots_json = None
-            if "time_slots" in need_data:
-                available_slots_json = create_time_slots_json(need_data["time_slots"])
-            
-            need = Need(
-                creator_id=creator.id,
-                title=need_data["title"],
-                description=need_data["description"],
-                is_remote=need_data["is_remote"],
-                location_lat=creator.location_lat if not need_data["is_remote"] else None,
-                location_lon=creator.location_lon if not need_data["is_remote"] else None,
-                location_name=creator.location_name if not need_data["is_remote"] else None,
-                start_date=datetime.utcnow(),
-                end_date=datetime.utcnow() + timedelta(days=14),
-                capacity=need_data["capacity"],
-                hours=need_data.get("hours", 1.0),
-                accepted_count=0,
-                status=NeedStatus.ACTIVE,
-                available_slots=available_slots_json,
-            )
-            session.add(need)
-            needs.append((need, need_data["tags"]))
-        
-        session.commit()
+        needs = list(_iter_listing_rows(
+            SEED_NEEDS, users, NeedStatus.ACTIVE, now, end_default, slot_dates
+        ))
+        needs_rows = [need for need, _, _ in needs]
+        _bulk_insert(conn, Need, needs_rows)
         
         # Link needs to tags
-        for need, tag_names in needs:
-            session.refresh(need)
-            slots_info = f", Time Slots: {len(json.loads(need.available_slots))}" if need.available_slots else ""
-            print(f"✅ Created need: {need.title} (ID: {need.id}, Capacity: {need.capacity}{slots_info})")
-            for tag_name in tag_names:
-                tag = next((t for t in tags if t.name == tag_name), None)
-                if tag:
-                    need_tag = NeedTag(need_id=need.id, tag_id=tag.id)
-                    session.add(need_tag)
-                    tag.usage_count += 1
-        
-        session.commit()
+        _bulk_copy(conn, NeedTag, _tag_link_rows(needs, "need_id", tag_by_name, tag_usage))
+        _report(verbose, f"✅ Created {len(needs)} needs", (
+            _listing_line("need", need, slots_count) for need, _, slots_count in needs
+        ))
+        
+        tags_table = Tag.__table__
+        conn.execute(
+            update(tags_table)
+            .where(tags_table.c.id == bindparam("tag_id"))
+            .values(usage_count=tags_table.c.usage_count + bindparam("uses")),
+            [{"tag_id": tag_id, "uses": uses} for tag_id, uses in tag_usage.items()],
+        )
         
         # =================================================================
         # Create participants/applications for some offers and needs
         # =================================================================
         
-        # ===== COMPLETED EXCHANGES (with ratings and ledger entries) =====
-        
-        # 1. Alice completed Bob's carpentry workshop (Alice REQUESTER, Bob PROVIDER)
-        # Bob offered to teach carpentry, Alice learned from him
-        participant1 = Participant(
-            user_id=users[0].id,  # Alice
-            offer_id=offers[3][0].id,  # Basic Carpentry Skills Workshop (Bob's offer)
-            role=ParticipantRole.REQUESTER,  # Alice is requesting to learn
-            status=ParticipantStatus.COMPLETED,
-            message="I'd love to learn basic carpentry! I'm free on weekends.",
-            hours_contributed=2.0,
-            provider_confirmed=True,
-            requester_confirmed=True,
-        )
-        session.add(participant1)
-        
-        # 2. Frank completed Emma's composting workshop (Frank REQUESTER, Emma PROVIDER)
-        participant3 = Participant(
-            user_id=users[5].id,  # Frank
-            offer_id=offers[9][0].id,  # Composting Workshop (Emma's offer)
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.COMPLETED,
-            message="Perfect timing! I've been wanting to start composting.",
-            hours_contributed=1.5,
-            provider_confirmed=True,
-            requester_confirmed=True,
-        )
-        session.add(participant3)
-        
-        # 3. Bob helped Henry move furniture (Bob PROVIDER, Henry REQUESTER)
-        participant5 = Participant(
-            user_id=users[1].id,  # Bob
-            need_id=needs[0][0].id,  # Help Moving Furniture (Henry's need)
-            role=ParticipantRole.PROVIDER,
-            status=ParticipantStatus.COMPLETED,
-            message="I can help with the move! I have experience and a dolly for heavy items.",
-            hours_contributed=3.0,
-            provider_confirmed=True,
-            requester_confirmed=True,
-        )
-        session.add(participant5)
-        
-        # 4. Carol learned Spanish from Grace (Carol REQUESTER, Grace PROVIDER)
-        # Carol completed Grace's Spanish Conversation Practice offer
-        participant_spanish = Participant(
-            user_id=users[2].id,  # Carol
-            offer_id=offers[12][0].id,  # Spanish Conversation Practice (Grace's offer)
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.COMPLETED,
-            message="I'd love to improve my Spanish conversation skills!",
-            hours_contributed=1.0,
-            provider_confirmed=True,
-            requester_confirmed=True,
-        )
-        session.add(participant_spanish)
-        
-        # 5. Alice helped Iris with website design (Alice PROVIDER, Iris REQUESTER)
-        participant_web = Participant(
-            user_id=users[0].id,  # Alice
-            need_id=needs[1][0].id,  # Website Design Help (Iris's need)
-            role=ParticipantRole.PROVIDER,
-            status=ParticipantStatus.COMPLETED,
-            message="I'd be happy to help with your portfolio site! I have web dev experience.",
-            hours_contributed=4.0,
-            provider_confirmed=True,
-            requester_confirmed=True,
-        )
-        session.add(participant_web)
-        
-        # ===== PENDING/ACCEPTED EXCHANGES (not yet completed) =====
-        
-        # PYTHON TUTORING (Alice's offer) - Capacity 3 - FULL with 3 ACCEPTED
-        participant_python1 = Participant(
-            user_id=users[6].id,  # Grace
-            offer_id=offers[0][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="I'm interested in learning Python for data analysis!",
-            hours_contributed=2.0,
-        )
-        session.add(participant_python1)
-        
-        participant_python2 = Participant(
-            user_id=users[3].id,  # David
-            offer_id=offers[0][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Would love to learn Python web development!",
-            hours_contributed=2.0,
-        )
-        session.add(participant_python2)
-        
-        participant_python3 = Participant(
-            user_id=users[5].id,  # Frank
-            offer_id=offers[0][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Interested in data science with Python!",
-            hours_contributed=2.0,
-        )
-        session.add(participant_python3)
-        
-        # WEB DEVELOPMENT WORKSHOP (Alice's offer) - Capacity 5 - 2 ACCEPTED
-        participant_web_workshop1 = Participant(
-            user_id=users[7].id,  # Henry
-            offer_id=offers[1][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Excited to learn web development!",
-            hours_contributed=4.0,
-        )
-        session.add(participant_web_workshop1)
-        
-        participant_web_workshop2 = Participant(
-            user_id=users[9].id,  # Jack
-            offer_id=offers[1][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="I want to build my own website!",
-            hours_contributed=4.0,
-        )
-        session.add(participant_web_workshop2)
-        
-        # TURKISH COOKING CLASS (David's offer) - Capacity 4 - 1 PENDING, 2 ACCEPTED
-        participant_cooking1 = Participant(
-            user_id=users[2].id,  # Carol
-            offer_id=offers[6][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.PENDING,
-            message="This sounds amazing! I love Turkish food!",
-        )
-        session.add(participant_cooking1)
-        
-        participant_cooking2 = Participant(
-            user_id=users[8].id,  # Iris
-            offer_id=offers[6][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Can't wait to learn authentic Turkish recipes!",
-            hours_contributed=3.0,
-        )
-        session.add(participant_cooking2)
-        
-        participant_cooking3 = Participant(
-            user_id=users[0].id,  # Alice
-            offer_id=offers[6][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Turkish cuisine looks delicious!",
-            hours_contributed=3.0,
-        )
-        session.add(participant_cooking3)
-        
-        # SPANISH CONVERSATION (Grace's offer) - Capacity 4 - Already has 1 COMPLETED (Carol)
-        # Adding 3 more ACCEPTED to make it FULL (4/4 total)
-        participant_spanish1 = Participant(
-            user_id=users[3].id,  # David
-            offer_id=offers[12][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Looking to practice Spanish conversation!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_spanish1)
-        
-        participant_spanish2 = Participant(
-            user_id=users[1].id,  # Bob
-            offer_id=offers[12][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="I need to improve my Spanish skills!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_spanish2)
-        
-        participant_spanish3 = Participant(
-            user_id=users[4].id,  # Emma
-            offer_id=offers[12][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Would love to practice with a native speaker!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_spanish3)
-        
-        # BIKE TUNE-UPS (Jack's offer) - Capacity 5 - 3 ACCEPTED
-        participant_bike1 = Participant(
-            user_id=users[2].id,  # Carol
-            offer_id=offers[14][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="My bike needs some maintenance!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_bike1)
-        
-        participant_bike2 = Participant(
-            user_id=users[6].id,  # Grace
-            offer_id=offers[14][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Great! My chain has been squeaking.",
-            hours_contributed=1.0,
-        )
-        session.add(participant_bike2)
-        
-        participant_bike3 = Participant(
-            user_id=users[4].id,  # Emma
-            offer_id=offers[14][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Perfect timing, my brakes need adjustment!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_bike3)
-        
-        # VOCAL COACHING (Carol's offer) - Capacity 2 - 1 ACCEPTED
-        participant_vocal = Participant(
-            user_id=users[7].id,  # Henry
-            offer_id=offers[4][0].id,
-            role=ParticipantRole.REQUESTER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Would love to improve my singing!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_vocal)
-        
-        # GUITAR LESSONS NEEDED (Alice's need) - Capacity 1 - 1 PENDING
-        participant_guitar = Participant(
-            user_id=users[2].id,  # Carol
-            need_id=needs[3][0].id,
-            role=ParticipantRole.PROVIDER,
-            status=ParticipantStatus.PENDING,
-            message="I can teach you guitar! I've been playing for 10 years.",
-        )
-        session.add(participant_guitar)
-        
-        # DOG WALKING (Jack's need) - Capacity 1 - 1 ACCEPTED
-        participant_dog = Participant(
-            user_id=users[3].id,  # David
-            need_id=needs[2][0].id,
-            role=ParticipantRole.PROVIDER,
-            status=ParticipantStatus.ACCEPTED,
-            message="I'd be happy to help walk your dog!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_dog)
-        
-        # CHILDCARE (Iris's need) - Capacity 1 - 1 ACCEPTED
-        participant_childcare = Participant(
-            user_id=users[3].id,  # David
-            need_id=needs[10][0].id,
-            role=ParticipantRole.PROVIDER,
-            status=ParticipantStatus.ACCEPTED,
-            message="I have experience with kids and would love to help!",
-            hours_contributed=2.0,
-        )
-        session.add(participant_childcare)
-        
-        # YOGA PARTNER (Emma's need) - Capacity 2 - 2 ACCEPTED (FULL)
-        participant_yoga1 = Participant(
-            user_id=users[5].id,  # Frank
-            need_id=needs[6][0].id,
-            role=ParticipantRole.PROVIDER,
-            status=ParticipantStatus.ACCEPTED,
-            message="I'd love to practice yoga together in the park!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_yoga1)
-        
-        participant_yoga2 = Participant(
-            user_id=users[6].id,  # Grace
-            need_id=needs[6][0].id,
-            role=ParticipantRole.PROVIDER,
-            status=ParticipantStatus.ACCEPTED,
-            message="Count me in! Yoga in nature sounds perfect!",
-            hours_contributed=1.0,
-        )
-        session.add(participant_yoga2)
-        
-        session.commit()
+        participant_rows = list(_iter_participant_rows(users, offers, needs))
+        # One INSERT ... RETURNING gives the participant IDs for the ledger entries and ratings
+        _bulk_insert(conn, Participant, participant_rows)
+        # The completed exchanges lead SEED_PARTICIPANTS
+        participant1, participant3, participant5, participant_spanish, participant_web = participant_rows[:5]
         print(f"✅ Created 28 participant records (5 completed, 23 active: 21 accepted + 2 pending)")
         
-        # Refresh participants to get IDs
-        session.refresh(participant1)
-        session.refresh(participant3)
-        session.refresh(participant5)
-        session.refresh(participant_spanish)
-        session.refresh(participant_web)
-        
         # =================================================================
         # Create ledger entries for COMPLETED exchanges
         # =================================================================
         # Completed exchange 1: Alice learned carpentry from Bob (2 hours)
         # Bob (provider) gains 2 hours, Alice (requester) loses 2 hours
-        users[1].balance += 2.0
+        users[1]["balance"] += 2.0
         ledger_bob_earn1 = LedgerEntry(
-            user_id=users[1].id,  # Bob
+            user_id=users[1]["id"],  # Bob
             credit=2.0,
             debit=0.0,
-            balance=users[1].balance,
+            balance=users[1]["balance"],
             description="Earned: Basic Carpentry Skills Workshop with Alice",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant1.id,
+            participant_id=participant1["id"],
         )
         session.add(ledger_bob_earn1)
         
-        users[0].balance -= 2.0
+        users[0]["balance"] -= 2.0
         ledger_alice_spend1 = LedgerEntry(
-            user_id=users[0].id,  # Alice
+            user_id=users[0]["id"],  # Alice
             credit=0.0,
             debit=2.0,
-            balance=users[0].balance,
+            balance=users[0]["balance"],
             description="Spent: Basic Carpentry Skills Workshop with Bob",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant1.id,
+            participant_id=participant1["id"],
         )
         session.add(ledger_alice_spend1)
         
         # Completed exchange 2: Frank learned composting from Emma (2 hours)
         # Emma (provider) gains 2 hours, Frank (requester) loses 2 hours
-        users[4].balance += 2.0
+        users[4]["balance"] += 2.0
         ledger_emma_earn = LedgerEntry(
-            user_id=users[4].id,  # Emma
+            user_id=users[4]["id"],  # Emma
             credit=2.0,
             debit=0.0,
-            balance=users[4].balance,
+            balance=users[4]["balance"],
             description="Earned: Composting Workshop with Frank",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant3.id,
+            participant_id=participant3["id"],
         )
         session.add(ledger_emma_earn)
         
-        users[5].balance -= 2.0
+        users[5]["balance"] -= 2.0
         ledger_frank_spend = LedgerEntry(
-            user_id=users[5].id,  # Frank
+            user_id=users[5]["id"],  # Frank
             credit=0.0,
             debit=2.0,
-            balance=users[5].balance,
+            balance=users[5]["balance"],
             description="Spent: Composting Workshop with Emma",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant3.id,
+            participant_id=participant3["id"],
         )
         session.add(ledger_frank_spend)
         
         # Completed exchange 3: Bob helped Henry move furniture (3 hours)
         # Bob (provider) gains 3 hours, Henry (requester) loses 3 hours
-        users[1].balance += 3.0
+        users[1]["balance"] += 3.0
         ledger_bob_earn2 = LedgerEntry(
-            user_id=users[1].id,  # Bob
+            user_id=users[1]["id"],  # Bob
             credit=3.0,
             debit=0.0,
-            balance=users[1].balance,
+            balance=users[1]["balance"],
             description="Earned: Help Moving Furniture for Henry",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant5.id,
+            participant_id=participant5["id"],
         )
         session.add(ledger_bob_earn2)
         
-        users[7].balance -= 3.0
+        users[7]["balance"] -= 3.0
         ledger_henry_spend = LedgerEntry(
-            user_id=users[7].id,  # Henry
+            user_id=users[7]["id"],  # Henry
             credit=0.0,
             debit=3.0,
-            balance=users[7].balance,
+            balance=users[7]["balance"],
             description="Spent: Help Moving Furniture with Bob",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant5.id,
+            participant_id=participant5["id"],
         )
         session.add(ledger_henry_spend)
         
         # Completed exchange 4: Carol learned Spanish from Grace (1 hour)
         # Grace (provider) gains 1 hour, Carol (requester) loses 1 hour
-        users[6].balance += 1.0
+        users[6]["balance"] += 1.0
         ledger_grace_earn = LedgerEntry(
-            user_id=users[6].id,  # Grace
+            user_id=users[6]["id"],  # Grace
             credit=1.0,
             debit=0.0,
-            balance=users[6].balance,
+            balance=users[6]["balance"],
             description="Earned: Spanish Conversation Practice with Carol",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant_spanish.id,
+            participant_id=participant_spanish["id"],
         )
         session.add(ledger_grace_earn)
         
-        users[2].balance -= 1.0
+        users[2]["balance"] -= 1.0
         ledger_carol_spend = LedgerEntry(
-            user_id=users[2].id,  # Carol
+            user_id=users[2]["id"],  # Carol
             credit=0.0,
             debit=1.0,
-            balance=users[2].balance,
+            balance=users[2]["balance"],
             description="Spent: Spanish Conversation Practice with Grace",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant_spanish.id,
+            participant_id=participant_spanish["id"],
         )
         session.add(ledger_carol_spend)
         
         # Completed exchange 5: Alice helped Iris with website (4 hours)
         # Alice (provider) gains 4 hours, Iris (requester) loses 4 hours
-        users[0].balance += 4.0
+        users[0]["balance"] += 4.0
         ledger_alice_earn = LedgerEntry(
-            user_id=users[0].id,  # Alice
+            user_id=users[0]["id"],  # Alice
             credit=4.0,
             debit=0.0,
-            balance=users[0].balance,
+            balance=users[0]["balance"],
             description="Earned: Website Design Help for Iris",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant_web.id,
+            participant_id=participant_web["id"],
         )
         session.add(ledger_alice_earn)
         
-        users[8].balance -= 4.0
+        users[8]["balance"] -= 4.0
         ledger_iris_spend = LedgerEntry(
-            user_id=users[8].id,  # Iris
+            user_id=users[8]["id"],  # Iris
             credit=0.0,
             debit=4.0,
-            balance=users[8].balance,
+            balance=users[8]["balance"],
             description="Spent: Website Design Help with Alice",
             transaction_type=TransactionType.EXCHANGE,
-            participant_id=participant_web.id,
+            participant_id=participant_web["id"],
         )
         session.add(ledger_iris_spend)
         
-        session.commit()
+        _bulk_update(conn, User, users, ("balance",))
         print(f"✅ Created 10 ledger entries for 5 completed exchanges")
-        print(f"   - Bob: {users[1].balance}h, Alice: {users[0].balance}h, Emma: {users[4].balance}h")
-        print(f"   - Frank: {users[5].balance}h, Henry: {users[7].balance}h, Grace: {users[6].balance}h")
-        print(f"   - Carol: {users[2].balance}h, Iris: {users[8].balance}h")
+        print(f"   - Bob: {users[1]['balance']}h, Alice: {users[0]['balance']}h, Emma: {users[4]['balance']}h")
+        print(f"   - Frank: {users[5]['balance']}h, Henry: {users[7]['balance']}h, Grace: {users[6]['balance']}h")
+        print(f"   - Carol: {users[2]['balance']}h, Iris: {users[8]['balance']}h")
         
         # Update accepted_count for offers and needs with completed/accepted participants
         # Completed exchanges
-        offers[3][0].accepted_count = 1  # Carpentry workshop - COMPLETED
-        offers[9][0].accepted_count = 1  # Composting workshop - COMPLETED
-        offers[12][0].accepted_count = 1  # Spanish conversation - COMPLETED (old one)
-        needs[0][0].accepted_count = 1  # Help Moving Furniture - COMPLETED
-        needs[1][0].accepted_count = 1  # Website Design Help - COMPLETED
+        offers[3][0]["accepted_count"] = 1  # Carpentry workshop - COMPLETED
+        offers[9][0]["accepted_count"] = 1  # Composting workshop - COMPLETED
+        offers[12][0]["accepted_count"] = 1  # Spanish conversation - COMPLETED (old one)
+        needs[0][0]["accepted_count"] = 1  # Help Moving Furniture - COMPLETED
+        needs[1][0]["accepted_count"] = 1  # Website Design Help - COMPLETED
         
         # Active exchanges with accepted participants
-        offers[0][0].accepted_count = 3  # Python Tutoring - FULL (3/3)
-        offers[1][0].accepted_count = 2  # Web Development Workshop (2/5)
-        offers[4][0].accepted_count = 1  # Vocal Coaching (1/2)
-        offers[6][0].accepted_count = 2  # Turkish Cooking (2/4, 1 pending)
-        offers[12][0].accepted_count = 4  # Spanish Conversation (1 completed + 3 accepted = 4/4) FULL
-        offers[14][0].accepted_count = 3  # Bike Tune-ups (3/5)
-        needs[2][0].accepted_count = 1  # Dog Walking (1/1) FULL
-        needs[6][0].accepted_count = 2  # Yoga Partner (2/2) FULL
-        needs[10][0].accepted_count = 1  # Childcare (1/1) FULL
+        offers[0][0]["accepted_count"] = 3  # Python Tutoring - FULL (3/3)
+        offers[1][0]["accepted_count"] = 2  # Web Development Workshop (2/5)
+        offers[4][0]["accepted_count"] = 1  # Vocal Coaching (1/2)
+        offers[6][0]["accepted_count"] = 2  # Turkish Cooking (2/4, 1 pending)
+        offers[12][0]["accepted_count"] = 4  # Spanish Conversation (1 completed + 3 accepted = 4/4) FULL
+        offers[14][0]["accepted_count"] = 3  # Bike Tune-ups (3/5)
+        needs[2][0]["accepted_count"] = 1  # Dog Walking (1/1) FULL
+        needs[6][0]["accepted_count"] = 2  # Yoga Partner (2/2) FULL
+        needs[10][0]["accepted_count"] = 1  # Childcare (1/1) FULL
         
         # Mark offers/needs with completed participants as COMPLETED
-        offers[3][0].status = OfferStatus.COMPLETED  # Carpentry workshop - completed
-        offers[9][0].status = OfferStatus.COMPLETED  # Composting workshop - completed
-        needs[0][0].status = NeedStatus.COMPLETED  # Help Moving Furniture - completed
-        needs[1][0].status = NeedStatus.COMPLETED  # Website Design Help - completed
+        offers[3][0]["status"] = OfferStatus.COMPLETED  # Carpentry workshop - completed
+        offers[9][0]["status"] = OfferStatus.COMPLETED  # Composting workshop - completed
+        needs[0][0]["status"] = NeedStatus.COMPLETED  # Help Moving Furniture - completed
+        needs[1][0]["status"] = NeedStatus.COMPLETED  # Website Design Help - completed
         
         # Mark FULL offers/needs (accepted_count >= capacity)
-        offers[0][0].status = OfferStatus.FULL  # Python Tutoring (3/3)
-        offers[12][0].status = OfferStatus.FULL  # Spanish Conversation (4/4)
-        needs[2][0].status = NeedStatus.FULL  # Dog Walking (1/1)
-        needs[6][0].status = NeedStatus.FULL  # Yoga Partner (2/2)
-        needs[10][0].status = NeedStatus.FULL  # Childcare (1/1)
-        
-        session.commit()
+        offers[0][0]["status"] = OfferStatus.FULL  # Python Tutoring (3/3)
+        offers[12][0]["status"] = OfferStatus.FULL  # Spanish Conversation (4/4)
+        needs[2][0]["status"] = NeedStatus.FULL  # Dog Walking (1/1)
+        needs[6][0]["status"] = NeedStatus.FULL  # Yoga Partner (2/2)
+        needs[10][0]["status"] = NeedStatus.FULL  # Childcare (1/1)
+        
+        # One UPDATE ... CASE per table, covering only the listings changed above
+        _bulk_update(conn, Offer, [
+            offer for offer in offers_rows
+            if offer["accepted_count"] or offer["status"] != OfferStatus.ACTIVE
+        ], ("accepted_count", "status"))
+        _bulk_update(conn, Need, [
+            need for need in needs_rows
+            if need["accepted_count"] or need["status"] != NeedStatus.ACTIVE
+        ], ("accepted_count", "status"))
         print(f"✅ Updated accepted_count and status for all exchanges")
         print(f"   - Full: Python Tutoring (3/3), Spanish Convo (4/4), Dog Walking (1/1), Yoga (2/2), Childcare (1/1)")
         print(f"   - Partial: Web Workshop (2/5), Vocal (1/2), Turkish Cooking (2/4), Bike Tune-ups (3/5)")
@@ -1322,13 +1500,12 @@ def seed_basic_data():
         
         # Rating 1a: Alice rates Bob for carpentry workshop (Bob was provider)
         rating1a = Rating(
-            from_user_id=users[0].id,  # Alice
-            to_user_id=users[1].id,  # Bob
-            participant_id=participant1.id,
+            from_user_id=users[0]["id"],  # Alice
+            to_user_id=users[1]["id"],  # Bob
+            participant_id=participant1["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=5,
-            general_rating=5,  # avg of (5+5+5)/3 = 5
             public_comment="Bob is an excellent teacher! Very patient and knowledgeable about carpentry.",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1336,13 +1513,12 @@ def seed_basic_data():
         
         # Rating 1b: Bob rates Alice (Alice was requester/learner)
         rating1b = Rating(
-            from_user_id=users[1].id,  # Bob
-            to_user_id=users[0].id,  # Alice
-            participant_id=participant1.id,
+            from_user_id=users[1]["id"],  # Bob
+            to_user_id=users[0]["id"],  # Alice
+            participant_id=participant1["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=4,
-            general_rating=4.7,  # avg of (5+5+4)/3 = 4.67
             public_comment="Alice was a great student - eager to learn and asked great questions!",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1350,13 +1526,12 @@ def seed_basic_data():
         
         # Rating 2a: Frank rates Emma for composting workshop
         rating2a = Rating(
-            from_user_id=users[5].id,  # Frank
-            to_user_id=users[4].id,  # Emma
-            participant_id=participant3.id,
+            from_user_id=users[5]["id"],  # Frank
+            to_user_id=users[4]["id"],  # Emma
+            participant_id=participant3["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=5,
-            general_rating=5,
             public_comment="Emma's workshop was incredibly informative! I feel confident starting my own compost now.",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1364,13 +1539,12 @@ def seed_basic_data():
         
         # Rating 2b: Emma rates Frank
         rating2b = Rating(
-            from_user_id=users[4].id,  # Emma
-            to_user_id=users[5].id,  # Frank
-            participant_id=participant3.id,
+            from_user_id=users[4]["id"],  # Emma
+            to_user_id=users[5]["id"],  # Frank
+            participant_id=participant3["id"],
             reliability_rating=5,
             kindness_rating=4,
             helpfulness_rating=4,
-            general_rating=4.3,  # avg of (5+4+4)/3 = 4.33
             public_comment="Frank was enthusiastic and brought great energy to the workshop!",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1378,13 +1552,12 @@ def seed_basic_data():
         
         # Rating 3a: Henry rates Bob for moving help
         rating3a = Rating(
-            from_user_id=users[7].id,  # Henry
-            to_user_id=users[1].id,  # Bob
-            participant_id=participant5.id,
+            from_user_id=users[7]["id"],  # Henry
+            to_user_id=users[1]["id"],  # Bob
+            participant_id=participant5["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=5,
-            general_rating=5,
             public_comment="Bob was amazing! Strong, efficient, and made my move stress-free. Highly recommend!",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1392,13 +1565,12 @@ def seed_basic_data():
         
         # Rating 3b: Bob rates Henry
         rating3b = Rating(
-            from_user_id=users[1].id,  # Bob
-            to_user_id=users[7].id,  # Henry
-            participant_id=participant5.id,
+            from_user_id=users[1]["id"],  # Bob
+            to_user_id=users[7]["id"],  # Henry
+            participant_id=participant5["id"],
             reliability_rating=4,
             kindness_rating=5,
             helpfulness_rating=4,
-            general_rating=4.3,  # avg of (4+5+4)/3 = 4.33
             public_comment="Henry was well-prepared for the move. Everything went smoothly!",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1406,13 +1578,12 @@ def seed_basic_data():
         
         # Rating 4a: Carol rates Grace for Spanish conversation
         rating4a = Rating(
-            from_user_id=users[2].id,  # Carol
-            to_user_id=users[6].id,  # Grace
-            participant_id=participant_spanish.id,
+            from_user_id=users[2]["id"],  # Carol
+            to_user_id=users[6]["id"],  # Grace
+            participant_id=participant_spanish["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=5,
-            general_rating=5,
             public_comment="Grace is a fantastic Spanish conversation partner! Very encouraging and helpful with corrections.",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1420,13 +1591,12 @@ def seed_basic_data():
         
         # Rating 4b: Grace rates Carol
         rating4b = Rating(
-            from_user_id=users[6].id,  # Grace
-            to_user_id=users[2].id,  # Carol
-            participant_id=participant_spanish.id,
+            from_user_id=users[6]["id"],  # Grace
+            to_user_id=users[2]["id"],  # Carol
+            participant_id=participant_spanish["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=4,
-            general_rating=4.7,  # avg of (5+5+4)/3 = 4.67
             public_comment="Carol is making great progress! Always comes prepared and is a joy to practice with.",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1434,13 +1604,12 @@ def seed_basic_data():
         
         # Rating 5a: Iris rates Alice for website help
         rating5a = Rating(
-            from_user_id=users[8].id,  # Iris
-            to_user_id=users[0].id,  # Alice
-            participant_id=participant_web.id,
+            from_user_id=users[8]["id"],  # Iris
+            to_user_id=users[0]["id"],  # Alice
+            participant_id=participant_web["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=5,
-            general_rating=5,
             public_comment="Alice created the perfect portfolio website for my art! She understood exactly what I needed.",
             visibility=RatingVisibility.VISIBLE,
         )
@@ -1448,19 +1617,17 @@ def seed_basic_data():
         
         # Rating 5b: Alice rates Iris
         rating5b = Rating(
-            from_user_id=users[0].id,  # Alice
-            to_user_id=users[8].id,  # Iris
-            participant_id=participant_web.id,
+            from_user_id=users[0]["id"],  # Alice
+            to_user_id=users[8]["id"],  # Iris
+            participant_id=participant_web["id"],
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=4,
-            general_rating=4.7,  # avg of (5+5+4)/3 = 4.67
             public_comment="Iris had beautiful art content ready and gave clear feedback. Great collaboration!",
             visibility=RatingVisibility.VISIBLE,
         )
         session.add(rating5b)
         
-        session.commit()
         print(f"✅ Created 10 ratings for 5 completed exchanges (mutual ratings)")
         
         # ============================================================
@@ -1470,7 +1637,7 @@ def seed_basic_data():
         # Discussion 1: Welcome topic
         topic1 = ForumTopic(
             topic_type=TopicType.DISCUSSION,
-            creator_id=users[0].id,  # Alice
+            creator_id=users[0]["id"],  # Alice
             title="Welcome to The Hive Community!",
             content="""Hello everyone! 🐝
 
@@ -1496,12 +1663,8 @@ Alice""",
         
         # Add tags to topic1
         for tag_name in ["welcome", "community", "getting-started"]:
-            tag = session.exec(select(Tag).where(Tag.name == tag_name)).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                session.add(tag)
-                session.flush()
-            topic_tag = ForumTopicTag(topic_id=topic1.id, tag_id=tag.id)
+            tag_id = _tag_id_for(conn, tag_by_name, tag_name)
+            topic_tag = ForumTopicTag(topic_id=topic1.id, tag_id=tag_id)
             session.add(topic_tag)
         
         print(f"✅ Created forum topic: {topic1.title} (ID: {topic1.id})")
@@ -1509,7 +1672,7 @@ Alice""",
         # Discussion 2: Tips for new members
         topic2 = ForumTopic(
             topic_type=TopicType.DISCUSSION,
-            creator_id=users[1].id,  # Bob
+            creator_id=users[1]["id"],  # Bob
             title="Tips for a Successful Exchange",
             content="""Hi everyone!
 
@@ -1540,12 +1703,8 @@ What tips would you add?""",
         session.flush()
         
         for tag_name in ["tips", "community"]:
-            tag = session.exec(select(Tag).where(Tag.name == tag_name)).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                session.add(tag)
-                session.flush()
-            topic_tag = ForumTopicTag(topic_id=topic2.id, tag_id=tag.id)
+            tag_id = _tag_id_for(conn, tag_by_name, tag_name)
+            topic_tag = ForumTopicTag(topic_id=topic2.id, tag_id=tag_id)
             session.add(topic_tag)
         
         print(f"✅ Created forum topic: {topic2.title} (ID: {topic2.id})")
@@ -1553,7 +1712,7 @@ What tips would you add?""",
         # Discussion 3: Programming discussion
         topic3 = ForumTopic(
             topic_type=TopicType.DISCUSSION,
-            creator_id=users[0].id,  # Alice
+            creator_id=users[0]["id"],  # Alice
             title="Best Practices for Teaching Programming",
             content="""Fellow tutors! 👩‍💻
 
@@ -1575,12 +1734,8 @@ What teaching approaches have worked for you? Any tools or resources you recomme
         session.flush()
         
         for tag_name in ["programming", "tutoring", "education"]:
-            tag = session.exec(select(Tag).where(Tag.name == tag_name)).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                session.add(tag)
-                session.flush()
-            topic_tag = ForumTopicTag(topic_id=topic3.id, tag_id=tag.id)
+            tag_id = _tag_id_for(conn, tag_by_name, tag_name)
+            topic_tag = ForumTopicTag(topic_id=topic3.id, tag_id=tag_id)
             session.add(topic_tag)
         
         print(f"✅ Created forum topic: {topic3.title} (ID: {topic3.id})")
@@ -1588,7 +1743,7 @@ What teaching approaches have worked for you? Any tools or resources you recomme
         # Event 1: Community gardening day
         event1 = ForumTopic(
             topic_type=TopicType.EVENT,
-            creator_id=users[4].id,  # Emma
+            creator_id=users[4]["id"],  # Emma
             title="🌱 Community Garden Day - All Welcome!",
             content="""Join us for a fun day of gardening in our community space!
 
@@ -1606,8 +1761,8 @@ Please bring:
 - Enthusiasm! 🌻
 
 See you there!""",
-            event_start_time=datetime.utcnow() + timedelta(days=7),
-            event_end_time=datetime.utcnow() + timedelta(days=7, hours=4),
+            event_start_time=now + timedelta(days=7),
+            event_end_time=now + timedelta(days=7, hours=4),
             event_location="Community Garden, Kadıköy",
             is_approved=True,
             is_visible=True,
@@ -1618,12 +1773,8 @@ See you there!""",
         session.flush()
         
         for tag_name in ["gardening", "community", "event"]:
-            tag = session.exec(select(Tag).where(Tag.name == tag_name)).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                session.add(tag)
-                session.flush()
-            topic_tag = ForumTopicTag(topic_id=event1.id, tag_id=tag.id)
+            tag_id = _tag_id_for(conn, tag_by_name, tag_name)
+            topic_tag = ForumTopicTag(topic_id=event1.id, tag_id=tag_id)
             session.add(topic_tag)
         
         print(f"✅ Created forum event: {event1.title} (ID: {event1.id})")
@@ -1631,7 +1782,7 @@ See you there!""",
         # Event 2: Cooking workshop
         topic5 = ForumTopic(
             topic_type=TopicType.EVENT,
-            creator_id=users[2].id,  # Carol
+            creator_id=users[2]["id"],  # Carol
             title="🍳 Turkish Cooking Workshop",
             content="""Learn to make traditional Turkish dishes!
 
@@ -1652,8 +1803,8 @@ Requirements:
 - Please inform me of any allergies
 
 Afiyet olsun! 😋""",
-            event_start_time=datetime.utcnow() + timedelta(days=14),
-            event_end_time=datetime.utcnow() + timedelta(days=14, hours=3),
+            event_start_time=now + timedelta(days=14),
+            event_end_time=now + timedelta(days=14, hours=3),
             event_location="Carol's Kitchen, Beşiktaş",
             is_approved=True,
             is_visible=True,
@@ -1664,12 +1815,8 @@ Afiyet olsun! 😋""",
         session.flush()
         
         for tag_name in ["cooking", "workshop", "turkish-cuisine"]:
-            tag = session.exec(select(Tag).where(Tag.name == tag_name)).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                session.add(tag)
-                session.flush()
-            topic_tag = ForumTopicTag(topic_id=topic5.id, tag_id=tag.id)
+            tag_id = _tag_id_for(conn, tag_by_name, tag_name)
+            topic_tag = ForumTopicTag(topic_id=topic5.id, tag_id=tag_id)
             session.add(topic_tag)
         
         print(f"✅ Created forum event: {topic5.title} (ID: {topic5.id})")
@@ -1677,7 +1824,7 @@ Afiyet olsun! 😋""",
         # Event 3: Fitness meetup
         topic6 = ForumTopic(
             topic_type=TopicType.EVENT,
-            creator_id=users[5].id,  # Frank
+            creator_id=users[5]["id"],  # Frank
             title="🏃 Morning Run & Stretch Session",
             content="""Rise and shine! Join our weekly morning run.
 
@@ -1693,8 +1840,8 @@ We maintain a supportive pace - walk, jog, or run at your own speed.
 Meet at the Ortaköy Mosque steps. Look for me in the orange shirt!
 
 Rain or shine - we're doing this! ☀️🌧️""",
-            event_start_time=datetime.utcnow() + timedelta(days=3),
-            event_end_time=datetime.utcnow() + timedelta(days=3, hours=2),
+            event_start_time=now + timedelta(days=3),
+            event_end_time=now + timedelta(days=3, hours=2),
             event_location="Ortaköy, Istanbul",
             is_approved=True,
             is_visible=True,
@@ -1705,82 +1852,24 @@ Rain or shine - we're doing this! ☀️🌧️""",
         session.flush()
         
         for tag_name in ["fitness", "running", "yoga"]:
-            tag = session.exec(select(Tag).where(Tag.name == tag_name)).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                session.add(tag)
-                session.flush()
-            topic_tag = ForumTopicTag(topic_id=topic6.id, tag_id=tag.id)
+            tag_id = _tag_id_for(conn, tag_by_name, tag_name)
+            topic_tag = ForumTopicTag(topic_id=topic6.id, tag_id=tag_id)
             session.add(topic_tag)
         
         print(f"✅ Created forum event: {topic6.title} (ID: {topic6.id})")
         
         # Add some comments to topics
-        comment1 = ForumComment(
-            topic_id=topic1.id,
-            author_id=users[1].id,  # Bob
-            content="Welcome everyone! Excited to be part of this community. Looking forward to learning and sharing skills!",
-            is_approved=True,
-            is_visible=True,
-        )
-        session.add(comment1)
+        topics = [topic1, topic2, topic3, event1, topic5, topic6]
+        comment_rows = list(_iter_forum_comment_rows(topics, users))
+        _bulk_copy(conn, ForumComment, comment_rows)
         
-        comment2 = ForumComment(
-            topic_id=topic1.id,
-            author_id=users[2].id,  # Carol
-            content="This is such a great initiative! The time-banking concept really resonates with me.",
-            is_approved=True,
-            is_visible=True,
-        )
-        session.add(comment2)
-        
-        comment3 = ForumComment(
-            topic_id=topic1.id,
-            author_id=users[3].id,  # David
-            content="Happy to be here! 👋 If anyone needs help with home repairs or carpentry, check out my offers!",
-            is_approved=True,
-            is_visible=True,
-        )
-        session.add(comment3)
-        
-        comment4 = ForumComment(
-            topic_id=topic2.id,
-            author_id=users[4].id,  # Emma
-            content="Great tips! I'd add: take photos during the exchange (with permission) - they help with ratings and make nice memories!",
-            is_approved=True,
-            is_visible=True,
-        )
-        session.add(comment4)
-        
-        comment5 = ForumComment(
-            topic_id=event1.id,
-            author_id=users[6].id,  # Grace
-            content="I'll be there! Should I bring any specific tools?",
-            is_approved=True,
-            is_visible=True,
-        )
-        session.add(comment5)
-        
-        comment6 = ForumComment(
-            topic_id=event1.id,
-            author_id=users[4].id,  # Emma (reply)
-            content="@Grace No need! We have all the tools. Just bring yourself and some enthusiasm! 🌱",
-            is_approved=True,
-            is_visible=True,
-        )
-        session.add(comment6)
+        # Update comment_count for each topic based on actual comments
+        comments_per_topic = Counter(row["topic_id"] for row in comment_rows)
+        for topic in topics:
+            topic.comment_count = comments_per_topic[topic.id]
         
+        # Write the remaining ORM objects; engine.begin() commits on exit
         session.flush()
-        
-        # Update comment_count for each topic based on actual comments
-        topic1.comment_count = 3  # comment1, comment2, comment3
-        topic2.comment_count = 1  # comment4
-        topic3.comment_count = 0  # no comments
-        event1.comment_count = 2  # comment5, comment6
-        topic5.comment_count = 0  # no comments
-        topic6.comment_count = 0  # no comments
-        
-        session.commit()
         print(f"✅ Created 6 forum topics (3 discussions, 3 events) with 6 comments")
         
     print("\n✅ Comprehensive seed data created successfully")
@@ -1799,87 +1888,112 @@ def validate_schema():
     print("\nValidating schema and data...")
     
     with Session(engine) as session:
+        # One round-trip for every table count instead of loading each table
+        counts = session.execute(
+            select(
+                *(
+                    select(func.count()).select_from(model).where(*criteria).scalar_subquery().label(label)
+                    for label, model, *criteria in (
+                        ("users", User),
+                        ("offers", Offer),
+                        ("needs", Need),
+                        ("tags", Tag),
+                        ("offer_tags", OfferTag),
+                        ("need_tags", NeedTag),
+                        ("participants", Participant),
+                        ("completed_participants", Participant, Participant.status == ParticipantStatus.COMPLETED),
+                        ("ratings", Rating),
+                        ("ledger_entries", LedgerEntry),
+                        ("forum_topics", ForumTopic),
+                        ("forum_comments", ForumComment),
+                    )
+                )
+            )
+        ).one()._mapping
+
         # Check users
-        users = session.exec(select(User)).all()
-        if len(users) < 10:
-            raise ValueError(f"❌ Expected at least 10 users, found {len(users)}")
-        print(f"✅ Found {len(users)} users")
+        if counts["users"] < 10:
+            raise ValueError(f"❌ Expected at least 10 users, found {counts['users']}")
+        print(f"✅ Found {counts['users']} users")
         
         # Check offers
-        offers = session.exec(select(Offer)).all()
-        if len(offers) < 15:
-            raise ValueError(f"❌ Expected at least 15 offers, found {len(offers)}")
-        print(f"✅ Found {len(offers)} offers")
+        if counts["offers"] < 15:
+            raise ValueError(f"❌ Expected at least 15 offers, found {counts['offers']}")
+        print(f"✅ Found {counts['offers']} offers")
         
         # Check needs
-        needs = session.exec(select(Need)).all()
-        if len(needs) < 12:
-            raise ValueError(f"❌ Expected at least 12 needs, found {len(needs)}")
-        print(f"✅ Found {len(needs)} needs")
+        if counts["needs"] < 12:
+            raise ValueError(f"❌ Expected at least 12 needs, found {counts['needs']}")
+        print(f"✅ Found {counts['needs']} needs")
         
         # Check tags
-        tags = session.exec(select(Tag)).all()
-        if len(tags) < 15:
-            raise ValueError(f"❌ Expected at least 15 tags, found {len(tags)}")
-        print(f"✅ Found {len(tags)} tags")
+        if counts["tags"] < 15:
+            raise ValueError(f"❌ Expected at least 15 tags, found {counts['tags']}")
+        print(f"✅ Found {counts['tags']} tags")
         
         # Check offer-tag associations
-        offer_tags = session.exec(select(OfferTag)).all()
-        if len(offer_tags) == 0:
+        if counts["offer_tags"] == 0:
             raise ValueError("❌ No offer-tag associations found")
-        print(f"✅ Found {len(offer_tags)} offer-tag associations")
+        print(f"✅ Found {counts['offer_tags']} offer-tag associations")
         
         # Check need-tag associations
-        need_tags = session.exec(select(NeedTag)).all()
-        if len(need_tags) == 0:
+        if counts["need_tags"] == 0:
             raise ValueError("❌ No need-tag associations found")
-        print(f"✅ Found {len(need_tags)} need-tag associations")
+        print(f"✅ Found {counts['need_tags']} need-tag associations")
         
         # Check participants
-        participants = session.exec(select(Participant)).all()
-        if len(participants) < 23:
-            raise ValueError(f"❌ Expected at least 23 participants, found {len(participants)}")
-        print(f"✅ Found {len(participants)} participants/applications")
+        if counts["participants"] < 23:
+            raise ValueError(f"❌ Expected at least 23 participants, found {counts['participants']}")
+        print(f"✅ Found {counts['participants']} participants/applications")
         
         # Check completed participants
-        completed_participants = [p for p in participants if p.status == ParticipantStatus.COMPLETED]
-        if len(completed_participants) < 5:
-            raise ValueError(f"❌ Expected at least 5 completed participants, found {len(completed_participants)}")
-        print(f"✅ Found {len(completed_participants)} completed participants")
+        if counts["completed_participants"] < 5:
+            raise ValueError(
+                f"❌ Expected at least 5 completed participants, found {counts['completed_participants']}"
+            )
+        print(f"✅ Found {counts['completed_participants']} completed participants")
         
         # Check ratings
-        ratings = session.exec(select(Rating)).all()
-        if len(ratings) < 10:
-            raise ValueError(f"❌ Expected at least 10 ratings, found {len(ratings)}")
-        print(f"✅ Found {len(ratings)} ratings")
+        if counts["ratings"] < 10:
+            raise ValueError(f"❌ Expected at least 10 ratings, found {counts['ratings']}")
+        print(f"✅ Found {counts['ratings']} ratings")
         
         # Check ledger entries (10 initial + 10 from 5 completed exchanges)
-        ledger_entries = session.exec(select(LedgerEntry)).all()
-        if len(ledger_entries) < 20:
-            raise ValueError(f"❌ Expected at least 20 ledger entries, found {len(ledger_entries)}")
-        print(f"✅ Found {len(ledger_entries)} ledger entries")
+        if counts["ledger_entries"] < 20:
+            raise ValueError(f"❌ Expected at least 20 ledger entries, found {counts['ledger_entries']}")
+        print(f"✅ Found {counts['ledger_entries']} ledger entries")
         
         # Check forum topics
-        forum_topics = session.exec(select(ForumTopic)).all()
-        if len(forum_topics) < 6:
-            raise ValueError(f"❌ Expected at least 6 forum topics, found {len(forum_topics)}")
-        print(f"✅ Found {len(forum_topics)} forum topics")
+        if counts["forum_topics"] < 6:
+            raise ValueError(f"❌ Expected at least 6 forum topics, found {counts['forum_topics']}")
+        print(f"✅ Found {counts['forum_topics']} forum topics")
         
         # Check forum comments
-        forum_comments = session.exec(select(ForumComment)).all()
-        if len(forum_comments) < 6:
-            raise ValueError(f"❌ Expected at least 6 forum comments, found {len(forum_comments)}")
-        print(f"✅ Found {len(forum_comments)} forum comments")
+        if counts["forum_comments"] < 6:
+            raise ValueError(f"❌ Expected at least 6 forum comments, found {counts['forum_comments']}")
+        print(f"✅ Found {counts['forum_comments']} forum comments")
         
         # Validate FK constraints by checking a few relationships
-        alice = session.exec(select(User).where(User.username == "alice")).first()
-        if not alice:
+        alice_id = session.exec(select(User.id).where(User.username == "alice")).first()
+        if alice_id is None:
             raise ValueError("❌ User 'alice' not found")
         
-        alice_offers = session.exec(select(Offer).where(Offer.creator_id == alice.id)).all()
-        if len(alice_offers) == 0:
+        alice_offer_id = session.exec(select(Offer.id).where(Offer.creator_id == alice_id).limit(1)).first()
+        if alice_offer_id is None:
             raise ValueError("❌ No offers found for alice - FK constraint may be broken")
-        
+
+        # Comments whose author or topic is missing, found in one outer-join query.
+        # Streamed in batches so a large production table is never loaded at once.
+        orphan_comment_ids = session.execute(
+            select(ForumComment.id)
+            .outerjoin(User, User.id == ForumComment.author_id)
+            .outerjoin(ForumTopic, ForumTopic.id == ForumComment.topic_id)
+            .where(User.id.is_(None) | ForumTopic.id.is_(None))
+        ).scalars().yield_per(500)
+        first_orphans = list(islice(orphan_comment_ids, 10))
+        if first_orphans:
+            raise ValueError(f"❌ Forum comments with a missing author or topic (first 10): {first_orphans}")
+
     print("✅ Schema validation passed - all FK constraints and data integrity checks valid")
 
 
@@ -1889,8 +2003,9 @@ def main():
     print("The Hive - Database Initialization")
     print("=" * 60)
     
-    # Check for --reset flag
+    # Check for --reset and --verbose flags
     reset_db = "--reset" in sys.argv or "--drop" in sys.argv
+    verbose = "--verbose" in sys.argv or "-v" in sys.argv
     
     # Check database connection
     print("\nChecking database connection...")
@@ -1900,15 +2015,16 @@ def main():
     print("✅ Database connection successful")
     
     # Drop tables if reset flag is present
+    fresh = False
     if reset_db:
         print("\n⚠️  RESET FLAG DETECTED - Dropping all tables...")
-        drop_tables()
+        fresh = drop_tables()
     
-    # Create tables
-    create_tables()
+    # Create tables (no existence checks needed after a clean drop)
+    create_tables(fresh=fresh)
     
     # Seed basic data
-    seed_basic_data()
+    seed_basic_data(verbose=verbose)
     
     # Validate schema
     validate_schema()
@@ -1920,6 +2036,7 @@ def main():
     print("  uv run uvicorn app.main:app --reload")
     print("\nTo reset and reseed the database, run:")
     print("  python scripts/init_db.py --reset")
+    print("\nAdd --verbose to list every seeded user, tag, offer and need.")
 
 
 if __name__ == "__main__":
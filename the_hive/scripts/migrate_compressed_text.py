@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""One-time migration for compressed text columns.
+
+Older databases stored ``users.description``, ``users.suspension_reason`` and
+``users.ban_reason`` as VARCHAR. They are now BYTEA columns written by
+``CompressedText``, where the first byte marks how the value is encoded.
+This script converts each column in place and marks every existing value as
+stored uncompressed; values are compressed the next time they are saved.
+
+It is safe to run more than once. PostgreSQL only.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import LargeBinary, inspect, text
+
+from app.core.db import engine
+
+COMPRESSED_COLUMNS = ("description", "suspension_reason", "ban_reason")
+
+
+def migrate_compressed_text():
+    """Convert legacy VARCHAR user text columns to marked BYTEA values."""
+    columns = {c["name"]: c for c in inspect(engine).get_columns("users")}
+    pending = [
+        name for name in COMPRESSED_COLUMNS
+        if name in columns and not isinstance(columns[name]["type"], LargeBinary)
+    ]
+    if not pending:
+        print("✅ Compressed text columns are already BYTEA, nothing to migrate")
+        return
+
+    with engine.begin() as conn:
+        for name in pending:
+            # '\x00' is CompressedText's marker for a raw (uncompressed) value
+            conn.execute(text(
+                f"ALTER TABLE users ALTER COLUMN {name} TYPE BYTEA "
+                f"USING '\\x00'::bytea || convert_to({name}, 'UTF8')"
+            ))
+            print(f"🔄 Converted users.{name} to BYTEA")
+
+    print(f"✅ Converted {len(pending)} column(s)")
+
+
+if __name__ == "__main__":
+    print("🚀 Migrating compressed text columns...\n")
+    migrate_compressed_text()
+    print("\n🎉 Done!")
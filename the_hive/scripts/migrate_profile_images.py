@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""One-time migration for profile images.
+
+Older databases stored avatars inline in ``users.profile_image``: either a
+preset avatar name or a full base64 data URL. This script:
+1. Adds the ``users.profile_image_ref`` column if it is missing
+2. Copies preset avatar names into ``profile_image_ref``
+3. Decodes custom data URLs into raw bytes in ``user_profile_images``
+
+It is safe to run more than once.
+"""
+import base64
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import inspect, text
+from sqlmodel import Session, SQLModel
+
+from app.core.db import engine
+from app.models.user import UserProfileImage
+
+
+def migrate_profile_images():
+    """Move legacy inline profile images to their new storage."""
+    columns = {c["name"] for c in inspect(engine).get_columns("users")}
+    if "profile_image" not in columns:
+        print("✅ No legacy profile_image column found, nothing to migrate")
+        return
+
+    # Make sure the new table and column exist
+    SQLModel.metadata.create_all(engine, tables=[UserProfileImage.__table__])
+    if "profile_image_ref" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE users ADD COLUMN profile_image_ref VARCHAR(255)"))
+        print("➕ Added users.profile_image_ref column")
+
+    presets = 0
+    customs = 0
+    with Session(engine) as session:
+        rows = session.execute(
+            text("SELECT id, profile_image FROM users WHERE profile_image IS NOT NULL")
+        ).all()
+
+        for user_id, value in rows:
+            if not value.startswith("data:"):
+                session.execute(
+                    text("UPDATE users SET profile_image_ref = :ref WHERE id = :id"),
+                    {"ref": value, "id": user_id},
+                )
+                presets += 1
+                continue
+
+            # "data:<mime>;base64,<payload>" -> raw bytes + mime type
+            header, _, encoded = value.partition(",")
+            mime_type = header[len("data:"):].split(";", 1)[0]
+            image = session.get(UserProfileImage, user_id)
+            if image is None:
+                image = UserProfileImage(user_id=user_id, data=b"", mime_type=mime_type)
+            image.data = base64.b64decode(encoded)
+            image.mime_type = mime_type
+            session.add(image)
+            customs += 1
+
+        session.execute(text("UPDATE users SET profile_image = NULL"))
+        session.commit()
+
+    print(f"✅ Migrated {presets} preset avatars and {customs} custom images")
+
+
+if __name__ == "__main__":
+    print("🚀 Migrating profile images...\n")
+    migrate_profile_images()
+    print("\n🎉 Done!")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""One-time migration for the generated rating average.
+
+Older databases stored ``ratings.general_rating`` as a plain FLOAT NOT NULL
+written by the application. It is now a SMALLINT generated by the database
+from the three category ratings, and SQLAlchemy leaves it out of every INSERT,
+so those older columns reject new ratings. This script drops the column and
+re-adds it as ``GENERATED ALWAYS AS (...) STORED``, which also recomputes the
+value for every existing rating.
+
+It is safe to run more than once. PostgreSQL only.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import inspect, text
+
+from app.core.db import engine
+from app.models.rating import Rating
+
+
+def migrate_rating_general():
+    """Recreate ratings.general_rating as a stored generated column."""
+    columns = {c["name"]: c for c in inspect(engine).get_columns("ratings")}
+    if columns.get("general_rating", {}).get("computed"):
+        print("✅ ratings.general_rating is already generated, nothing to migrate")
+        return
+
+    # Same expression as the model, so fresh and migrated databases agree
+    expression = Rating.__table__.c.general_rating.computed.sqltext
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE ratings DROP COLUMN IF EXISTS general_rating"))
+        conn.execute(text(
+            f"ALTER TABLE ratings ADD COLUMN general_rating SMALLINT "
+            f"GENERATED ALWAYS AS ({expression}) STORED NOT NULL"
+        ))
+
+    print("✅ Recreated ratings.general_rating as a generated column")
+
+
+if __name__ == "__main__":
+    print("🚀 Migrating rating averages...\n")
+    migrate_rating_general()
+    print("\n🎉 Done!")
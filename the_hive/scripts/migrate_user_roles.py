@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""One-time migration for user roles.
+
+Older databases stored ``users.role`` as the ``userrole`` enum (member names
+such as 'ADMIN'). Roles are now stored as SMALLINT codes. This script:
+1. Converts the column in place using the codes from app.models.user
+2. Drops the unused ``userrole`` enum type
+3. Drops the legacy ``ix_users_role`` index, which ``ix_users_role_active``
+   (role, is_active) now covers
+
+It is safe to run more than once.
+
+PostgreSQL only: it relies on ``ALTER COLUMN ... TYPE ... USING`` and on the
+``userrole`` enum type, neither of which exists on SQLite. SQLite databases
+(tests, local development) are created fresh with the SMALLINT column.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import Integer, inspect, text
+
+from app.core.db import engine
+from app.models.user import ROLE_CODES
+
+
+def migrate_user_roles():
+    """Convert users.role from enum names to SMALLINT codes."""
+    inspector = inspect(engine)
+    columns = {c["name"]: c for c in inspector.get_columns("users")}
+    convert_role = not isinstance(columns["role"]["type"], Integer)
+    drop_index = "ix_users_role" in {i["name"] for i in inspector.get_indexes("users")}
+    if not convert_role and not drop_index:
+        print("✅ users.role is already a SMALLINT, nothing to migrate")
+        return
+
+    with engine.begin() as conn:
+        if convert_role:
+            cases = " ".join(
+                f"WHEN '{role.name}' THEN {code}" for role, code in ROLE_CODES.items()
+            )
+            conn.execute(text(
+                f"ALTER TABLE users ALTER COLUMN role TYPE SMALLINT "
+                f"USING CASE role::text {cases} END"
+            ))
+            conn.execute(text("DROP TYPE IF EXISTS userrole"))
+            print("🔄 Converted users.role to SMALLINT codes")
+        if drop_index:
+            conn.execute(text("DROP INDEX IF EXISTS ix_users_role"))
+            print("🔄 Dropped the redundant ix_users_role index")
+
+    print("✅ User roles migrated")
+
+
+if __name__ == "__main__":
+    print("🚀 Migrating user roles...\n")
+    migrate_user_roles()
+    print("\n🎉 Done!")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""One-time migration for user timestamp defaults.
+
+Older databases have ``users.created_at`` and ``users.updated_at`` without a
+database default, because the application used to fill them in. They are now
+stamped by the database (``server_default``), so inserts leave them out and
+those older columns reject new users. This script adds the UTC default to both
+columns; existing values are left as they are.
+
+It is safe to run more than once. PostgreSQL only.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import inspect, text
+
+from app.core.db import engine
+from app.models.types import utcnow
+
+TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+
+def migrate_user_timestamps():
+    """Give users.created_at and users.updated_at a database default."""
+    columns = {c["name"]: c for c in inspect(engine).get_columns("users")}
+    pending = [name for name in TIMESTAMP_COLUMNS if columns[name]["default"] is None]
+    if not pending:
+        print("✅ User timestamp columns already have a default, nothing to migrate")
+        return
+
+    # Same expression the model's server_default renders
+    default = utcnow().compile(dialect=engine.dialect)
+    with engine.begin() as conn:
+        for name in pending:
+            conn.execute(text(f"ALTER TABLE users ALTER COLUMN {name} SET DEFAULT {default}"))
+            print(f"🔄 Added a default to users.{name}")
+
+    print(f"✅ Updated {len(pending)} column(s)")
+
+
+if __name__ == "__main__":
+    print("🚀 Migrating user timestamp defaults...\n")
+    migrate_user_timestamps()
+    print("\n🎉 Done!")
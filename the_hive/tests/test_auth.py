@@ -3,6 +3,8 @@ Tests for authentication endpoints.
 
 Validates SRS FR-1: User Registration and Authentication
 """
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
@@ -119,6 +121,31 @@ def test_register_duplicate_email(client: TestClient, session: Session):
     assert "Email already registered" in response.json()["detail"]
 
 
+def test_register_duplicate_email_different_case(client: TestClient, session: Session):
+    """Test that emails are unique regardless of letter case."""
+    user = User(
+        email="test@example.com",
+        username="firstuser",
+        password_hash=get_password_hash("password123"),
+        role="user",
+        balance=5.0
+    )
+    session.add(user)
+    session.commit()
+    
+    response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "TEST@example.com",
+            "username": "seconduser",
+            "password": "SecurePass123!"
+        }
+    )
+    
+    assert response.status_code == 400
+    assert "Email already registered" in response.json()["detail"]
+
+
 def test_register_invalid_email(client: TestClient):
     """Test registration with invalid email format (SRS FR-1.2)."""
     response = client.post(
@@ -453,6 +480,37 @@ def test_update_profile_tags_limit(client: TestClient, session: Session):
     assert len(data["tags"]) == 10
 
 
+def test_update_profile_tags_only_bumps_updated_at(client: TestClient, session: Session):
+    """Test that a tags-only profile edit still stamps users.updated_at."""
+    stale = datetime(2020, 1, 1)
+    user = User(
+        email="tagstamp@example.com",
+        username="tagstampuser",
+        password_hash=get_password_hash("password123"),
+        balance=5.0,
+        updated_at=stale,
+    )
+    session.add(user)
+    session.commit()
+    
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "tagstampuser", "password": "password123"}
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    response = client.put(
+        "/api/v1/users/me",
+        headers=headers,
+        json={"tags": ["python"]}
+    )
+    
+    assert response.status_code == 200
+    session.refresh(user)
+    assert user.updated_at > stale
+
+
 def test_update_profile_invalid_preset_avatar(client: TestClient, session: Session):
     """Test that invalid preset avatar names are rejected."""
     # Create a user
@@ -529,3 +587,240 @@ def test_profile_includes_tags(client: TestClient, session: Session):
     data = response.json()
     assert "tags" in data
     assert set(data["tags"]) == {"python", "cooking"}
+
+
+def test_update_profile_replaces_tags(session: Session):
+    """Test that assigning tag names replaces the user's tag rows."""
+    from sqlmodel import select
+    from app.models.user import UserTag
+    
+    user = User(
+        email="retag@example.com",
+        username="retaguser",
+        password_hash=get_password_hash("password123"),
+        balance=5.0
+    )
+    user.tag_names.extend(["python", "cooking"])
+    session.add(user)
+    session.commit()
+    
+    user.tag_names[:] = ["gardening"]
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    
+    assert list(user.tag_names) == ["gardening"]
+    rows = session.exec(select(UserTag).where(UserTag.user_id == user.id)).all()
+    assert [row.tag_name for row in rows] == ["gardening"]
+
+
+def test_upload_custom_avatar_stored_separately(client: TestClient, session: Session):
+    """Test that custom avatars are kept out of the users row."""
+    from app.models.user import UserProfileImage
+    
+    user = User(
+        email="custom@example.com",
+        username="customavatar",
+        password_hash=get_password_hash("password123"),
+        balance=5.0
+    )
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "customavatar", "password": "password123"}
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    response = client.post(
+        "/api/v1/users/me/avatar",
+        headers=headers,
+        files={"file": ("avatar.png", b"\x89PNG\r\n\x1a\nfake", "image/png")},
+    )
+    assert response.status_code == 200
+    data_url = response.json()["profile_image"]
+    assert data_url.startswith("data:image/png;base64,")
+    
+    session.refresh(user)
+    assert user.profile_image_ref is None
+    image = session.get(UserProfileImage, user.id)
+    assert image.data == b"\x89PNG\r\n\x1a\nfake"  # Raw bytes, not base64
+    assert image.mime_type == "image/png"
+    assert image.data_url == data_url
+    
+    response = client.get(f"/api/v1/users/{user.id}")
+    assert response.json()["profile_image"] == data_url
+    assert response.json()["profile_image_type"] == "custom"
+    
+    # Removing the avatar drops the image row
+    response = client.delete("/api/v1/users/me/avatar", headers=headers)
+    assert response.status_code == 200
+    assert session.get(UserProfileImage, user.id) is None
+
+
+def test_user_lookups_are_cached_per_session(session: Session):
+    """Test that request-scoped user lookups reuse the resolved user."""
+    from app.core.users import get_user_by_email, get_user_by_id, get_user_by_username
+    
+    user = User(
+        email="cached@example.com",
+        username="cacheduser",
+        password_hash=get_password_hash("password123"),
+        balance=5.0
+    )
+    session.add(user)
+    session.commit()
+    
+    found = get_user_by_username(session, "cacheduser")
+    assert found is user
+    assert get_user_by_id(session, user.id) is found
+    assert get_user_by_email(session, "cached@example.com") is found
+    assert get_user_by_username(session, "missing") is None
+    
+    # Users dropped from the session are not served from the cache
+    session.expunge(user)
+    refetched = get_user_by_id(session, user.id)
+    assert refetched is not user
+    assert refetched.username == "cacheduser"
+
+
+def test_username_cache_invalidated_on_update(session: Session):
+    """Test that cached usernames are dropped when the user row changes."""
+    from app.core.users import get_username
+    
+    user = User(
+        email="renamed@example.com",
+        username="oldname",
+        password_hash=get_password_hash("password123"),
+        balance=5.0
+    )
+    session.add(user)
+    session.commit()
+    
+    assert get_username(session, user.id) == "oldname"
+    
+    user.username = "newname"
+    session.add(user)
+    session.commit()
+    
+    assert get_username(session, user.id) == "newname"
+    assert get_username(session, 999999) is None
+
+
+def test_prefetch_users_uses_single_query(session: Session):
+    """Test that prefetched users are served without further queries."""
+    from sqlalchemy import event
+    from app.core.users import get_user_by_id, prefetch_users
+    
+    ids = []
+    for i in range(3):
+        user = User(
+            email=f"bulk{i}@example.com",
+            username=f"bulkuser{i}",
+            password_hash=get_password_hash("password123"),
+            balance=5.0
+        )
+        session.add(user)
+        session.commit()
+        ids.append(user.id)
+    session.expunge_all()
+    session.info.clear()
+    
+    statements = []
+    engine = session.get_bind()
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        prefetch_users(session, ids + [None])
+        usernames = [get_user_by_id(session, user_id).username for user_id in ids]
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    
+    assert usernames == ["bulkuser0", "bulkuser1", "bulkuser2"]
+    assert len(statements) == 1
+
+
+def test_update_profile_accepts_image_data_url(client: TestClient, session: Session):
+    """Test that profile updates accept data URLs longer than a preset name."""
+    import base64
+    
+    user = User(
+        email="dataurl@example.com",
+        username="dataurluser",
+        password_hash=get_password_hash("password123"),
+        balance=5.0
+    )
+    session.add(user)
+    session.commit()
+    
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "dataurluser", "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    data_url = "data:image/png;base64," + base64.b64encode(b"\x89PNG" + b"\x00" * 2000).decode()
+    response = client.put(
+        "/api/v1/users/me",
+        headers=headers,
+        json={"profile_image": data_url, "profile_image_type": "custom"}
+    )
+    assert response.status_code == 200
+    assert response.json()["profile_image"] == data_url
+    
+    # The stored kind follows the value, whatever profile_image_type says
+    response = client.put(
+        "/api/v1/users/me",
+        headers=headers,
+        json={"profile_image": "bee", "profile_image_type": "custom"}
+    )
+    assert response.status_code == 200
+    assert (response.json()["profile_image"], response.json()["profile_image_type"]) == ("bee", "preset")
+    
+    response = client.put("/api/v1/users/me", headers=headers, json={"profile_image": data_url})
+    assert response.status_code == 200
+    assert (response.json()["profile_image"], response.json()["profile_image_type"]) == (data_url, "custom")
+    
+    response = client.put(
+        "/api/v1/users/me",
+        headers=headers,
+        json={"profile_image": "data:text/html;base64,PGI+", "profile_image_type": "custom"}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("data_url", [
+    "data:image/png;base64,abc",
+    "data:image/png;base64,not base64!",
+    "data:image/png,iVBORw0K",
+    "data:image/svg+xml;base64,PHN2Zz4=",
+    "data:image/" + "x" * 60 + ";base64,iVBORw0K",
+])
+def test_update_profile_image_rejects_malformed_data_url(
+    client: TestClient, session: Session, data_url: str
+):
+    """Test that malformed or disallowed image data URLs return 422, not 500."""
+    user = User(
+        email="baddataurl@example.com",
+        username="baddataurluser",
+        password_hash=get_password_hash("password123"),
+        balance=5.0
+    )
+    session.add(user)
+    session.commit()
+    
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "baddataurluser", "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    response = client.put(
+        "/api/v1/users/me",
+        headers=headers,
+        json={"profile_image": data_url, "profile_image_type": "custom"}
+    )
+    assert response.status_code == 422
@@ -651,6 +651,37 @@ def test_create_comment(
     assert data["topic_id"] == topic_id
 
 
+def test_comment_content_is_stripped(
+    client: TestClient, session: Session, user: User, auth_headers: dict
+):
+    """Test that comment content is stripped and blank comments are rejected."""
+    topic_response = client.post(
+        "/api/v1/forum/topics",
+        json={
+            "topic_type": "discussion",
+            "title": "Test Topic",
+            "content": "Test content"
+        },
+        headers=auth_headers
+    )
+    topic_id = topic_response.json()["id"]
+    
+    response = client.post(
+        f"/api/v1/forum/topics/{topic_id}/comments",
+        json={"content": "   Nice one!  "},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    assert response.json()["content"] == "Nice one!"
+    
+    response = client.post(
+        f"/api/v1/forum/topics/{topic_id}/comments",
+        json={"content": "    "},
+        headers=auth_headers
+    )
+    assert response.status_code == 422
+
+
 def test_list_comments(
     client: TestClient, session: Session, user: User, auth_headers: dict
 ):
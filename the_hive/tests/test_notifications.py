@@ -16,6 +16,7 @@ from app.models.offer import Offer, OfferStatus
 from app.models.need import Need, NeedStatus
 from app.models.participant import Participant, ParticipantStatus, ParticipantRole
 from app.models.notification import Notification, NotificationType
+from app.schemas.notification import NotificationResponse
 from app.core.notifications import (
     notify_application_received,
     notify_application_accepted,
@@ -148,6 +149,25 @@ def test_create_notification_helper(session: Session, test_users):
     assert notification.read_at is None
 
 
+def test_notification_response_from_model(session: Session, test_users):
+    """Test that notification rows convert directly to the response schema."""
+    notification = Notification(
+        user_id=test_users[0].id,
+        type=NotificationType.APPLICATION_RECEIVED,
+        title="Test Notification",
+        message="Test message",
+    )
+    session.add(notification)
+    session.commit()
+    session.refresh(notification)
+    
+    response = NotificationResponse.model_validate(notification)
+    
+    assert response.id == notification.id
+    assert response.type == NotificationType.APPLICATION_RECEIVED.value
+    assert response.model_dump(mode="json")["type"] == NotificationType.APPLICATION_RECEIVED.value
+
+
 def test_list_notifications_with_data(client: TestClient, session: Session, test_users, auth_headers):
     """Test listing notifications with data."""
     alice = test_users[0]
@@ -170,6 +190,10 @@ def test_list_notifications_with_data(client: TestClient, session: Session, test
     assert data["total"] == 3
     assert data["unread_count"] == 3
     assert len(data["notifications"]) == 3
+    
+    # Items match the documented response schema
+    for item in data["notifications"]:
+        assert NotificationResponse.model_validate(item).model_dump(mode="json") == item
 
 
 def test_mark_notification_as_read(client: TestClient, session: Session, test_users, auth_headers):
@@ -20,6 +20,7 @@ from app.models.user import User, UserRole
 from app.models.offer import Offer, OfferStatus
 from app.models.need import Need, NeedStatus
 from app.core.security import get_password_hash
+from app.schemas.participant import ParticipantListResponse
 
 
 @pytest.fixture(name="session")
@@ -555,6 +556,9 @@ def test_list_offer_participants(
     data = response.json()
     assert data["total"] == 2
     assert len(data["items"]) == 2
+    
+    # The body matches the documented response model
+    assert ParticipantListResponse.model_validate(data).model_dump(mode="json") == data
 
 
 def test_need_acceptance_flow(
@@ -509,7 +509,6 @@ class TestGetRatings:
             from_user_id=requester_user.id,
             to_user_id=provider_user.id,
             participant_id=participant.id,
-            general_rating=5,
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=4,
@@ -546,7 +545,6 @@ class TestGetRatings:
             from_user_id=requester_user.id,
             to_user_id=provider_user.id,
             participant_id=participant.id,
-            general_rating=5,
             reliability_rating=5,
             kindness_rating=5,
             helpfulness_rating=5,
@@ -556,7 +554,6 @@ class TestGetRatings:
             from_user_id=provider_user.id,
             to_user_id=requester_user.id,
             participant_id=participant.id,
-            general_rating=4,
             reliability_rating=4,
             kindness_rating=4,
             helpfulness_rating=4,
@@ -593,7 +590,6 @@ class TestGetRatings:
             from_user_id=requester_user.id,
             to_user_id=provider_user.id,
             participant_id=participant.id,
-            general_rating=1,  # Low rating
             reliability_rating=1,
             kindness_rating=1,
             helpfulness_rating=1,
@@ -612,6 +608,51 @@ class TestGetRatings:
         # Hidden rating should not be returned
         assert data["total"] == 0
 
+    def test_user_rating_summary(
+        self,
+        client: TestClient,
+        session: Session,
+        provider_headers: dict,
+        provider_user: User,
+        requester_user: User,
+        completed_offer_participant: tuple[Offer, Participant],
+    ):
+        """Test that the summary aggregates visible ratings only."""
+        _, participant = completed_offer_participant
+
+        session.add(Rating(
+            from_user_id=requester_user.id,
+            to_user_id=provider_user.id,
+            participant_id=participant.id,
+            reliability_rating=5,
+            kindness_rating=5,
+            helpfulness_rating=4,
+            visibility=RatingVisibility.VISIBLE,
+        ))
+        session.add(Rating(
+            from_user_id=provider_user.id,
+            to_user_id=provider_user.id,
+            participant_id=participant.id,
+            reliability_rating=1,
+            kindness_rating=1,
+            helpfulness_rating=1,
+            visibility=RatingVisibility.HIDDEN,
+        ))
+        session.commit()
+
+        response = client.get(
+            f"/api/v1/ratings/summary/{provider_user.id}",
+            headers=provider_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_ratings"] == 1
+        assert data["average_general"] == 5
+        assert data["average_helpfulness"] == 4
+        assert data["overall_average"] == 4.75
+        assert data["rating_distribution"] == [0, 0, 0, 0, 1]
+
 
 # --- Rating Labels Tests ---
 class TestRatingLabels:
@@ -630,6 +671,24 @@ class TestRatingLabels:
         assert "reliability" in data["categories"]
         assert "kindness" in data["categories"]
         assert "helpfulness" in data["categories"]
+        assert data["categories"]["reliability"]["required"] is True
+
+    def test_rating_tables_are_read_only(self):
+        """Test that the shared label and category tables cannot be mutated."""
+        from app.schemas.rating import CATEGORY_INFO, RATING_LABELS
+
+        with pytest.raises(TypeError):
+            RATING_LABELS[5] = "Changed"
+        with pytest.raises(TypeError):
+            CATEGORY_INFO["reliability"]["required"] = False
+
+    def test_get_rating_explanation(self, client: TestClient):
+        """Test getting the blind rating explanation."""
+        response = client.get("/api/v1/ratings/explanation")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["title"] == "How Ratings Work"
 
 
 # --- Authorization Tests ---
@@ -282,3 +282,24 @@ def test_inactive_user_denied(client: TestClient, session: Session):
     
     assert response.status_code == 400
     assert "Inactive user" in response.json()["detail"]
+
+
+def test_role_checks_work_in_queries(session: Session):
+    """Test that is_moderator/is_admin can be used as SQL filters."""
+    from sqlmodel import select
+    
+    for username, role in [("plain", "user"), ("mod", "moderator"), ("boss", "admin")]:
+        session.add(User(
+            email=f"{username}@example.com",
+            username=username,
+            password_hash=get_password_hash("password123"),
+            role=role,
+            balance=5.0
+        ))
+    session.commit()
+    
+    moderators = session.exec(select(User.username).where(User.is_moderator)).all()
+    admins = session.exec(select(User.username).where(User.is_admin)).all()
+    
+    assert sorted(moderators) == ["boss", "mod"]
+    assert admins == ["boss"]
@@ -81,6 +81,19 @@ def test_search_empty_database(client: TestClient):
     assert data["items"] == []
 
 
+@pytest.mark.parametrize("params", [
+    "type=offers",
+    "sort_by=popularity",
+    "limit=0",
+    "skip=-1",
+    "unknown_filter=1",
+])
+def test_search_rejects_invalid_filters(client: TestClient, params: str):
+    """Test that invalid or unknown search filters return 422."""
+    response = client.get(f"/api/v1/search/?{params}")
+    assert response.status_code == 422
+
+
 def test_search_text_query(client: TestClient, auth_headers: dict):
     """Test text search in title and description."""
     # Create offers with different titles
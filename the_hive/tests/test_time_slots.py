@@ -119,7 +119,23 @@ def test_create_offer_without_time_slots(client: TestClient, auth_headers: dict)
     
     data = response.json()
     assert data["title"] == offer_data["title"]
-    assert data["available_slots"] is None
+    # An explicit null is still accepted and is returned as an empty list
+    assert data["available_slots"] == []
+
+
+def test_create_need_omitting_time_slots(client: TestClient, auth_headers: dict):
+    """Test that a need created without the field returns an empty slot list."""
+    need_data = {
+        "title": "Need Essay Feedback",
+        "description": "Looking for feedback on an essay draft",
+        "is_remote": True,
+        "capacity": 1,
+        "tags": ["Writing"],
+    }
+    
+    response = client.post("/api/v1/needs/", json=need_data, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["available_slots"] == []
 
 
 def test_update_offer_time_slots(client: TestClient, auth_headers: dict):
@@ -255,3 +271,61 @@ def test_invalid_date_format(client: TestClient, auth_headers: dict):
     
     response = client.post("/api/v1/offers/", json=offer_data, headers=auth_headers)
     assert response.status_code == 422  # Validation error
+
+
+def test_invalid_calendar_date(client: TestClient, auth_headers: dict):
+    """Test that dates matching YYYY-MM-DD must still exist."""
+    offer_data = {
+        "title": "Invalid Calendar Date",
+        "description": "This should fail",
+        "is_remote": True,
+        "capacity": 1,
+        "tags": ["Test"],
+        "available_slots": [
+            {
+                "date": "2025-02-30",  # February has no 30th
+                "time_ranges": [
+                    {"start_time": "14:00", "end_time": "15:00"}
+                ]
+            }
+        ]
+    }
+    
+    response = client.post("/api/v1/offers/", json=offer_data, headers=auth_headers)
+    assert response.status_code == 422
+    assert "day is out of range" in str(response.json()["detail"])
+
+
+@pytest.mark.parametrize("time_ranges, expected_status", [
+    # Unsorted but disjoint ranges are accepted
+    ([("16:00", "17:00"), ("09:00", "10:00"), ("10:00", "11:00")], 201),
+    # The overlapping pair is not adjacent in the request
+    ([("13:00", "15:00"), ("09:00", "10:00"), ("14:00", "16:00")], 422),
+    # A long range containing a later one
+    ([("09:00", "17:00"), ("12:00", "13:00")], 422),
+    # Single-digit hours are ordered by time, not as strings
+    ([("9:00", "10:00"), ("10:00", "11:30")], 201),
+    ([("9:30", "10:30"), ("10:00", "11:00")], 422),
+])
+def test_overlapping_time_ranges(
+    client: TestClient, auth_headers: dict, time_ranges: list, expected_status: int
+):
+    """Test that time ranges on the same date must not overlap."""
+    offer_data = {
+        "title": "Overlap Check",
+        "description": "Checking time range overlap validation",
+        "is_remote": True,
+        "capacity": 1,
+        "tags": ["Test"],
+        "available_slots": [
+            {
+                "date": "2025-12-01",
+                "time_ranges": [
+                    {"start_time": start, "end_time": end} for start, end in time_ranges
+                ]
+            }
+        ]
+    }
+    
+    response = client.post("/api/v1/offers/", json=offer_data, headers=auth_headers)
+    assert response.status_code == expected_status